@@ -1,4 +1,5 @@
 /* Collocation Generator (scene-based) — keeps collocations consistent with lesson scenario
+ * Requires js/scene-rules.js (generated by scripts/emit_scene_rules.py) to be loaded first.
  * Usage (runtime fallback):
  *   const cols = window.CollocationGenerator?.generateForLesson(lesson) || []
  *   // returns [{id,en,fa}, ...]
@@ -27,44 +28,57 @@
 
   function norm(s){ return String(s||'').toLowerCase(); }
 
-  function classifyScene(lesson){
-    const a = lesson && lesson.analysis ? lesson.analysis : {};
-    const txt = [
-      toText(lesson?.place), toText(lesson?.fullDescription), a?.setting, a?.settingFa, a?.mood, a?.moodFa,
-      ...(Array.isArray(a?.objects) ? a.objects : []),
-      ...(Array.isArray(a?.themes) ? a.themes : []),
-    ].filter(Boolean).join(' | ');
-    const t = norm(txt);
+  // Rules are generated from scripts/pipeline/scenes.py into js/scene-rules.js
+  // (load it before this file); Python and JS share the same compiled pattern.
+  let sceneMatcher = null;
+  function getSceneMatcher(){
+    if (sceneMatcher) return sceneMatcher;
+    const R = window.SceneRules;
+    if (!R || !R.pattern) return null;
+    sceneMatcher = { re: new RegExp('(?=(' + R.pattern + '))', 'g'), rules: R };
+    return sceneMatcher;
+  }
 
-    // Urban — more specific first
-    if (/(subway|metro|underground|station|platform|turnstile)/.test(t) && /(exit|stairs|escalator)/.test(t)) return 'subway-exit';
-    if (/(public transport|carriage|train car|subway car|bus interior|inside a bus|inside a train)/.test(t)) return 'public-transport';
-    if (/(bus stop|timetable|schedule|route)/.test(t)) return 'bus-stop';
-    if (/(crosswalk|marked crosswalk|intersection|traffic light)/.test(t)) return 'city-crosswalk';
-    if (/(outdoor caf|cafe|coffee shop)/.test(t) && /(street|sidewalk|urban|city)/.test(t)) return 'outdoor-cafe';
-    if (/(shopping street|storefront|shop window|boutique|sale|market)/.test(t)) return 'urban-shopping';
-    if (/(rooftop|skyline|city view|elevated urban)/.test(t) && /(sunset|dusk|evening)/.test(t)) return 'rooftop-sunset';
-    if (/(sidewalk|bicycles|bike|cafés|cafe)/.test(t) && /(city|urban)/.test(t)) return 'city-sidewalk';
-    if (/(busy city street|urban street|city street|downtown)/.test(t)) return 'city-street';
+  function collectStrings(v, out){
+    if (typeof v === 'string') { if (v) out.push(v); }
+    else if (Array.isArray(v)) v.forEach(x => collectStrings(x, out));
+    else if (v && typeof v === 'object') Object.values(v).forEach(x => collectStrings(x, out));
+  }
 
-    // Nature — specific first to avoid generic 'forest' grabbing everything
-    if (/(dark forest|night forest|flashlight)/.test(t)) return 'forest-night';
-    if (/(rapids|whitewater|strong current|fast-flowing|rushing water|torrent)/.test(t)) return 'river-rapids';
-    if (/(coastal cliff|cliff|coastline)/.test(t) && /(sunset|dusk)/.test(t)) return 'coastal-cliff';
-    if (/(beach|shoreline|ocean|waves)/.test(t)) return 'beach';
-    if (/(winter|snowfall|snow|icy|blizzard)/.test(t)) return 'winter-snow';
-    if (/(desert|dunes|sand dune)/.test(t)) return 'desert-dunes';
-    if (/(high mountain|cliffs|altitude|harness|climbing)/.test(t)) return 'mountain-cliffs';
-    if (/(mountain valley|valley|snow-capped|scenic trail|breathtaking)/.test(t)) return 'mountain-valley';
-    if (/(lake|overlook|horizon|golden hour)/.test(t) && /(sunset|dusk)/.test(t)) return 'lake-sunset';
+  function sceneText(lesson, fields){
+    const parts = [];
+    fields.forEach(path => {
+      let v = lesson;
+      path.split('.').forEach(k => { v = (v && typeof v === 'object' && !Array.isArray(v)) ? v[k] : undefined; });
+      collectStrings(v, parts);
+    });
+    return parts.join(' | ');
+  }
 
-    if (/(campsite|camp site|tent|string lights|campfire)/.test(t) && /(star|night)/.test(t)) return 'campsite-night';
-    if (/(campsite|camp site|tent|string lights|campfire)/.test(t)) return 'campsite';
-    if (/(park|walking paths|bench)/.test(t)) return 'park';
-    if (/(office|workspace|desk|computer)/.test(t)) return 'office';
-    if (/(forest|woodland|trail|path)/.test(t)) return 'forest-day';
+  function classifyScene(lesson){
+    const m = getSceneMatcher();
+    if (!m) return 'general';
+    const R = m.rules;
+    const t = norm(sceneText(lesson || {}, R.fields));
 
-    return 'general';
+    // One pass over the text: every term hit credits the conditions it satisfies.
+    const found = new Set();
+    const seen = new Set();
+    const re = m.re;
+    re.lastIndex = 0;
+    let hit;
+    while ((hit = re.exec(t)) !== null) {
+      const term = hit[1];
+      if (!seen.has(term)) {
+        seen.add(term);
+        (R.credits[term] || []).forEach(id => found.add(id));
+      }
+      re.lastIndex = hit.index + 1;
+    }
+    for (const [category, ids] of R.rules) {
+      if (ids.every(id => found.has(id))) return category;
+    }
+    return R.fallback;
   }
 
   const TEMPLATES = {
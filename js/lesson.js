@@ -216,8 +216,34 @@ async function loadWordProfiles(letter){
   }
 }
 
+// Per-lesson bundle (scripts/build_vocab_bundles.py): the profiles and word
+// contexts of this lesson's vocabulary in one small file. Words it does not
+// list fall back to the letter / hash shards.
+let __lessonVocabId = '';
+const __lessonVocabBundles = new Map(); // lesson id -> Promise<bundle|null>
+
+function loadLessonVocabBundle(id){
+  if (!id) return Promise.resolve(null);
+  if (!__lessonVocabBundles.has(id)) {
+    __lessonVocabBundles.set(id, fetch(`assets/data/lesson_vocab/${encodeURIComponent(id)}.json`, { cache: 'no-cache' })
+      .then((res) => (res.ok ? res.json() : null))
+      .catch(() => null));
+  }
+  return __lessonVocabBundles.get(id);
+}
+
+// undefined = not in the bundle; null = looked up at build time, no entry.
+async function lessonVocabLookup(part, key){
+  const bundle = await loadLessonVocabBundle(__lessonVocabId);
+  const map = bundle && bundle[part];
+  if (!map || !Object.prototype.hasOwnProperty.call(map, key)) return undefined;
+  return map[key];
+}
+
 async function getWordProfileForVocab(word){
   const w = normalizeWordForProfile(word);
+  const bundled = await lessonVocabLookup('profiles', w);
+  if (bundled !== undefined) return bundled;
   const first = w ? w[0] : '';
   const letter = (first && first >= 'a' && first <= 'z') ? first : '_';
   const map = await loadWordProfiles(letter);
@@ -458,6 +484,8 @@ const WordProfiles = (function(){
     return data;
   }
   async function get(word){
+    const bundled = await lessonVocabLookup('profiles', normalizeWordForProfile(word));
+    if (bundled !== undefined) return bundled;
     const letter = firstLetterKey(word);
     if (letter === '_') return null;
     const data = await loadLetter(letter);
@@ -616,14 +644,17 @@ function makeWordLink(enText){
     if (!w) return null;
     if (WORD_MINI_PROFILE_CACHE.has(w)) return WORD_MINI_PROFILE_CACHE.get(w);
 
-    const letter = _letterOf(w);
-    if (!WORD_PROFILE_LETTER_CACHE.has(letter)) {
-      const url = `assets/data/word_profiles/${letter}.json`;
-      const data = await fetchJSON(url);
-      WORD_PROFILE_LETTER_CACHE.set(letter, data || {});
+    let p = await lessonVocabLookup('profiles', normalizeWordForProfile(w));
+    if (p === undefined) {
+      const letter = _letterOf(w);
+      if (!WORD_PROFILE_LETTER_CACHE.has(letter)) {
+        const url = `assets/data/word_profiles/${letter}.json`;
+        const data = await fetchJSON(url);
+        WORD_PROFILE_LETTER_CACHE.set(letter, data || {});
+      }
+      const dict = WORD_PROFILE_LETTER_CACHE.get(letter) || {};
+      p = dict[w] || dict[w.toLowerCase()] || null;
     }
-    const dict = WORD_PROFILE_LETTER_CACHE.get(letter) || {};
-    const p = dict[w] || dict[w.toLowerCase()] || null;
     if (!p) {
       WORD_MINI_PROFILE_CACHE.set(w, null);
       return null;
@@ -649,9 +680,44 @@ function makeWordLink(enText){
     return profile;
   }
 
+  // Sharded index (scripts/build_word_context.py): manifest + one small shard
+  // per lookup; falls back to the single word_context_index.json.
+  let WORD_CONTEXT_MANIFEST;                   // undefined = not tried yet, null = unavailable
+  const WORD_CONTEXT_SHARDS = new Map();       // shard file -> Promise<shard>
+
+  function _fnv1a32(s) {
+    let h = 0x811c9dc5;
+    for (const b of new TextEncoder().encode(s)) {
+      h = Math.imul(h ^ b, 0x01000193) >>> 0;
+    }
+    return h;
+  }
+
+  async function _getWordContextSharded(w) {
+    if (WORD_CONTEXT_MANIFEST === undefined) {
+      try { WORD_CONTEXT_MANIFEST = await fetchJSON('assets/data/word_context/manifest.json'); }
+      catch { WORD_CONTEXT_MANIFEST = null; }
+    }
+    const m = WORD_CONTEXT_MANIFEST;
+    if (!m || !m.shards) return undefined;
+    const file = `s${String(_fnv1a32(w) % m.shards).padStart(2, '0')}.json`;
+    if (!WORD_CONTEXT_SHARDS.has(file)) {
+      // drop a failed fetch so the next lookup retries instead of reusing the rejection
+      WORD_CONTEXT_SHARDS.set(file, fetchJSON(`assets/data/word_context/${file}`)
+        .catch((e) => { WORD_CONTEXT_SHARDS.delete(file); throw e; }));
+    }
+    const entry = (await WORD_CONTEXT_SHARDS.get(file))[w];
+    if (!entry) return null;
+    return { ...entry, lessons: (entry.lessons || []).map(i => m.lessons[i]).filter(Boolean) };
+  }
+
   async function getWordContext(word) {
-    const w = _normWord(word).toLowerCase();
+    const w = _normWord(word).toLowerCase().replace(/\s+/g, ' ');
     if (!w) return null;
+    const bundled = await lessonVocabLookup('context', w);
+    if (bundled !== undefined) return bundled;
+    const sharded = await _getWordContextSharded(w);
+    if (sharded !== undefined) return sharded;
     if (!WORD_CONTEXT_INDEX) {
       WORD_CONTEXT_INDEX = await fetchJSON('assets/data/word_context_index.json');
     }
@@ -1403,8 +1469,7 @@ function getLexiconEntry(en) {
   try {
     const lex = (window.__LEXICON && typeof window.__LEXICON === 'object') ? window.__LEXICON : null;
     if (!lex) return null;
-    const key = String(en || '').trim().toLowerCase();
-    return lex[key] || null;
+    return lex[normalizeWordForProfile(en)] || null;
   } catch {
     return null;
   }
@@ -2839,6 +2904,8 @@ async function loadLesson(){
     const params = new URLSearchParams(window.location.search);
     const id = params.get('id');
     if (!id) throw new Error('Missing lesson id');
+    __lessonVocabId = id;
+    loadLessonVocabBundle(id); // fetch alongside the lesson; vocabulary cards await it
 
     // Registry provides prev/next navigation + fallback image metadata
     const regData = await (window.Utils?.fetchJSON
@@ -2873,13 +2940,13 @@ async function loadLesson(){
       }
     }
 
-	    // Load lexicon once for FA fallbacks (vocab cards + quick review)
-	    if (!window.__LEXICON && window.Utils?.fetchJSON) {
-	      try {
-	        window.__LEXICON = await window.Utils.fetchJSON('assets/data/lexicon_updated.json', { cache: 'no-store', __attempts: 3 });
-	      } catch {
-	        try { window.__LEXICON = await window.Utils.fetchJSON('assets/data/lexicon.json', { cache: 'no-store', __attempts: 3 }); } catch {}
-	      }
+	    // Prebuilt lexicon lookup for FA fallbacks (vocab cards + quick review):
+	    // window.__LEXICON maps normalized en -> entry
+	    if (!window.__LEXICON && window.Utils?.loadLexiconLookup) {
+	      const words = (Array.isArray(data.vocabularyDetailed) ? data.vocabularyDetailed : [])
+	        .map((v) => v && (v.word || v.en))
+	        .filter(Boolean);
+	      try { window.__LEXICON = (await window.Utils.loadLexiconLookup(words)).byEn; } catch {}
 	    }
 
 	    renderLesson(container, data, registry);
@@ -127,9 +127,29 @@ function updateLessonCardPills(card, stats){
   }
 }
 
+// Card stats precomputed by scripts/gen_lesson_reports.py (same numbers as computeLessonStats)
+async function loadRegistrySummary(){
+  try {
+    const res = await fetch('assets/data/registry_summary.json', { cache: 'no-store' });
+    if (!res.ok) return null;
+    const data = await res.json();
+    return (data && data.lessons && typeof data.lessons === 'object') ? data.lessons : null;
+  } catch (_) {
+    return null;
+  }
+}
+
 async function enrichLessonsWithStats(lessons){
   if (!Array.isArray(lessons) || !lessons.length) return;
 
+  const summary = await loadRegistrySummary();
+  if (summary) {
+    for (const lesson of lessons) {
+      if (lesson && !lesson._stats && summary[lesson.id]) lesson._stats = summary[lesson.id];
+    }
+  }
+
+  // Lessons missing from the summary (e.g. added since the last build): fetch them
   const tasks = lessons.map(async (lesson) => {
     if (!lesson || !lesson.file || lesson._stats) return;
     try {
@@ -0,0 +1,504 @@
+/* Scene classification rules for js/collocation-generator.js.
+ * GENERATED by scripts/emit_scene_rules.py from scripts/pipeline/scenes.py -- do not edit.
+ */
+window.SceneRules = {
+  "version": 1,
+  "fields": [
+    "place",
+    "fullDescription",
+    "analysis.setting",
+    "analysis.settingFa",
+    "analysis.mood",
+    "analysis.moodFa",
+    "analysis.objects",
+    "analysis.themes"
+  ],
+  "pattern": "(?:altitude|b(?:e(?:ach|nch)|i(?:cycles|ke)|lizzard|outique|reathtaking|us(?: (?:interior|stop)|y city street))|c(?:a(?:f(?:e|és)|mp(?: site|fire|site)|rriage)|ity(?: (?:street|view))?|li(?:ffs?|mbing)|o(?:ast(?:al cliff|line)|ffee shop|mputer)|rosswalk)|d(?:ark forest|es(?:ert|k)|owntown|u(?:nes|sk))|e(?:levated urban|scalator|vening|xit)|f(?:ast-flowing|lashlight|orest)|golden hour|h(?:arness|igh mountain|orizon)|i(?:cy|n(?:side a (?:bus|train)|tersection))|lake|m(?:arke(?:d crosswalk|t)|etro|ountain valley)|night(?: forest)?|o(?:cean|ffice|utdoor caf|verlook)|p(?:a(?:rk|th)|latform|ublic transport)|r(?:apids|o(?:oftop|ute)|ushing water)|s(?:a(?:le|nd dune)|c(?:enic trail|hedule)|ho(?:p(?: window|ping street)|reline)|idewalk|kyline|now(?:(?:-capped|fall))?|t(?:a(?:irs|r|tion)|orefront|r(?:eet|ing lights|ong current))|u(?:bway(?: car)?|nset))|t(?:ent|imetable|orrent|ra(?:ffic light|i(?:l|n car))|urnstile)|u(?:nderground|rban(?: street)?)|valley|w(?:a(?:lking paths|ves)|hitewater|inter|o(?:odland|rkspace)))",
+  "credits": {
+    "altitude": [
+      20
+    ],
+    "beach": [
+      17
+    ],
+    "bench": [
+      25
+    ],
+    "bicycles": [
+      10
+    ],
+    "bike": [
+      10
+    ],
+    "blizzard": [
+      18
+    ],
+    "boutique": [
+      7
+    ],
+    "breathtaking": [
+      21
+    ],
+    "bus interior": [
+      2
+    ],
+    "bus stop": [
+      3
+    ],
+    "busy city street": [
+      12
+    ],
+    "cafe": [
+      5,
+      10
+    ],
+    "cafés": [
+      10
+    ],
+    "camp site": [
+      23
+    ],
+    "campfire": [
+      23
+    ],
+    "campsite": [
+      23
+    ],
+    "carriage": [
+      2
+    ],
+    "city": [
+      6,
+      11
+    ],
+    "city street": [
+      6,
+      11,
+      12
+    ],
+    "city view": [
+      6,
+      8,
+      11
+    ],
+    "cliff": [
+      15
+    ],
+    "cliffs": [
+      15,
+      20
+    ],
+    "climbing": [
+      20
+    ],
+    "coastal cliff": [
+      15
+    ],
+    "coastline": [
+      15
+    ],
+    "coffee shop": [
+      5
+    ],
+    "computer": [
+      26
+    ],
+    "crosswalk": [
+      4
+    ],
+    "dark forest": [
+      13
+    ],
+    "desert": [
+      19
+    ],
+    "desk": [
+      26
+    ],
+    "downtown": [
+      12
+    ],
+    "dunes": [
+      19
+    ],
+    "dusk": [
+      9,
+      16
+    ],
+    "elevated urban": [
+      8
+    ],
+    "escalator": [
+      1
+    ],
+    "evening": [
+      9
+    ],
+    "exit": [
+      1
+    ],
+    "fast-flowing": [
+      14
+    ],
+    "flashlight": [
+      13
+    ],
+    "forest": [
+      27
+    ],
+    "golden hour": [
+      22
+    ],
+    "harness": [
+      20
+    ],
+    "high mountain": [
+      20
+    ],
+    "horizon": [
+      22
+    ],
+    "icy": [
+      18
+    ],
+    "inside a bus": [
+      2
+    ],
+    "inside a train": [
+      2
+    ],
+    "intersection": [
+      4
+    ],
+    "lake": [
+      22
+    ],
+    "marked crosswalk": [
+      4
+    ],
+    "market": [
+      7
+    ],
+    "metro": [
+      0
+    ],
+    "mountain valley": [
+      21
+    ],
+    "night": [
+      24
+    ],
+    "night forest": [
+      13,
+      24
+    ],
+    "ocean": [
+      17
+    ],
+    "office": [
+      26
+    ],
+    "outdoor caf": [
+      5
+    ],
+    "overlook": [
+      22
+    ],
+    "park": [
+      25
+    ],
+    "path": [
+      27
+    ],
+    "platform": [
+      0
+    ],
+    "public transport": [
+      2
+    ],
+    "rapids": [
+      14
+    ],
+    "rooftop": [
+      8
+    ],
+    "route": [
+      3
+    ],
+    "rushing water": [
+      14
+    ],
+    "sale": [
+      7
+    ],
+    "sand dune": [
+      19
+    ],
+    "scenic trail": [
+      21
+    ],
+    "schedule": [
+      3
+    ],
+    "shop window": [
+      7
+    ],
+    "shopping street": [
+      7
+    ],
+    "shoreline": [
+      17
+    ],
+    "sidewalk": [
+      6,
+      10
+    ],
+    "skyline": [
+      8
+    ],
+    "snow": [
+      18
+    ],
+    "snow-capped": [
+      18,
+      21
+    ],
+    "snowfall": [
+      18
+    ],
+    "stairs": [
+      1
+    ],
+    "star": [
+      24
+    ],
+    "station": [
+      0
+    ],
+    "storefront": [
+      7
+    ],
+    "street": [
+      6
+    ],
+    "string lights": [
+      23
+    ],
+    "strong current": [
+      14
+    ],
+    "subway": [
+      0
+    ],
+    "subway car": [
+      0,
+      2
+    ],
+    "sunset": [
+      9,
+      16
+    ],
+    "tent": [
+      23
+    ],
+    "timetable": [
+      3
+    ],
+    "torrent": [
+      14
+    ],
+    "traffic light": [
+      4
+    ],
+    "trail": [
+      27
+    ],
+    "train car": [
+      2
+    ],
+    "turnstile": [
+      0
+    ],
+    "underground": [
+      0
+    ],
+    "urban": [
+      6,
+      11
+    ],
+    "urban street": [
+      6,
+      11,
+      12
+    ],
+    "valley": [
+      21
+    ],
+    "walking paths": [
+      25
+    ],
+    "waves": [
+      17
+    ],
+    "whitewater": [
+      14
+    ],
+    "winter": [
+      18
+    ],
+    "woodland": [
+      27
+    ],
+    "workspace": [
+      26
+    ]
+  },
+  "rules": [
+    [
+      "subway-exit",
+      [
+        0,
+        1
+      ]
+    ],
+    [
+      "public-transport",
+      [
+        2
+      ]
+    ],
+    [
+      "bus-stop",
+      [
+        3
+      ]
+    ],
+    [
+      "city-crosswalk",
+      [
+        4
+      ]
+    ],
+    [
+      "outdoor-cafe",
+      [
+        5,
+        6
+      ]
+    ],
+    [
+      "urban-shopping",
+      [
+        7
+      ]
+    ],
+    [
+      "rooftop-sunset",
+      [
+        8,
+        9
+      ]
+    ],
+    [
+      "city-sidewalk",
+      [
+        10,
+        11
+      ]
+    ],
+    [
+      "city-street",
+      [
+        12
+      ]
+    ],
+    [
+      "forest-night",
+      [
+        13
+      ]
+    ],
+    [
+      "river-rapids",
+      [
+        14
+      ]
+    ],
+    [
+      "coastal-cliff",
+      [
+        15,
+        16
+      ]
+    ],
+    [
+      "beach",
+      [
+        17
+      ]
+    ],
+    [
+      "winter-snow",
+      [
+        18
+      ]
+    ],
+    [
+      "desert-dunes",
+      [
+        19
+      ]
+    ],
+    [
+      "mountain-cliffs",
+      [
+        20
+      ]
+    ],
+    [
+      "mountain-valley",
+      [
+        21
+      ]
+    ],
+    [
+      "lake-sunset",
+      [
+        22,
+        16
+      ]
+    ],
+    [
+      "campsite-night",
+      [
+        23,
+        24
+      ]
+    ],
+    [
+      "campsite",
+      [
+        23
+      ]
+    ],
+    [
+      "park",
+      [
+        25
+      ]
+    ],
+    [
+      "office",
+      [
+        26
+      ]
+    ],
+    [
+      "forest-day",
+      [
+        27
+      ]
+    ]
+  ],
+  "fallback": "general"
+};
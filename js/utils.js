@@ -172,6 +172,82 @@ function normalizeText(str) {
   return (str || '').toString().toLowerCase().trim();
 }
 
+/**
+ * Normalize a word or phrase for lexicon/profile lookups
+ * (trim, lowercase, collapse whitespace, curly apostrophe); the same as
+ * normalize_word in scripts/pipeline/lexicon.py
+ */
+function normalizeWord(w) {
+  return (w || '')
+    .toString()
+    .trim()
+    .toLowerCase()
+    .replace(/\s+/g, ' ')
+    .replace(/[’']/g, "'");
+}
+
+/**
+ * Prebuilt lexicon lookup written by scripts/sanitize_lexicon.py.
+ * Resolves to { byEn: {key: entry}, byId: {id: key} } holding at least the
+ * entries for `words` (normalized keys or ids): lexicon_lookup.json, or only
+ * the prefix shards they need when lexicon_lookup/manifest.json exists. Falls
+ * back to indexing lexicon.json when neither was generated.
+ */
+const __lexicon = { byEn: Object.create(null), byId: Object.create(null) };
+const __lexiconFiles = new Map(); // url -> Promise<void>
+let __lexiconLayout; // Promise<manifest|null>; null = one file already loaded
+
+function lexiconShardOf(key, prefix) {
+  const head = Array.from(key).slice(0, prefix).map((c) => (/^[a-z0-9]$/.test(c) ? c : '_')).join('');
+  return head.padEnd(prefix, '_');
+}
+
+function loadLexiconFile(url, index) {
+  if (!__lexiconFiles.has(url)) {
+    __lexiconFiles.set(url, fetchJSON(url, { cache: 'default', __attempts: 1 })
+      .then((data) => {
+        if (index) {
+          for (const e of (Array.isArray(data) ? data : (data.entries || []))) {
+            const key = normalizeWord(e && (e.en || e.word || e.id));
+            if (!key) continue;
+            __lexicon.byEn[key] = e;
+            if (e.id) __lexicon.byId[String(e.id)] = key;
+          }
+        } else {
+          Object.assign(__lexicon.byEn, data.byEn || {});
+          Object.assign(__lexicon.byId, data.byId || {});
+        }
+      }));
+  }
+  return __lexiconFiles.get(url);
+}
+
+// lexicon_lookup.json is the default (and precached) layout, so it is fetched
+// first; the shard manifest is only probed when it is missing.
+function lexiconLayout() {
+  if (!__lexiconLayout) {
+    __lexiconLayout = loadLexiconFile('assets/data/lexicon_lookup.json').then(() => null, () =>
+      fetchJSON('assets/data/lexicon_lookup/manifest.json', { __attempts: 1 })
+        .catch(() => null)
+        .then((m) => (m && m.prefix ? m : loadLexiconFile('assets/data/lexicon.json', true).then(() => null))));
+  }
+  return __lexiconLayout;
+}
+
+async function loadLexiconLookup(words = []) {
+  const m = await lexiconLayout();
+  if (!m) return __lexicon;
+  const shards = new Set(m.shards || []);
+  const loadKeys = (keys) => Promise.all([...new Set(keys.map((k) => lexiconShardOf(k, m.prefix)))]
+    .filter((s) => shards.has(s))
+    .map((s) => loadLexiconFile(`assets/data/lexicon_lookup/${s}.json`).catch(() => {})));
+  const keys = words.map(normalizeWord).filter(Boolean);
+  await loadKeys(keys);
+  // an id can point at a key that lives in another shard
+  await loadKeys(keys.map((k) => __lexicon.byId[k]).filter((k) => k && !(k in __lexicon.byEn)));
+  return __lexicon;
+}
+
 /**
  * Format date/time nicely
  */
@@ -202,6 +278,8 @@ if (typeof window !== 'undefined') {
     fetchJSON,
     sleep,
     normalizeText,
+    normalizeWord,
+    loadLexiconLookup,
     formatDate
   };
 }
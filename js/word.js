@@ -27,24 +27,11 @@
   };
 
   // ---------- data loaders ----------
-  let __lexIndex = null;
   let __registry = null;
 
-  async function loadLexiconIndex(){
-    if (__lexIndex) return __lexIndex;
-    const raw = await fetchJSON("assets/data/lexicon.json");
-    const entries = Array.isArray(raw) ? raw : (raw.entries || []);
-    const byEn = Object.create(null);
-    const byId = Object.create(null);
-
-    for (const e of entries){
-      const en = normalizeWord(e.en || e.word || e.id || "");
-      if (!en) continue;
-      byEn[en] = e;
-      if (e.id) byId[String(e.id)] = e;
-    }
-    __lexIndex = { raw, entries, byEn, byId };
-    return __lexIndex;
+  // { byEn: {key: entry}, byId: {id: key} }, prebuilt by scripts/sanitize_lexicon.py
+  async function loadLexiconIndex(keys){
+    return window.Utils.loadLexiconLookup(keys);
   }
 
   async function loadRegistry(){
@@ -257,18 +244,18 @@
       }
       setStatus("Loading...");
 
-      const lex = await loadLexiconIndex();
-      const registry = await loadRegistry();
-
       const tryKeys = [
         q,
         q.replace(/-/g, " "),
         q.replace(/_/g, " "),
       ].map(normalizeWord);
 
+      const lex = await loadLexiconIndex(tryKeys);
+      const registry = await loadRegistry();
+
       let entry = null;
       for (const k of tryKeys){
-        entry = lex.byId[k] || lex.byEn[k] || null;
+        entry = lex.byEn[lex.byId[k]] || lex.byEn[k] || null;
         if (entry) break;
       }
 
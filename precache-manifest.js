@@ -0,0 +1,63 @@
+/* Precache manifest for sw.js.
+ * GENERATED by scripts/gen_precache.py -- do not edit.
+ */
+self.__PRECACHE = {
+  "version": "0a0296146306",
+  "entries": [
+    {"url": "about.html", "revision": "8ceeb94ddfc3392b", "size": 3555},
+    {"url": "assets/data/collocations_index.json", "revision": "451e7d95ba35d032", "size": 34019},
+    {"url": "assets/data/dict_en_subset.json", "revision": "a2d7c2065802eba7", "size": 599596},
+    {"url": "assets/data/lexicon.json", "revision": "775f8e6ef07801cb", "size": 251244},
+    {"url": "assets/data/lexicon_lookup.json", "revision": "db5c42cffc0da396", "size": 197243},
+    {"url": "assets/data/lexicon_updated.json", "revision": "8c0906bc03d93f46", "size": 1536730},
+    {"url": "assets/data/registry.json", "revision": "b11e56d8a0ee7529", "size": 27548},
+    {"url": "assets/data/registry_summary.json", "revision": "3c0e636a0b3142ab", "size": 8234},
+    {"url": "assets/data/word_context_index.json", "revision": "5f879d08afaa5f0e", "size": 429732},
+    {"url": "assets/icons/icon-192.png", "revision": "eac82d5b77bedca1", "size": 1760},
+    {"url": "assets/icons/icon-512.png", "revision": "b972662fe9347406", "size": 5467},
+    {"url": "assets/images/placeholders.json", "revision": "282cdd5b2c92943a", "size": 8189},
+    {"url": "collocation.html", "revision": "2953f9053ba9c8ea", "size": 3912},
+    {"url": "css/base.css", "revision": "0ad402036b43a6fe", "size": 1519},
+    {"url": "css/components.css", "revision": "98bf7946166cddea", "size": 3137},
+    {"url": "css/custom.css", "revision": "ae4a121c702deec1", "size": 9884},
+    {"url": "css/luxe.css", "revision": "d441364e9d1ab2fa", "size": 12445},
+    {"url": "css/patch-v19.css", "revision": "6d69676436ef8c2a", "size": 24355},
+    {"url": "css/patch-v21.css", "revision": "0eda5f503567f5aa", "size": 4682},
+    {"url": "css/patch-v23.css", "revision": "25a1918c560d2b54", "size": 11145},
+    {"url": "css/patch-v28.css", "revision": "5633c85509cc9b29", "size": 4993},
+    {"url": "css/patch-v29.css", "revision": "86b0de2d5eba80df", "size": 7453},
+    {"url": "css/patch-v30.css", "revision": "e18b9cc7f241c989", "size": 2410},
+    {"url": "css/patch-v31.css", "revision": "9269fb2349439e93", "size": 5937},
+    {"url": "css/patch-v32.css", "revision": "6a79c2c7e6524aee", "size": 2172},
+    {"url": "css/patch-v33.css", "revision": "67a1b4c9bf21ebff", "size": 3364},
+    {"url": "css/patch-v34.css", "revision": "d43237f246d4a270", "size": 1370},
+    {"url": "css/patch-v35.css", "revision": "53b0ce83918e6de2", "size": 1290},
+    {"url": "css/slider-pro.css", "revision": "cc3b3cd6f7f18fd6", "size": 13992},
+    {"url": "css/theme-nebula.css", "revision": "6d36c4747cc54323", "size": 15812},
+    {"url": "css/theme-pro.css", "revision": "e0bb8e9b7559a403", "size": 11292},
+    {"url": "dictionary.html", "revision": "375aa34056f81ac1", "size": 3673},
+    {"url": "exercise.html", "revision": "bd41a7818671c5f1", "size": 5300},
+    {"url": "grammar.html", "revision": "d1818fc9f6956ad5", "size": 4029},
+    {"url": "index.html", "revision": "f4da81f6a7c114e6", "size": 5575},
+    {"url": "js/bilingual.js", "revision": "58d91c008ce7502c", "size": 1315},
+    {"url": "js/collocation.js", "revision": "0b5a3ed96b57cc37", "size": 9753},
+    {"url": "js/dictionary.js", "revision": "0c4323ec6957d318", "size": 6975},
+    {"url": "js/exercise.js", "revision": "5eb2d84c5f60d139", "size": 11658},
+    {"url": "js/grammar.js", "revision": "9c4fc8933bc414c2", "size": 7790},
+    {"url": "js/image-loader.js", "revision": "9e3befb69a566f59", "size": 2855},
+    {"url": "js/lesson.js", "revision": "daf081845b8cf88d", "size": 106462},
+    {"url": "js/main.js", "revision": "677ebcfe5ed5756b", "size": 16451},
+    {"url": "js/offline.js", "revision": "c21b2ea5291e7106", "size": 241},
+    {"url": "js/slider-pro.js", "revision": "00ea1d59c6254cfb", "size": 10266},
+    {"url": "js/speaking.js", "revision": "699ea273ebbc1a67", "size": 15224},
+    {"url": "js/theme.js", "revision": "62604fd09c1282eb", "size": 5131},
+    {"url": "js/tts.js", "revision": "61d3bfc2fb1bdab8", "size": 12493},
+    {"url": "js/utils.js", "revision": "9b2f9bd3f53e2ee3", "size": 7788},
+    {"url": "js/word.js", "revision": "4abc0157f159aee3", "size": 8804},
+    {"url": "lesson.html", "revision": "dd736bd580f1c82c", "size": 5345},
+    {"url": "manifest.json", "revision": "e7f07b59e1c6df91", "size": 683},
+    {"url": "offline.html", "revision": "eb6b292fa356f901", "size": 3758},
+    {"url": "settings.html", "revision": "a3dabea15f2a3916", "size": 4006},
+    {"url": "word.html", "revision": "0c957d1979075bc6", "size": 5202}
+  ]
+};
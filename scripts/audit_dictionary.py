@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Check that the three dictionary layouts agree, in one streaming pass.
+
+Joins assets/data/dict_letters (canonical), assets/data/dictionary/chunks and
+assets/data/word_profiles on the headword and reports missing headwords,
+sense mismatches and synonym drift (see scripts/pipeline/dictaudit.py).
+dictionary/chunks is a build output: run scripts/dictionary_views.py --write first.
+Exit code 1 if any error was found, so it can gate CI.
+
+Usage:
+  python scripts/audit_dictionary.py
+  python scripts/audit_dictionary.py --letters a,s
+  python scripts/audit_dictionary.py --json dict-audit.json   # machine-readable result ("-" = stdout)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from pipeline.dictaudit import audit
+from pipeline.dictstore import CHUNKS_DIR, LETTERS, ROOT
+from pipeline.validate import WARNING, ValidationReport
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--letters", default="", help="comma-separated letters (default: all, plus the non a-z shards)")
+    ap.add_argument("--json", dest="json_out", default="", help="write the machine-readable result to a file ('-' = stdout)")
+    ap.add_argument("--limit", type=int, default=50, help="print at most N issues (0 = all)")
+    args = ap.parse_args()
+
+    letters = [s.strip().lower() for s in args.letters.split(",") if s.strip()] or list(LETTERS)
+    unknown = [s for s in letters if s not in LETTERS]
+    if unknown:
+        raise SystemExit(f"❌ Unknown letter(s): {', '.join(unknown)}")
+
+    if not any(CHUNKS_DIR.glob("*.json")):
+        raise SystemExit(f"❌ {CHUNKS_DIR.relative_to(ROOT)}/ is not built (run scripts/dictionary_views.py --write)")
+
+    t0 = time.perf_counter()
+    issues, stats = audit(letters)
+    report = ValidationReport(issues=issues, elapsed=time.perf_counter() - t0)
+    if args.json_out:
+        data = {**report.to_dict(), "stats": vars(stats)}
+        if args.json_out == "-":
+            json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+            return 1 if report.errors else 0
+        Path(args.json_out).write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    shown = issues if not args.limit else issues[:args.limit]
+    for i in shown:
+        print(f"{'⚠️ ' if i.severity == WARNING else '❌'} [{i.check}] {i.location()}: {i.message}")
+    if len(shown) < len(issues):
+        print(f"... and {len(issues) - len(shown)} more")
+    print(f"\n{stats.headwords:,} headword(s) joined across 3 layouts in {report.elapsed:.2f}s "
+          f"({stats.extra_profiles} extra and {stats.overridden_profiles} overridden profile(s) from the overrides; "
+          f"max {stats.max_buffered} entries buffered)")
+    if issues:
+        print("  " + ", ".join(f"{check}: {n}" for check, n in Counter(i.check for i in issues).most_common()))
+    if report.errors:
+        print(f"❌ {len(report.errors)} error(s), {len(report.warnings)} warning(s)")
+        return 1
+    print(f"✅ Dictionary layouts agree{f' ({len(report.warnings)} warning(s))' if report.warnings else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Benchmark the build/validation scripts on synthetic corpora and track regressions.
+
+For each corpus size (default 48, 500 and 5000 lessons) a throwaway site is
+assembled in a temp dir: the real HTML/JS/scripts, images symlinked, and a
+registry + lessons synthesized from the real toefl-ax34-*.json lessons (same
+schema, unique ids/titles); the generated files check_project.py requires to
+be current (``DERIVED``) are then rebuilt from it, untimed, so its checks pass
+as they do on the real tree. Each script runs there as a subprocess; wall
+time, CPU time and peak RSS are recorded per run (median over --repeat).
+
+Results are stored as JSON together with a per-script scaling exponent
+(log t2/t1 / log n2/n1 between neighbouring sizes; ~1.0 is linear). With
+--baseline, results are compared to an earlier run and regressions (slower
+or larger by more than --threshold) are flagged, as are scripts whose
+scaling turned superlinear.
+
+Usage:
+  python scripts/bench.py
+  python scripts/bench.py --sizes 48,500 --repeat 3 --out .build/bench/new.json
+  python scripts/bench.py --baseline .build/bench/base.json
+  python scripts/bench.py --results .build/bench/new.json --baseline .build/bench/base.json   # compare only
+
+Exit code 1 if a regression is flagged or a benchmarked script fails.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUT = ROOT / ".build" / "bench" / "latest.json"
+RESULTS_VERSION = 1
+
+# name -> (script, args, data the run mutates and that is restored before each run)
+BENCHES: dict[str, tuple[str, list[str], tuple[str, ...]]] = {
+    "check_project": ("scripts/check_project.py", [], ()),
+    "lesson-quality-check": ("scripts/lesson-quality-check.py", [], ()),
+    "generate_collocations": ("scripts/generate_collocations.py", ["--no-cache"], ("lessons",)),
+    "sanitize_lexicon": ("scripts/sanitize_lexicon.py", [], ("lexicon",)),
+}
+# generators of the committed artifacts that check_project.py requires to be up to date,
+# run in this order once the corpus is written (gen_precache last: it hashes the others)
+DERIVED: list[tuple[str, list[str]]] = [
+    ("scripts/gen_lesson_reports.py", []),
+    ("scripts/build_word_context.py", []),
+    ("scripts/build_vocab_bundles.py", []),
+    ("scripts/gen_precache.py", []),
+]
+SITE_FILES = ["*.html", "manifest.json", "sw.js", "precache-manifest.js", "VERSION", "CHANGELOG.md"]
+SITE_DIRS = ["js", "css", "scripts", "assets/icons"]
+# read-only inputs of the DERIVED generators, shared with the real tree
+LINKED_DATA = ["assets/data/word_profiles"]
+PLACEHOLDER_FA = ["فعل/عمل", "موضوع/مفهوم", "شیء/وسیله"]
+
+# regressions smaller than this are noise, whatever the ratio
+MIN_DELTA_S = 0.05
+MIN_DELTA_MB = 2.0
+SUPERLINEAR = 1.3
+
+
+# ---------------------------------------------------------------- synthesis
+
+class Workspace:
+    """A temp copy of the site with a synthetic corpus of ``n`` lessons."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.dir = Path(tempfile.mkdtemp(prefix=f"bench-{n}-"))
+        self._templates = [
+            (json.loads(p.read_text(encoding="utf-8")), p.stem)
+            for p in sorted((ROOT / "assets/data/lessons").glob("toefl-ax34-*.json"))
+        ]
+        reg = json.loads((ROOT / "assets/data/registry.json").read_text(encoding="utf-8"))
+        self._reg_entries = {e["id"]: e for e in reg["lessons"]}
+        self._lexicon = json.loads((ROOT / "assets/data/lexicon.json").read_text(encoding="utf-8"))
+
+    def __enter__(self) -> "Workspace":
+        for pattern in SITE_FILES:
+            for f in ROOT.glob(pattern):
+                shutil.copy2(f, self.dir / f.name)
+        for d in SITE_DIRS:
+            shutil.copytree(ROOT / d, self.dir / d, ignore=shutil.ignore_patterns("__pycache__"))
+        (self.dir / "assets/images").symlink_to(ROOT / "assets/images", target_is_directory=True)
+        for d in LINKED_DATA:
+            (self.dir / d).parent.mkdir(parents=True, exist_ok=True)
+            (self.dir / d).symlink_to(ROOT / d, target_is_directory=True)
+        self.write_lessons()
+        self.write_lexicon()
+        self.write_derived()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def write_lessons(self) -> None:
+        lessons_dir = self.dir / "assets/data/lessons"
+        if lessons_dir.exists():
+            shutil.rmtree(lessons_dir)
+        lessons_dir.mkdir(parents=True)
+        entries = []
+        for i in range(self.n):
+            data, stem = self._templates[i % len(self._templates)]
+            lesson = copy.deepcopy(data)
+            lid = f"toefl-ax34-b{i:05d}"
+            lesson["id"] = lid
+            lesson["title"] = f"{data.get('title', '')} #{i}"
+            (lessons_dir / f"{lid}.json").write_text(
+                json.dumps(lesson, ensure_ascii=False, indent=2), encoding="utf-8")
+            entry = dict(self._reg_entries.get(stem) or {})
+            entry.update(id=lid, title=lesson["title"], file=f"assets/data/lessons/{lid}.json")
+            entries.append(entry)
+        registry = {"version": 1, "lessonCount": len(entries), "lessons": entries}
+        (self.dir / "assets/data/registry.json").write_text(
+            json.dumps(registry, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def write_lexicon(self) -> None:
+        """Real lexicon entries scaled with the corpus; every 10th gets a placeholder label."""
+        base = self._lexicon["entries"]
+        want = max(len(base), len(base) * self.n // 48)
+        entries = []
+        for i in range(want):
+            e = dict(base[i % len(base)])
+            e["id"] = f"{e['id']}-{i // len(base)}" if i >= len(base) else e["id"]
+            if i % 10 == 0:
+                e["fa"] = list(e.get("fa") or []) + [PLACEHOLDER_FA[i % 3]]
+            entries.append(e)
+        (self.dir / "assets/data/lexicon.json").write_text(
+            json.dumps({"entries": entries}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def write_derived(self) -> None:
+        """Regenerate the ``DERIVED`` artifacts from the synthetic corpus (not timed)."""
+        for script, args in DERIVED:
+            proc = subprocess.run([sys.executable, script, *args], cwd=self.dir,
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            if proc.returncode:
+                tail = proc.stdout.decode("utf-8", errors="replace").strip().splitlines()[-1:]
+                raise SystemExit(f"❌ {script} failed on the {self.n}-lesson corpus: {' '.join(tail)}")
+
+    def reset(self, parts: tuple[str, ...]) -> None:
+        if "lessons" in parts:
+            self.write_lessons()
+        if "lexicon" in parts:
+            self.write_lexicon()
+        if parts:
+            # a mutating run may also have rewritten derived files (sanitize_lexicon writes the lookup)
+            self.write_derived()
+        shutil.rmtree(self.dir / ".build", ignore_errors=True)
+
+
+# ---------------------------------------------------------------- measuring
+
+def run_once(ws: Workspace, script: str, args: list[str]) -> dict:
+    with tempfile.TemporaryFile() as out:
+        t0 = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, script, *args], cwd=ws.dir,
+                                stdout=out, stderr=subprocess.STDOUT)
+        # wait4 gives this child's own rusage (peak RSS), unlike RUSAGE_CHILDREN
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - t0
+        code = os.waitstatus_to_exitcode(status)
+        proc.returncode = code
+        out.seek(0)
+        output = out.read().decode("utf-8", errors="replace").strip()
+    return {
+        "wall_s": wall,
+        "cpu_s": usage.ru_utime + usage.ru_stime,
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        "max_rss_mb": usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "exit": code,
+        "error": output.splitlines()[-1] if code and output else "",
+    }
+
+
+def bench(sizes: list[int], names: list[str], repeat: int) -> dict:
+    results = []
+    for n in sizes:
+        t = time.perf_counter()
+        with Workspace(n) as ws:
+            print(f"== {n} lessons (synthesized in {time.perf_counter() - t:.1f}s) ==")
+            for name in names:
+                script, args, mutates = BENCHES[name]
+                runs = []
+                for _ in range(repeat):
+                    ws.reset(mutates)
+                    runs.append(run_once(ws, script, args))
+                row = {
+                    "script": name,
+                    "lessons": n,
+                    "wall_s": round(statistics.median(r["wall_s"] for r in runs), 4),
+                    "cpu_s": round(statistics.median(r["cpu_s"] for r in runs), 4),
+                    "max_rss_mb": round(max(r["max_rss_mb"] for r in runs), 1),
+                    "exit": max(r["exit"] for r in runs),
+                    "runs": repeat,
+                }
+                err = next((r["error"] for r in runs if r["error"]), "")
+                if err:
+                    row["error"] = err
+                results.append(row)
+                flag = "" if row["exit"] == 0 else f"  ⚠️  exit {row['exit']} {err}"
+                print(f"  {name:<24} {row['wall_s']:>8.3f}s wall {row['cpu_s']:>8.3f}s cpu "
+                      f"{row['max_rss_mb']:>8.1f} MB{flag}")
+    return {
+        "version": RESULTS_VERSION,
+        "createdAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "sizes": sizes,
+        "results": results,
+        "scaling": scaling(results),
+    }
+
+
+def scaling(results: list[dict]) -> dict[str, list[dict]]:
+    """Per script: time exponent between each pair of neighbouring sizes."""
+    by_script: dict[str, list[dict]] = {}
+    for r in results:
+        by_script.setdefault(r["script"], []).append(r)
+    out: dict[str, list[dict]] = {}
+    for name, rows in by_script.items():
+        rows = sorted(rows, key=lambda r: r["lessons"])
+        steps = []
+        for a, b in zip(rows, rows[1:]):
+            if a["wall_s"] > 0 and b["lessons"] > a["lessons"]:
+                k = math.log(b["wall_s"] / a["wall_s"]) / math.log(b["lessons"] / a["lessons"])
+                steps.append({"from": a["lessons"], "to": b["lessons"], "exponent": round(k, 2)})
+        out[name] = steps
+    return out
+
+
+# ---------------------------------------------------------------- comparing
+
+def compare(new: dict, base: dict, threshold: float) -> list[str]:
+    """Human-readable regressions of ``new`` against ``base``."""
+    old = {(r["script"], r["lessons"]): r for r in base.get("results", [])}
+    flags = []
+    print(f"\nCompared with baseline from {base.get('createdAt', '?')} (threshold {threshold:.0%}):")
+    for r in new["results"]:
+        b = old.get((r["script"], r["lessons"]))
+        if b is None:
+            continue
+        dt = r["wall_s"] - b["wall_s"]
+        dm = r["max_rss_mb"] - b["max_rss_mb"]
+        ratio_t = r["wall_s"] / b["wall_s"] if b["wall_s"] else math.inf
+        ratio_m = r["max_rss_mb"] / b["max_rss_mb"] if b["max_rss_mb"] else math.inf
+        mark = ""
+        if ratio_t > 1 + threshold and dt > MIN_DELTA_S:
+            mark = "❌"
+            flags.append(f"{r['script']} @ {r['lessons']}: {b['wall_s']:.3f}s -> {r['wall_s']:.3f}s (+{ratio_t - 1:.0%})")
+        if ratio_m > 1 + threshold and dm > MIN_DELTA_MB:
+            mark = "❌"
+            flags.append(f"{r['script']} @ {r['lessons']}: {b['max_rss_mb']:.1f} MB -> {r['max_rss_mb']:.1f} MB peak RSS (+{ratio_m - 1:.0%})")
+        print(f"  {mark or '  '} {r['script']:<24} {r['lessons']:>6}  time {ratio_t:>6.2f}x  rss {ratio_m:>6.2f}x")
+    old_k = base.get("scaling", {})
+    for name, steps in new.get("scaling", {}).items():
+        prev = {(s["from"], s["to"]): s["exponent"] for s in old_k.get(name, [])}
+        for s in steps:
+            was = prev.get((s["from"], s["to"]))
+            if s["exponent"] > SUPERLINEAR and (was is None or was <= SUPERLINEAR):
+                flags.append(f"{name}: superlinear {s['from']}->{s['to']} lessons "
+                             f"(exponent {s['exponent']}, was {was if was is not None else 'n/a'})")
+    return flags
+
+
+def print_scaling(results: dict) -> None:
+    print("\nScaling exponent (1.0 = linear):")
+    for name, steps in results.get("scaling", {}).items():
+        desc = ", ".join(f"{s['from']}->{s['to']}: {s['exponent']:.2f}" for s in steps) or "-"
+        warn = " ⚠️  superlinear" if any(s["exponent"] > SUPERLINEAR for s in steps) else ""
+        print(f"  {name:<24} {desc}{warn}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="48,500,5000", help="comma-separated corpus sizes (default: 48,500,5000)")
+    ap.add_argument("--scripts", default=",".join(BENCHES), help=f"comma-separated subset of: {','.join(BENCHES)}")
+    ap.add_argument("--repeat", type=int, default=1, help="runs per script and size; the median is kept (default: 1)")
+    ap.add_argument("--out", default=str(DEFAULT_OUT), help="where to write results JSON (default: .build/bench/latest.json)")
+    ap.add_argument("--baseline", default="", help="results JSON to compare against")
+    ap.add_argument("--results", default="", help="compare this existing results JSON instead of running")
+    ap.add_argument("--threshold", type=float, default=0.25, help="relative slowdown/growth flagged as regression (default: 0.25)")
+    args = ap.parse_args()
+
+    if args.results:
+        results = json.loads(Path(args.results).read_text(encoding="utf-8"))
+    else:
+        names = [s.strip() for s in args.scripts.split(",") if s.strip()]
+        unknown = [s for s in names if s not in BENCHES]
+        if unknown:
+            raise SystemExit(f"❌ Unknown script(s): {', '.join(unknown)}")
+        sizes = sorted({int(s) for s in args.sizes.split(",") if s.strip()})
+        results = bench(sizes, names, max(1, args.repeat))
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Results written to {out}")
+    print_scaling(results)
+
+    failed = [r for r in results["results"] if r["exit"] != 0]
+    flags = []
+    if args.baseline:
+        flags = compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.threshold)
+        for f in flags:
+            print(f"❌ Regression: {f}")
+        if not flags:
+            print("✅ No regressions")
+    for r in failed:
+        print(f"❌ {r['script']} @ {r['lessons']} exited {r['exit']}: {r.get('error', '')}")
+    return 1 if flags or failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Single-pass dataset build.
+
+Loads the registry and every lesson JSON once into an in-memory corpus, then
+runs generation, validation and report stages over that shared model:
+
+  collocations : fill scene-based collocations into lessons that have none
+                 (scripts/generate_collocations.py --fill-missing; hand-written ones are kept)
+  check        : static project checks (scripts/check_project.py)
+  quality      : lesson quality report (scripts/lesson-quality-check.py)
+  smoke        : advanced smoke checks (scripts/smoke-advanced.py)
+  write        : save changed lessons, collocations_index.json and reports
+                 (--profile=prod: plus minified copies in dist/, scripts/build_dist.py)
+  split        : first-paint core + section files per lesson (scripts/split_lessons.py)
+  reports      : lesson integrity/fa-mixed reports and registry_summary.json (scripts/gen_lesson_reports.py)
+  vocab        : per-lesson vocabulary profile bundles (scripts/build_vocab_bundles.py)
+  compress     : .gz/.br siblings for every data artifact (scripts/precompress.py)
+  precache     : content-hashed precache-manifest.js for sw.js (scripts/gen_precache.py)
+
+Usage:
+  python scripts/build.py
+  python scripts/build.py --stages check,quality
+  python scripts/build.py --dry-run --strict
+  python scripts/build.py --md quality-report.md --json quality-report.json
+  python scripts/build.py --no-cache
+  python scripts/build.py --profile=prod   # also minify every data artifact into dist/
+
+Incremental: per-input content hashes live in .build/manifest.json, and every
+output is only rewritten when its bytes change, so a no-op rebuild leaves
+git status clean.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import build_dist
+import check_project
+import gen_precache
+import generate_collocations
+import build_vocab_bundles
+import split_lessons
+from pipeline import ROOT, BuildManifest, Corpus, load_corpus, write_text_if_changed
+from pipeline.compress import CACHE_NS as COMPRESS_NS, data_artifacts, precompress
+from pipeline.compress import print_report as print_compress_report
+from pipeline.dist import PROFILES, DistWriter
+from pipeline.dist import print_report as print_dist_report
+from pipeline.lessonreports import render_outputs, scan_lessons
+from pipeline.precache import OUT_REL as PRECACHE_REL, budget_warnings
+from pipeline.precache import generate as generate_precache
+from pipeline.quality import check_quality, print_summary, write_reports
+from pipeline.smoke import check_lesson_js, check_lesson_schema, check_registry_files
+from pipeline.split import split_corpus
+from pipeline.vocabbundle import build_bundles
+
+STAGES = ["collocations", "check", "quality", "smoke", "write", "split", "reports", "vocab", "compress", "precache"]
+
+
+class BuildState:
+    def __init__(self, corpus: Corpus, manifest: BuildManifest, args: argparse.Namespace):
+        self.corpus = corpus
+        self.manifest = manifest
+        self.args = args
+        self.collocations: dict[str, Any] | None = None
+        self.quality: dict[str, Any] | None = None
+        self.failed: list[str] = []
+
+
+def stage_collocations(state: BuildState) -> None:
+    state.collocations = generate_collocations.apply_collocations(
+        state.corpus, keep=state.args.keep, manifest=state.manifest, fill_missing=True)
+    generate_collocations.print_summary(state.collocations, state.args.dry_run)
+
+
+def stage_check(state: BuildState) -> None:
+    report = check_project.run_checks(state.corpus, jobs=state.args.jobs)
+    check_project.print_report(report)
+    if report.errors:
+        state.failed.append(f"check: {len(report.errors)} error(s)")
+
+
+def stage_quality(state: BuildState) -> None:
+    result = check_quality(state.corpus)
+    ok = not result["errors"] and (not result["warnings"] or not state.args.strict)
+    state.quality = {"ok": ok, **result}
+    print_summary(state.quality)
+    if result["errors"]:
+        state.failed.append(f"quality: {len(result['errors'])} error(s)")
+    elif state.args.strict and result["warnings"]:
+        state.failed.append(f"quality: {len(result['warnings'])} warning(s) (--strict)")
+
+
+def stage_smoke(state: BuildState) -> None:
+    failures = (
+        check_registry_files(state.corpus)
+        + check_lesson_schema(state.corpus)
+        + check_lesson_js(state.corpus.root / "js" / "lesson.js")
+    )
+    for f in failures:
+        print(f"FAIL: {f}")
+    if failures:
+        state.failed.append(f"smoke: {len(failures)} failure(s)")
+    else:
+        print("OK: advanced smoke checks passed")
+
+
+def stage_write(state: BuildState) -> None:
+    if state.args.dry_run:
+        print(f"dry-run: {len(state.corpus.dirty())} lesson(s) would be written")
+        return
+    if state.failed:
+        print("Skipping writes: earlier stages failed")
+        return
+    saved = state.corpus.save()
+    print(f"✅ Lessons written: {saved}")
+    if state.collocations is not None:
+        if generate_collocations.write_index(state.corpus.root, state.collocations["index"]):
+            print("✅ Wrote assets/data/collocations_index.json")
+        generate_collocations.remember(state.corpus, state.manifest, state.collocations)
+    if state.quality is not None and (state.args.json_out or state.args.md_out):
+        write_reports(state.quality, state.corpus.root, state.args.json_out, state.args.md_out)
+        print("✅ Wrote quality report(s)")
+    if state.manifest.save():
+        print(f"✅ Updated {state.manifest.path.relative_to(state.corpus.root)}")
+    if state.args.profile == "prod":
+        writer = DistWriter(state.corpus.root)
+        results = writer.emit_all(build_dist.source_files())
+        writer.close()
+        print_dist_report(results, root=state.corpus.root, top=5)
+
+
+def stage_split(state: BuildState) -> None:
+    if state.args.dry_run or state.failed:
+        print("Skipping lesson split: " + ("dry-run" if state.args.dry_run else "earlier stages failed"))
+        return
+    res = split_corpus(state.corpus)
+    split_lessons.print_summary(res)
+    if res.problems:
+        state.failed.append(f"split: {len(res.problems)} problem(s)")
+
+
+def stage_reports(state: BuildState) -> None:
+    if state.args.dry_run or state.failed:
+        print("Skipping lesson reports: " + ("dry-run" if state.args.dry_run else "earlier stages failed"))
+        return
+    res = scan_lessons(state.corpus.root, state.manifest)
+    state.manifest.save()
+    print(f"Lessons scanned: {res.lessons} ({res.parsed} parsed, {res.lessons - res.parsed} cached); "
+          f"mixed fa fields: {res.fields}")
+    for rel, text in render_outputs(state.corpus.root, res).items():
+        print(f"✅ {'Wrote' if write_text_if_changed(state.corpus.root / rel, text) else 'Unchanged'} {rel}")
+    if res.problems:
+        state.failed.append(f"reports: {len(res.problems)} problem(s)")
+
+
+def stage_vocab(state: BuildState) -> None:
+    if state.args.dry_run or state.failed:
+        print("Skipping vocabulary bundles: " + ("dry-run" if state.args.dry_run else "earlier stages failed"))
+        return
+    res = build_bundles(state.corpus.root, state.manifest)
+    state.manifest.save()
+    build_vocab_bundles.print_summary(res)
+    if res.problems:
+        state.failed.append(f"vocab: {len(res.problems)} problem(s)")
+
+
+def stage_compress(state: BuildState) -> None:
+    if state.args.dry_run or state.failed:
+        print("Skipping precompression: " + ("dry-run" if state.args.dry_run else "earlier stages failed"))
+        return
+    results = precompress(data_artifacts(), state.manifest, jobs=state.args.jobs)
+    state.manifest.prune(COMPRESS_NS)
+    state.manifest.save()
+    print_compress_report(results, top=5)
+    errors = [r for r in results if r.error]
+    if errors:
+        state.failed.append(f"compress: {len(errors)} file(s) failed")
+
+
+def stage_precache(state: BuildState) -> None:
+    if state.args.dry_run or state.failed:
+        print("Skipping precache manifest: " + ("dry-run" if state.args.dry_run else "earlier stages failed"))
+        return
+    text, entries, missing = generate_precache(state.corpus.root)
+    written = write_text_if_changed(state.corpus.root / PRECACHE_REL, text)
+    gen_precache.print_report(entries, top=3)
+    for m in missing:
+        print(f"⚠️  Not precached, file missing: {m}")
+    for w in budget_warnings(entries):
+        print(f"⚠️  Over budget: {w}")
+    print(f"✅ {'Wrote' if written else 'Unchanged'} {PRECACHE_REL}")
+
+
+STAGE_FUNCS: dict[str, Callable[[BuildState], None]] = {
+    "collocations": stage_collocations,
+    "check": stage_check,
+    "quality": stage_quality,
+    "smoke": stage_smoke,
+    "write": stage_write,
+    "split": stage_split,
+    "reports": stage_reports,
+    "vocab": stage_vocab,
+    "compress": stage_compress,
+    "precache": stage_precache,
+}
+
+
+def parse_stages(value: str) -> list[str]:
+    names = [s.strip() for s in value.split(",") if s.strip()]
+    unknown = [s for s in names if s not in STAGE_FUNCS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown stage(s): {', '.join(unknown)} (known: {', '.join(STAGES)})")
+    # always run in pipeline order, whatever order was given
+    return [s for s in STAGES if s in names]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Single-pass lesson dataset build")
+    ap.add_argument("--stages", type=parse_stages, default=list(STAGES),
+                    help=f"comma-separated subset of: {','.join(STAGES)}")
+    ap.add_argument("--dry-run", action="store_true", help="run every stage but write nothing")
+    ap.add_argument("--keep", action="store_true", help="keep existing collocations if already matching generated ids")
+    ap.add_argument("--strict", action="store_true", help="treat quality warnings as errors")
+    ap.add_argument("--no-cache", action="store_true", help="ignore .build/manifest.json and reprocess everything")
+    ap.add_argument("--profile", choices=PROFILES, default="dev", help="prod: also write minified JSON to dist/")
+    ap.add_argument("--jobs", "-j", type=int, default=None, help="workers for check (threads) and compress (processes)")
+    ap.add_argument("--json", dest="json_out", default="", help="write JSON quality report to file")
+    ap.add_argument("--md", dest="md_out", default="", help="write Markdown quality report to file")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    corpus = load_corpus(ROOT)
+    n = sum(1 for _ in corpus.all_lessons())
+    print(f"Loaded {n} lesson file(s) in {time.perf_counter() - t0:.2f}s")
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    state = BuildState(corpus, manifest, args)
+    for name in args.stages:
+        print(f"\n== {name} ==")
+        t = time.perf_counter()
+        STAGE_FUNCS[name](state)
+        print(f"-- {name}: {time.perf_counter() - t:.2f}s")
+
+    print(f"\nBuild finished in {time.perf_counter() - t0:.2f}s "
+          f"(cache hits: {manifest.hits}, misses: {manifest.misses})")
+    if state.failed:
+        print("❌ Failed stages:\n" + "\n".join(f" - {f}" for f in state.failed))
+        return 1
+    print("🎉 Build OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
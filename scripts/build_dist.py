@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Write the minified production copy of every JSON data artifact.
+
+Source files stay pretty-printed; dist/ gets the same relative paths with
+compact separators and without createdAt/updatedAt/generatedAt (moved to
+dist/_build_meta.json). The generators accept --profile=prod to do the same
+for just the files they write.
+
+Usage:
+  python scripts/build_dist.py
+  python scripts/build_dist.py --clean     # also drop dist files whose source is gone
+  python scripts/build_dist.py --top 0     # totals only
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from pipeline import ROOT
+from pipeline.dist import DIST_DIR, SIDECAR, DistWriter, print_report
+
+SOURCES = [
+    ROOT / "assets/data",
+    ROOT / "assets/images/placeholders.json",
+]
+
+
+def source_files() -> list[Path]:
+    out = []
+    for src in SOURCES:
+        if src.is_dir():
+            out.extend(src.rglob("*.json"))
+        elif src.exists():
+            out.append(src)
+    return sorted(out)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--clean", action="store_true", help="remove dist JSON files without a source file")
+    ap.add_argument("--top", type=int, default=15, help="files to list in the report, largest saving first (default: 15)")
+    args = ap.parse_args()
+
+    writer = DistWriter()
+    results = writer.emit_all(source_files())
+    if args.clean:
+        for p in sorted(DIST_DIR.rglob("*.json")):
+            if p.name != SIDECAR and not (ROOT / p.relative_to(DIST_DIR)).exists():
+                p.unlink()
+                print(f"🗑️  Removed {p.relative_to(ROOT)}")
+    writer.close(prune=args.clean)
+    print_report(results, top=args.top)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Generate responsive WebP (and AVIF) variants of the lesson photos.
+
+Every source image in image_sources/ (or the given paths) becomes
+assets/images/<name>-400/-800/-1600.webp, plus .avif siblings when Pillow
+supports AVIF, encoded across a process pool (see
+scripts/pipeline/imagevariants.py). Sources are never upscaled.
+
+Usage:
+  python scripts/build_image_variants.py
+  python scripts/build_image_variants.py --jobs 4 --top 20
+  python scripts/build_image_variants.py --widths 800,1600 --formats webp
+  python scripts/build_image_variants.py image_sources/campus_cafe-luxe.jpg
+
+Sources whose content hash matches .build/manifest.json (and whose variants
+are still on disk) are skipped; use --no-cache to re-encode everything.
+Afterwards run scripts/gen_placeholders.py for the new -800.webp files.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from pipeline import ROOT, BuildManifest
+from pipeline.imagevariants import (
+    AVIF_QUALITY, CACHE_NS, IMAGES_DIR, SOURCES_DIR, WEBP_QUALITY, WIDTHS,
+    available_formats, build_variants, print_report, source_images,
+)
+
+
+def parse_widths(value: str) -> tuple[int, ...]:
+    try:
+        widths = sorted({int(w) for w in value.split(",") if w.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"widths must be integers: {value!r}")
+    if not widths or widths[0] <= 0:
+        raise argparse.ArgumentTypeError("at least one positive width is required")
+    return tuple(widths)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="*", help="source images (default: every image in --src)")
+    ap.add_argument("--src", type=Path, default=SOURCES_DIR,
+                    help=f"source directory (default: {SOURCES_DIR.relative_to(ROOT)})")
+    ap.add_argument("--widths", type=parse_widths, default=WIDTHS,
+                    help=f"comma-separated widths (default: {','.join(map(str, WIDTHS))})")
+    ap.add_argument("--formats", default=",".join(available_formats()),
+                    help=f"comma-separated formats (default here: {','.join(available_formats())})")
+    ap.add_argument("--quality", type=int, default=WEBP_QUALITY, help=f"WebP quality (default: {WEBP_QUALITY})")
+    ap.add_argument("--avif-quality", type=int, default=AVIF_QUALITY, help=f"AVIF quality (default: {AVIF_QUALITY})")
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    ap.add_argument("--no-cache", action="store_true", help="re-encode everything, ignoring .build/manifest.json")
+    ap.add_argument("--top", type=int, default=10, help="largest variants to list in the report (default: 10)")
+    args = ap.parse_args()
+
+    formats = tuple(f.strip().lower() for f in args.formats.split(",") if f.strip())
+    unsupported = [f for f in formats if f not in available_formats()]
+    if unsupported:
+        raise SystemExit(f"❌ Format(s) not supported by this Pillow: {', '.join(unsupported)}")
+
+    if args.paths:
+        paths = [Path(p).resolve() for p in args.paths]
+        missing = [str(p) for p in paths if not p.is_file()]
+        if missing:
+            raise SystemExit("❌ Not found:\n" + "\n".join(missing))
+        outside = [str(p) for p in paths if not p.is_relative_to(ROOT)]
+        if outside:
+            raise SystemExit("❌ Outside the repository:\n" + "\n".join(outside))
+    else:
+        if not args.src.resolve().is_relative_to(ROOT):
+            raise SystemExit(f"❌ Outside the repository: {args.src}")
+        paths = source_images(args.src.resolve())
+        if not paths:
+            raise SystemExit(f"❌ No source images in {args.src}")
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    results = build_variants(paths, manifest, widths=args.widths, formats=formats, jobs=args.jobs,
+                             out_dir=IMAGES_DIR, webp_quality=args.quality, avif_quality=args.avif_quality)
+    if not args.paths:
+        manifest.prune(CACHE_NS)
+    manifest.save()
+    print_report(results, top=args.top)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Build the BM25 full-text search index over the registry lessons, or query it.
+
+English and Persian text are indexed separately (see scripts/pipeline/search.py)
+and exported as static shards the PWA can fetch and search offline; --query
+reads those same shards.
+
+Output:
+  assets/data/search/manifest.json
+  assets/data/search/tNN.json
+
+Usage:
+  python scripts/build_search_index.py
+  python scripts/build_search_index.py --check                  # exit 1 if the shards are stale
+  python scripts/build_search_index.py --query "crowded subway platform"
+  python scripts/build_search_index.py --query "ایستگاه مترو" --top 5
+  python scripts/build_search_index.py --query "campfire guitar" --repeat 200   # timing
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from pipeline import ROOT
+from pipeline.search import INDEX_REL, build_search_index, query_terms, SearchIndex
+
+
+def run_query(query: str, top: int, repeat: int) -> int:
+    try:
+        t0 = time.perf_counter()
+        index = SearchIndex(ROOT)
+        load_ms = (time.perf_counter() - t0) * 1000
+    except FileNotFoundError as e:
+        raise SystemExit(f"❌ {e.filename} not found; run build_search_index.py first")
+
+    t0 = time.perf_counter()
+    hits = index.search(query, top)
+    first_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        index.search(query, top)
+    warm_ms = (time.perf_counter() - t0) * 1000 / repeat if repeat else 0.0
+
+    terms = ", ".join(f"{lang}:{t}" for lang, t in query_terms(query)) or "(none)"
+    print(f"Query terms: {terms}")
+    for rank, (score, doc) in enumerate(hits, 1):
+        print(f"{rank:>3}. {score:7.3f}  {doc['id']:<20} {doc['title']}")
+    if not hits:
+        print("(no matches)")
+    print(f"\n{len(index.docs):,} lessons; manifest {load_ms:.1f} ms, first query {first_ms:.2f} ms "
+          f"({index.shards_loaded} shard(s) read)" + (f", warm {warm_ms:.3f} ms/query" if repeat else ""))
+    return 0 if hits else 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shards", type=int, default=0, help="number of hash shards (default: sized to ~32 KB each)")
+    ap.add_argument("--check", action="store_true", help="only verify the shards on disk")
+    ap.add_argument("--query", default=None, help="search the built index and exit")
+    ap.add_argument("--top", type=int, default=10, help="results to show for --query (default: 10)")
+    ap.add_argument("--repeat", type=int, default=0, help="re-run --query N times and report the warm latency")
+    args = ap.parse_args()
+
+    if args.query is not None:
+        return run_query(args.query, args.top, args.repeat)
+
+    if args.check:
+        try:
+            shards = SearchIndex(ROOT).meta["shards"]
+        except (FileNotFoundError, ValueError, KeyError) as e:
+            print(f"❌ {INDEX_REL}: {e}")
+            return 1
+        res = build_search_index(ROOT, shards=shards, dry_run=True)
+        problems = list(res.problems)
+        out_dir = ROOT / INDEX_REL
+        for name, text in res.files.items():
+            path = out_dir / name
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                problems.append(f"{INDEX_REL}/{name}: out of date (run scripts/build_search_index.py)")
+        for p in problems:
+            print(f"❌ {p}")
+        if not problems:
+            print(f"✅ {INDEX_REL} is in sync with the lessons")
+        return 1 if problems else 0
+
+    t0 = time.perf_counter()
+    res = build_search_index(ROOT, shards=args.shards)
+    elapsed = time.perf_counter() - t0
+    sizes = [len(t.encode("utf-8")) for n, t in res.files.items() if n.startswith("t")]
+    terms = {lang: sum(1 for k in res.postings if k.startswith(lang + ":")) for lang in ("en", "fa")}
+    print(f"Lessons indexed: {len(res.docs):,} in {elapsed:.2f}s")
+    print(f"Terms: {terms['en']:,} en, {terms['fa']:,} fa in {len(sizes)} shards, {sum(sizes):,} bytes "
+          f"(largest {max(sizes, default=0):,})")
+    for name in res.removed:
+        print(f"🗑️  Removed {INDEX_REL}/{name}")
+    for p in res.problems:
+        print(f"❌ {p}")
+    print(f"✅ {len(res.written)} file(s) written to {INDEX_REL}")
+    return 1 if res.problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build the per-lesson vocabulary bundles read by js/lesson.js.
+
+Each bundle holds the word profiles and word-context entries of one lesson's
+vocabularyDetailed words, so opening a lesson fetches tens of KB instead of
+whole word_profiles/<letter>.json shards. Lesson vocabularies are cached by
+file hash (.build/manifest.json) and only changed bundles are rewritten
+(see scripts/pipeline/vocabbundle.py for the format).
+
+Output:
+  assets/data/lesson_vocab/<lesson id>.json
+
+Usage:
+  python scripts/build_vocab_bundles.py
+  python scripts/build_vocab_bundles.py --check           # exit 1 if a bundle is stale
+  python scripts/build_vocab_bundles.py --show toefl-ax34-01
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from pipeline import ROOT, BuildManifest
+from pipeline.vocabbundle import BUNDLE_REL, build_bundles, check_bundles
+
+
+def print_summary(res) -> None:
+    print(f"Lessons: {res.lessons} ({res.parsed} parsed, {res.lessons - res.parsed} cached)")
+    print(f"Words: {res.words:,} ({res.resolved:,} with a profile, from {res.shards_read} profile shard(s))")
+    print(f"Bundles: {res.bytes:,} bytes (avg {res.bytes // max(res.lessons, 1):,}, largest {res.largest:,})")
+    for name in res.removed:
+        print(f"🗑️  Removed {BUNDLE_REL}/{name}")
+    for p in res.problems:
+        print(f"❌ {p}")
+    print(f"✅ {len(res.written)} bundle(s) written"
+          + (f": {', '.join(res.written)}" if 0 < len(res.written) <= 8 else ""))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--check", action="store_true", help="only verify the bundles on disk")
+    ap.add_argument("--no-cache", action="store_true", help="re-read every lesson")
+    ap.add_argument("--show", default="", help="print one lesson's bundle and exit")
+    args = ap.parse_args()
+
+    if args.show:
+        path = ROOT / BUNDLE_REL / f"{args.show}.json"
+        if not path.exists():
+            raise SystemExit(f"❌ {path.relative_to(ROOT)} not found; run build_vocab_bundles.py first")
+        bundle = json.loads(path.read_text(encoding="utf-8"))
+        print(json.dumps(bundle, ensure_ascii=False, indent=2))
+        missing = sorted(k for k, v in bundle["profiles"].items() if v is None)
+        print(f"({len(bundle['profiles'])} word(s), {path.stat().st_size:,} bytes"
+              + (f"; no profile: {', '.join(missing)}" if missing else "") + ")")
+        return 0
+
+    if args.check:
+        problems = check_bundles(ROOT)
+        for p in problems:
+            print(f"❌ {p}")
+        if not problems:
+            print(f"✅ {BUNDLE_REL} is in sync with the lessons and word_profiles")
+        return 1 if problems else 0
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    res = build_bundles(ROOT, manifest=manifest)
+    manifest.save()
+    print_summary(res)
+    return 1 if res.problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
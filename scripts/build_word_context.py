@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Build the sharded word-context index from the registry lessons.
+
+Each lesson's vocabulary items and collocations are extracted once and cached
+by file hash (.build/manifest.json), so after adding or editing a lesson only
+that lesson is parsed and only the shards whose keys changed are rewritten
+(see scripts/pipeline/wordctx.py for the format).
+
+Output:
+  assets/data/word_context/manifest.json
+  assets/data/word_context/sNN.json
+
+Usage:
+  python scripts/build_word_context.py
+  python scripts/build_word_context.py --shards 64
+  python scripts/build_word_context.py --check           # exit 1 if the shards are stale
+  python scripts/build_word_context.py --lookup navigate
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from pipeline import ROOT, BuildManifest
+from pipeline.wordctx import DEFAULT_SHARDS, INDEX_REL, MANIFEST_NAME, build_index, check_index, lookup
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shards", type=int, default=0,
+                    help=f"number of hash shards (default: keep the current count, else {DEFAULT_SHARDS})")
+    ap.add_argument("--check", action="store_true", help="only verify the shards on disk")
+    ap.add_argument("--no-cache", action="store_true", help="re-extract every lesson")
+    ap.add_argument("--lookup", default="", help="look up one word in the built shards and exit")
+    args = ap.parse_args()
+
+    if args.lookup:
+        try:
+            name, entry, lessons = lookup(ROOT, args.lookup)
+        except FileNotFoundError as e:
+            raise SystemExit(f"❌ {e.filename} not found; run build_word_context.py first")
+        if entry is not None:
+            entry = dict(entry, lessons=[lessons[i] for i in entry["lessons"]])
+        print(json.dumps(entry, ensure_ascii=False, indent=2))
+        print(f"(from {INDEX_REL}/{name})")
+        return 0 if entry is not None else 1
+
+    if args.check:
+        problems = check_index(ROOT)
+        for p in problems:
+            print(f"❌ {p}")
+        if not problems:
+            print(f"✅ {INDEX_REL} is in sync with the lessons")
+        return 1 if problems else 0
+
+    shards = args.shards
+    if shards <= 0:
+        try:
+            shards = json.loads((ROOT / INDEX_REL / MANIFEST_NAME).read_text(encoding="utf-8"))["shards"]
+        except (FileNotFoundError, ValueError, KeyError):
+            shards = DEFAULT_SHARDS
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    res = build_index(ROOT, shards=shards, manifest=manifest)
+    manifest.save()
+
+    print(f"Lessons indexed: {res.lessons} ({res.parsed} parsed, {res.lessons - res.parsed} cached)")
+    print(f"Keys: {res.keys:,} in {shards} shards, {res.bytes:,} bytes "
+          f"(avg {res.bytes // max(shards, 1):,}, largest {res.largest:,})")
+    for name in res.removed:
+        print(f"🗑️  Removed {INDEX_REL}/{name}")
+    for p in res.problems:
+        print(f"❌ {p}")
+    print(f"✅ {len(res.shards_written)} file(s) written"
+          + (f": {', '.join(res.shards_written)}" if 0 < len(res.shards_written) <= 8 else ""))
+    return 1 if res.problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
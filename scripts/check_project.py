@@ -1,21 +1,39 @@
 #!/usr/bin/env python3
-"""Static project checks (links, data references, WebP variants).
+"""Static project checks (links, data references, WebP variants and their sizes).
+
+Every check collects all of its problems (file + JSON pointer) instead of
+stopping at the first one; per-lesson checks run concurrently. The exit code
+is 1 if any error was found.
 
 Usage:
   python scripts/check_project.py
+  python scripts/check_project.py --json check-report.json   # machine-readable result ("-" = stdout)
+  python scripts/check_project.py --jobs 8
 """
 
 from __future__ import annotations
+import argparse
 import json
-import os
 import re
 import sys
+import time
 from pathlib import Path
 from html.parser import HTMLParser
 
+from pipeline import Corpus, Lesson, load_corpus
+from pipeline.imagemeta import ImageMeta, scan_images, sibling_issues, variant_issues
+from pipeline.lessonreports import SUMMARY_REL, render_outputs, scan_lessons
+from pipeline.precache import OUT_REL as PRECACHE_REL, is_current as precache_is_current
+from pipeline.scenes import render_js
+from pipeline.schema import validate_lesson, validate_registry
+from pipeline.validate import WARNING, FileIndex, Issue, ValidationReport, pointer, run_parallel
+from pipeline.vocabbundle import BUNDLE_REL, check_bundles
+from pipeline.wordctx import INDEX_REL as WORD_CONTEXT_REL, check_index
+
 ROOT = Path(__file__).resolve().parents[1]
 
 HTML_FILES = ["index.html", "lesson.html", "offline.html"]
+INDEXED_DIRS = ["assets/images", "assets/icons", "assets/data/lessons", "css", "js"]
 
 class LinkParser(HTMLParser):
     def __init__(self):
@@ -28,28 +46,6 @@ class LinkParser(HTMLParser):
                 if v and not v.startswith(("http://","https://","mailto:","tel:","data:")):
                     self.refs.append((k,v))
 
-def fail(msg: str) -> None:
-    print(f"❌ {msg}")
-    raise SystemExit(1)
-
-def warn(msg: str) -> None:
-    print(f"⚠️  {msg}")
-
-def ok(msg: str) -> None:
-    print(f"✅ {msg}")
-
-def file_exists(rel: str) -> bool:
-    # strip hash/query
-    rel = rel.split("#",1)[0].split("?",1)[0]
-    # normalize ./ paths
-    rel = rel[2:] if rel.startswith("./") else rel
-    p = (ROOT / rel).resolve()
-    try:
-        p.relative_to(ROOT.resolve())
-    except Exception:
-        return False
-    return p.exists()
-
 def derive_webp_variants(path: str) -> tuple[str,str] | None:
     # expecting ...-800.webp as base
     if path.endswith("-800.webp"):
@@ -58,184 +54,195 @@ def derive_webp_variants(path: str) -> tuple[str,str] | None:
         return (path.replace("-1600.webp","-800.webp"), path)
     return None
 
-def main() -> None:
-    # Basic files
-    for f in ["manifest.json","sw.js","assets/data/registry.json","VERSION","CHANGELOG.md"]:
-        if not (ROOT / f).exists():
-            fail(f"Missing required file: {f}")
-    ok("Core files present")
+def check_core_files() -> list[Issue]:
+    return [Issue("core-files", "required file missing", file=f)
+            for f in ["manifest.json","sw.js","precache-manifest.js","assets/data/registry.json","VERSION","CHANGELOG.md"]
+            if not (ROOT / f).exists()]
 
-    # HTML refs
-    missing = []
+def check_html_refs(files: FileIndex) -> list[Issue]:
+    issues = []
     for html in HTML_FILES:
         p = ROOT / html
         if not p.exists():
-            fail(f"Missing HTML file: {html}")
+            issues.append(Issue("html-refs", "HTML file missing", file=html))
+            continue
         parser = LinkParser()
         parser.feed(p.read_text(encoding="utf-8", errors="replace"))
         for attr,val in parser.refs:
-            # allow manifest, css, js, images, internal html
-            if val.startswith("/") and val != "/":
-                # absolute paths can break on subpath hosting; treat as warning
-                warn(f"{html}: absolute {attr}='{val}' (might break on subpath hosting)")
             if val == "/":
                 continue
             if val.startswith("/"):
-                # treat as existence relative to ROOT
-                val_check = val[1:]
-            else:
-                val_check = val
-            if val_check and not file_exists(val_check):
-                missing.append(f"{html}: {attr} -> {val}")
-    if missing:
-        fail("Missing file references:\n" + "\n".join(missing))
-    ok("HTML link/src references OK")
-
-    # Registry + lesson JSON existence and image WebP variants
-    reg = json.loads((ROOT / "assets/data/registry.json").read_text(encoding="utf-8"))
-    lessons = reg.get("lessons", [])
-    if not lessons:
-        fail("registry.json has no lessons")
-    ok(f"registry.json lessons: {len(lessons)}")
-
-    missing_data = []
-    missing_images = []
-    missing_webp = []
-    for item in lessons:
-        file_name = item.get("file")
-        if not file_name:
-            continue
-
-        # registry entries may store a full relative path (e.g. assets/data/lessons/xyz.json)
-        file_rel = str(file_name).lstrip("./")
-        if "/" in file_rel:
-            lp = ROOT / file_rel
-        else:
-            lp = ROOT / "assets/data/lessons" / file_rel
-
-        if not lp.exists():
-            missing_data.append(str(lp))
+                # absolute paths can break on subpath hosting; treat as warning
+                issues.append(Issue("html-refs", f"absolute {attr}='{val}' (might break on subpath hosting)",
+                                    file=html, severity=WARNING))
+            if not files.exists(val):
+                issues.append(Issue("html-refs", f"{attr} -> {val}: file not found", file=html))
+    return issues
+
+def check_registry(corpus: Corpus) -> list[Issue]:
+    reg = "assets/data/registry.json"
+    if corpus.registry_error:
+        return [Issue("registry", corpus.registry_error, file=reg)]
+    issues = validate_registry(corpus.registry, reg)
+    if not corpus.entries:
+        return issues
+    index = {id(e): i for i, e in enumerate(corpus.entries)}
+    return issues + [Issue("registry", f"lesson JSON file missing: {path.relative_to(corpus.root).as_posix()}",
+                  file=reg, pointer=pointer("lessons", index[id(entry)], "file"))
+            for entry, path in corpus.missing]
+
+def check_lesson(item: Lesson, files: FileIndex) -> list[Issue]:
+    """Lesson schema (pipeline/schema.py) and image references of one lesson."""
+    rel = item.rel
+    issues: list[Issue] = []
+
+    if not item.loaded:
+        issues.append(Issue("lesson", f"could not be parsed: {item.error}", file=rel))
+        return issues
+    data = item.data
+
+    issues.extend(validate_lesson(data, rel))
+
+    img_obj = data.get("image") if isinstance(data.get("image"), dict) else {}
+    # Image existence checks
+    for k in ("src800", "src1600"):
+        src = img_obj.get(k)
+        if not (isinstance(src, str) and src.strip()):
             continue
-
-        data = json.loads(lp.read_text(encoding="utf-8"))
-
-        # Content completeness checks (current schema)
-        img_obj = data.get("image") or {}
-        if not (isinstance(img_obj, dict) and isinstance(img_obj.get("alt"), str) and img_obj.get("alt").strip()):
-            fail(f"Lesson {lp.name} is missing image.alt")
-        for k in ("src800", "src1600"):
-            if not (isinstance(img_obj.get(k), str) and img_obj.get(k).strip()):
-                fail(f"Lesson {lp.name} is missing image.{k}")
-
-        desc = data.get("descriptions") or {}
-        if not (isinstance(desc, dict) and all(isinstance(desc.get(k), str) and desc.get(k).strip() for k in ("simple","intermediate","advanced"))):
-            fail(f"Lesson {lp.name} descriptions must include simple/intermediate/advanced text")
-
-        vocab = data.get("vocabularyDetailed")
-        if not (isinstance(vocab, list) and len(vocab) >= 35):
-            fail(f"Lesson {lp.name} must have vocabularyDetailed (>=35 items)")
-
-        ve = data.get("vocabularyExtended") or {}
-        phrases = ve.get("academicPhrases")
-        if not (isinstance(phrases, list) and len(phrases) >= 8):
-            fail(f"Lesson {lp.name} must have vocabularyExtended.academicPhrases (>=8)")
-
-        tf = data.get("toefl") or {}
-        sp = tf.get("speakingTasks")
-        if not (isinstance(sp, list) and len(sp) >= 3):
-            fail(f"Lesson {lp.name} must have at least 3 TOEFL speakingTasks")
-        else:
-            for ti, t in enumerate(sp):
-                if not (isinstance(t, dict) and isinstance(t.get("prompt"), str) and t.get("prompt").strip()):
-                    fail(f"Lesson {lp.name} speakingTasks #{ti+1} prompt missing")
-
-        wr = tf.get("writingTasks")
-        if not (isinstance(wr, list) and len(wr) >= 3):
-            fail(f"Lesson {lp.name} must have at least 3 TOEFL writingTasks")
-        else:
-            for ti, t in enumerate(wr):
-                if not (isinstance(t, dict) and isinstance(t.get("prompt"), str) and t.get("prompt").strip()):
-                    fail(f"Lesson {lp.name} writingTasks #{ti+1} prompt missing")
-
-        qs = tf.get("questions")
-        if not (isinstance(qs, list) and len(qs) >= 3):
-            fail(f"Lesson {lp.name} must have at least 3 TOEFL questions")
-        else:
-            for qi, q in enumerate(qs):
-                if not (isinstance(q, dict) and isinstance(q.get("question"), str) and q.get("question").strip()):
-                    fail(f"Lesson {lp.name} question #{qi+1} missing 'question'")
-                if not (isinstance(q.get("choices"), list) and len(q.get("choices")) >= 3):
-                    fail(f"Lesson {lp.name} question #{qi+1} needs choices (>=3)")
-                if not isinstance(q.get("answer"), int):
-                    fail(f"Lesson {lp.name} question #{qi+1} needs integer answer")
-
-        pr = data.get("practice")
-        if not isinstance(pr, dict):
-            fail(f"Lesson {lp.name} is missing practice block")
-
-        # Image existence checks
-        for k in ("src800", "src1600"):
-            rel = str(img_obj.get(k)).lstrip("./")
-            if rel and not (ROOT / rel).exists():
-                missing_images.append(rel)
-            variants = derive_webp_variants(rel)
-            if variants:
-                for v in variants:
-                    if not (ROOT / v).exists():
-                        missing_webp.append(v)
-
-    if missing_data:
-        fail("Missing lesson JSON files:\n" + "\n".join(missing_data))
-    ok("Lesson JSON files present")
-
-    if missing_images:
-        fail("Missing referenced images:\n" + "\n".join(missing_images))
-    ok("Referenced images present")
-
-    if missing_webp:
-        fail("Missing WebP variants (800/1600):\n" + "\n".join(sorted(set(missing_webp))))
-    ok("WebP variants present for referenced images")
-
-
-    # Placeholders (blurred data URIs)
-    ph_path = os.path.join(ROOT, 'assets', 'images', 'placeholders.json')
-    assert os.path.exists(ph_path), 'placeholders.json missing'
-    with open(ph_path, 'r', encoding='utf-8') as f:
-        ph = json.load(f).get('placeholders', {})
-    images_ref = [item.get('image') for item in lessons if item.get('image')]
-    missing_ph = [img for img in images_ref if img.endswith('-800.webp') and img not in ph]
-    assert not missing_ph, f'Missing placeholders for: {missing_ph[:5]}'
-    ok("placeholders.json present and covers referenced images")
-
-    # HTML structural sanity checks
-    check_html_structure()
-
-    print("\n🎉 All checks passed.")
-    return
-
-
-
-def check_html_structure():
-    import re
-    from pathlib import Path
-    html_files = ['index.html', 'lesson.html', 'offline.html']
-    for fn in html_files:
+        img = src.lstrip("./")
+        if not files.exists(img):
+            issues.append(Issue("images", f"referenced image missing: {img}", file=rel, pointer=pointer("image", k)))
+        for v in derive_webp_variants(img) or ():
+            if v != img and not files.exists(v):
+                issues.append(Issue("images", f"WebP variant missing: {v}", file=rel, pointer=pointer("image", k)))
+    return issues
+
+def check_placeholders(corpus: Corpus) -> list[Issue]:
+    """Placeholders (blurred data URIs) cover every registry image."""
+    rel = "assets/images/placeholders.json"
+    try:
+        ph = json.loads((ROOT / rel).read_text(encoding="utf-8")).get("placeholders", {})
+    except (OSError, ValueError) as e:
+        return [Issue("placeholders", f"cannot read placeholders ({e})", file=rel)]
+    return [Issue("placeholders", f"missing placeholder for {item['image']}", file="assets/data/registry.json",
+                  pointer=pointer("lessons", i, "image"))
+            for i, item in enumerate(corpus.entries)
+            if isinstance(item, dict) and str(item.get("image") or "").endswith("-800.webp") and item["image"] not in ph]
+
+def check_scene_rules() -> list[Issue]:
+    """js/scene-rules.js is generated from scripts/pipeline/scenes.py and must match it."""
+    p = ROOT / "js" / "scene-rules.js"
+    if not p.exists() or p.read_text(encoding="utf-8") != render_js():
+        return [Issue("scene-rules", "out of date (run scripts/emit_scene_rules.py)", file="js/scene-rules.js")]
+    return []
+
+def check_image_sizes(images: dict[str, ImageMeta]) -> list[Issue]:
+    """Variant widths and byte budgets, from the image headers (pipeline/imagemeta.py)."""
+    return [i for meta in images.values() for i in variant_issues(meta) + sibling_issues(meta, images)]
+
+def check_precache() -> list[Issue]:
+    """precache-manifest.js must list the current revisions, or clients keep stale files."""
+    if not precache_is_current(ROOT):
+        return [Issue("precache", "out of date (run scripts/gen_precache.py)", file=PRECACHE_REL)]
+    return []
+
+def _generated_issues(check: str, problems: list[str]) -> list[Issue]:
+    """``"<file>: <message>"`` problem strings from the pipeline ``check_*`` helpers as issues."""
+    return [Issue(check, msg, file=file) for file, _, msg in (p.partition(": ") for p in problems)]
+
+def check_lesson_reports() -> list[Issue]:
+    """registry_summary.json (index page cards) and the lesson reports are generated from the lessons."""
+    return [Issue("lesson-reports", "out of date (run scripts/gen_lesson_reports.py)", file=rel)
+            for rel, text in render_outputs(ROOT, scan_lessons(ROOT)).items()
+            if not (ROOT / rel).exists() or (ROOT / rel).read_text(encoding="utf-8") != text]
+
+def check_word_context() -> list[Issue]:
+    """The word_context shards are committed and deployed as-is, so they must match the lessons."""
+    return _generated_issues("word-context", check_index(ROOT))
+
+def check_vocab_bundles() -> list[Issue]:
+    """The lesson_vocab bundles are committed and deployed as-is, so they must match the lessons."""
+    return _generated_issues("vocab-bundles", check_bundles(ROOT))
+
+def check_html_structure() -> list[Issue]:
+    issues = []
+    for fn in HTML_FILES:
         p = ROOT / fn
+        if not p.exists():
+            continue
         txt = p.read_text(encoding='utf-8')
         # required mobile-web-app-capable meta
         if 'mobile-web-app-capable' not in txt:
-            raise SystemExit(f'❌ {fn}: missing <meta name="mobile-web-app-capable" content="yes">')
+            issues.append(Issue("html-structure", 'missing <meta name="mobile-web-app-capable" content="yes">', file=fn))
         # detect duplicate id attribute on same tag (simple heuristic)
         for m in re.finditer(r'<[^>]+\bid="[^\"]+"[^>]*\bid="[^\"]+"[^>]*>', txt, flags=re.I):
-            raise SystemExit(f'❌ {fn}: duplicate id attribute detected: {m.group(0)[:80]}...')
+            issues.append(Issue("html-structure", f"duplicate id attribute detected: {m.group(0)[:80]}...", file=fn))
     # lesson container exists
-    lesson_txt = (ROOT / 'lesson.html').read_text(encoding='utf-8')
-    if 'id="lessonContainer"' not in lesson_txt:
-        raise SystemExit('❌ lesson.html: missing #lessonContainer')
-    print('✅ HTML structure checks OK')
+    lp = ROOT / 'lesson.html'
+    if lp.exists() and 'id="lessonContainer"' not in lp.read_text(encoding='utf-8'):
+        issues.append(Issue("html-structure", "missing #lessonContainer", file="lesson.html"))
+    return issues
+
+def run_checks(corpus: Corpus, jobs: int | None = None) -> ValidationReport:
+    t0 = time.perf_counter()
+    report = ValidationReport()
+    files = FileIndex(ROOT, INDEXED_DIRS)
+    lessons = list(corpus.lessons)
+    t_img = time.perf_counter()
+    images = scan_images(ROOT, jobs=jobs)
+    t_img = time.perf_counter() - t_img
+    report.run("core-files", check_core_files, "Core files present")
+    report.run("html-refs", lambda: check_html_refs(files), "HTML link/src references OK")
+    report.run("registry", lambda: check_registry(corpus), f"registry.json lessons: {len(corpus.entries)}, lesson JSON files present")
+    lesson_issues = run_parallel(lessons, lambda item: check_lesson(item, files), jobs)
+    report.run("lesson", lambda: [i for i in lesson_issues if i.check in ("lesson", "schema")],
+               f"{len(lessons)} lesson(s) match the lesson schema")
+    report.run("images", lambda: [i for i in lesson_issues if i.check == "images"],
+               "Referenced images and WebP variants present")
+    report.run("image-size", lambda: check_image_sizes(images),
+               f"{len(images)} image header(s) read in {t_img * 1000:.0f} ms; variant widths and sizes OK")
+    report.run("placeholders", lambda: check_placeholders(corpus), "Placeholders cover every registry image")
+    report.run("scene-rules", check_scene_rules, "js/scene-rules.js matches the scene rules table")
+    report.run("precache", check_precache, f"{PRECACHE_REL} matches the shipped assets")
+    report.run("lesson-reports", check_lesson_reports, f"{SUMMARY_REL} and the lesson reports match the lessons")
+    report.run("word-context", check_word_context, f"{WORD_CONTEXT_REL} matches the registry lessons")
+    report.run("vocab-bundles", check_vocab_bundles, f"{BUNDLE_REL} matches the lessons and word_profiles")
+    report.run("html-structure", check_html_structure, "HTML structure checks OK")
+    report.elapsed = time.perf_counter() - t0
+    return report
+
+def print_report(report: ValidationReport, limit: int = 0) -> None:
+    for _, msg in report.passed:
+        print(f"✅ {msg}")
+    shown = report.issues if not limit else report.issues[:limit]
+    for i in shown:
+        icon = "⚠️ " if i.severity == WARNING else "❌"
+        where = i.location()
+        print(f"{icon} [{i.check}] {where + ': ' if where else ''}{i.message}")
+    if len(shown) < len(report.issues):
+        print(f"... and {len(report.issues) - len(shown)} more")
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--json", dest="json_out", default="", help="write the machine-readable result to a file ('-' = stdout)")
+    ap.add_argument("--jobs", "-j", type=int, default=None, help="worker threads for per-lesson checks")
+    ap.add_argument("--limit", type=int, default=0, help="print at most N issues (0 = all)")
+    args = ap.parse_args()
+
+    report = run_checks(load_corpus(ROOT), jobs=args.jobs)
+    if args.json_out == "-":
+        json.dump(report.to_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 1 if report.errors else 0
+    print_report(report, args.limit)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(report.to_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if report.errors:
+        print(f"\n❌ {len(report.errors)} error(s), {len(report.warnings)} warning(s) in {report.elapsed:.2f}s")
+        return 1
+    print(f"\n🎉 All checks passed.{f' ({len(report.warnings)} warning(s))' if report.warnings else ''}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
-
-
+    raise SystemExit(main())
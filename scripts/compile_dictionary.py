@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Compile assets/data/dict_letters/<letter>.json into compact .tdic shards.
+
+Each shard has a sorted key index, an offset table and a string-interned
+payload (see scripts/pipeline/dictbin.py), so one headword can be looked up
+without parsing the whole letter.
+
+Output:
+  assets/data/dict_bin/<letter>.tdic
+
+Usage:
+  python scripts/compile_dictionary.py
+  python scripts/compile_dictionary.py --letters a,s --verify
+  python scripts/compile_dictionary.py --lookup serendipity
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from pipeline import BuildManifest, hash_file
+from pipeline.dictbin import VERSION, DictShard, encode_shard
+from pipeline.jsonstream import iter_items
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "assets/data/dict_letters"
+OUT_DIR = ROOT / "assets/data/dict_bin"
+CACHE_NS = "dict_bin"
+
+
+def shard_path(letter: str, out_dir: Path = OUT_DIR) -> Path:
+    return out_dir / f"{letter}.tdic"
+
+
+def verify(src: Path, path: Path) -> None:
+    """Stream the JSON shard and compare every entry with the compiled one."""
+    n = 0
+    with DictShard.open(path) as shard:
+        for k, v in iter_items(src):
+            n += 1
+            if shard.get(k) != v:
+                raise SystemExit(f"❌ {path.name}: round-trip mismatch for {k!r}")
+        if len(shard) != n:
+            raise SystemExit(f"❌ {path.name}: {len(shard)} keys, expected {n}")
+
+
+def lookup(word: str, out_dir: Path) -> int:
+    key = word.strip().upper()
+    letter = key[:1].lower()
+    path = shard_path(letter, out_dir)
+    if not path.exists():
+        raise SystemExit(f"❌ No shard for {word!r} ({path}); run compile_dictionary.py first")
+    with DictShard.open(path) as shard:
+        entry = shard.get(key)
+        print(json.dumps({key: entry}, ensure_ascii=False, indent=2))
+        print(f"(read {shard.bytes_read:,} of {path.stat().st_size:,} bytes)")
+    return 0 if entry is not None else 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--letters", default="", help="comma-separated letters (default: all shards)")
+    ap.add_argument("--out", default=str(OUT_DIR), help="output directory")
+    ap.add_argument("--verify", action="store_true", help="decode every entry and compare with the JSON")
+    ap.add_argument("--no-cache", action="store_true", help="recompile even if the source is unchanged")
+    ap.add_argument("--lookup", default="", help="look up one headword in the compiled shards and exit")
+    args = ap.parse_args()
+
+    out_dir = Path(args.out)
+    if args.lookup:
+        return lookup(args.lookup, out_dir)
+
+    wanted = {s.strip().lower() for s in args.letters.split(",") if s.strip()}
+    sources = sorted(p for p in SRC_DIR.glob("*.json") if not wanted or p.stem in wanted)
+    if not sources:
+        raise SystemExit(f"❌ No dictionary shards found in {SRC_DIR}")
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    total_src = total_out = compiled = 0
+    for src in sources:
+        out = shard_path(src.stem, out_dir)
+        digest = f"{hash_file(src)}:v{VERSION}"
+        key = out.relative_to(ROOT).as_posix() if out.is_relative_to(ROOT) else str(out)
+        fresh = out.exists() and manifest.get(CACHE_NS, key, digest) is not None
+        if not fresh:
+            # the key index and string table need the whole letter at once
+            out.write_bytes(encode_shard(json.loads(src.read_text(encoding="utf-8"))))
+            manifest.put(CACHE_NS, key, digest, True)
+            compiled += 1
+        if args.verify:
+            verify(src, out)
+        src_size, out_size = src.stat().st_size, out.stat().st_size
+        total_src += src_size
+        total_out += out_size
+        print(f"{src.name:>8}  {src_size:>10,} -> {out_size:>10,} bytes  ({out_size / src_size:.0%})"
+              f"{'' if not fresh else '  (unchanged)'}")
+    manifest.save()
+
+    print(f"\n✅ {len(sources)} shard(s), {compiled} compiled: {total_src:,} -> {total_out:,} bytes "
+          f"({total_out / total_src:.0%}){'; verified' if args.verify else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
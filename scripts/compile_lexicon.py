@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compile assets/data/lexicon_updated.json into a minimized DAWG (.dawg).
+
+The word list is only used for membership ("is this a known word") and
+prefix lookups, both of which the DAWG answers directly
+(see scripts/pipeline/dawg.py).
+
+Output:
+  assets/data/lexicon_words.dawg
+
+Usage:
+  python scripts/compile_lexicon.py
+  python scripts/compile_lexicon.py --verify
+  python scripts/compile_lexicon.py --lookup serendipity
+  python scripts/compile_lexicon.py --prefix serend --limit 20
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import gzip
+import json
+import random
+from pathlib import Path
+
+from pipeline import BuildManifest, hash_file
+from pipeline.dawg import VERSION, Dawg, encode
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "assets/data/lexicon_updated.json"
+OUT = ROOT / "assets/data/lexicon_words.dawg"
+CACHE_NS = "lexicon_dawg"
+VERIFY_SAMPLES = 2000
+
+
+def load_words(src: Path) -> list[str]:
+    data = json.loads(src.read_text(encoding="utf-8"))
+    words = data.get("words") if isinstance(data, dict) else data
+    if not isinstance(words, list):
+        raise SystemExit(f"❌ {src.name}: expected a word list")
+    return sorted({w for w in words if isinstance(w, str) and w})
+
+
+def _brute_prefix(words: list[str], prefix: str, limit: int) -> list[str]:
+    out = []
+    for w in words[bisect.bisect_left(words, prefix):]:
+        if not w.startswith(prefix) or len(out) >= limit:
+            break
+        out.append(w)
+    return out
+
+
+def verify(words: list[str], path: Path) -> None:
+    """Full round-trip: enumeration, membership, non-members and prefix queries."""
+    dawg = Dawg.open(path)
+    if len(dawg) != len(words) or list(dawg) != words:
+        raise SystemExit(f"❌ {path.name}: enumeration differs from {SRC.name}")
+    missing = next((w for w in words if w not in dawg), None)
+    if missing is not None:
+        raise SystemExit(f"❌ {path.name}: {missing!r} is not found")
+
+    known = set(words)
+    rng = random.Random(0)
+    for _ in range(VERIFY_SAMPLES):
+        w = rng.choice(words)
+        cut = w[:rng.randint(0, len(w))]
+        for probe in (cut, cut + rng.choice(dawg.alphabet), w + "s", w[1:]):
+            if (probe in dawg) != (probe in known):
+                raise SystemExit(f"❌ {path.name}: membership of {probe!r} differs")
+        if dawg.prefix(cut, limit=50) != _brute_prefix(words, cut, 50):
+            raise SystemExit(f"❌ {path.name}: prefix({cut!r}) differs")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(OUT), help="output file")
+    ap.add_argument("--verify", action="store_true", help="round-trip the DAWG against the JSON word list")
+    ap.add_argument("--no-cache", action="store_true", help="recompile even if the source is unchanged")
+    ap.add_argument("--lookup", default="", help="check one word in the compiled DAWG and exit")
+    ap.add_argument("--prefix", default=None, help="list words starting with a prefix and exit")
+    ap.add_argument("--limit", type=int, default=20, help="max words for --prefix (default: 20)")
+    args = ap.parse_args()
+
+    out = Path(args.out)
+    if args.lookup or args.prefix is not None:
+        if not out.exists():
+            raise SystemExit(f"❌ {out} not found; run compile_lexicon.py first")
+        dawg = Dawg.open(out)
+        if args.lookup:
+            word = args.lookup.strip().lower()
+            found = word in dawg
+            print(f"{'✅' if found else '❌'} {word!r} {'is' if found else 'is not'} in the lexicon")
+            return 0 if found else 1
+        for w in dawg.prefix(args.prefix.strip().lower(), args.limit):
+            print(w)
+        return 0
+
+    if not SRC.exists():
+        raise SystemExit(f"❌ {SRC} not found")
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    digest = f"{hash_file(SRC)}:v{VERSION}"
+    key = out.relative_to(ROOT).as_posix() if out.is_relative_to(ROOT) else str(out)
+    fresh = out.exists() and manifest.get(CACHE_NS, key, digest) is not None
+    if not fresh or args.verify:
+        words = load_words(SRC)
+    if not fresh:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(encode(words))
+        manifest.put(CACHE_NS, key, digest, True)
+        manifest.save()
+    if args.verify:
+        verify(words, out)
+
+    src_size, out_size = SRC.stat().st_size, out.stat().st_size
+    src_gz = len(gzip.compress(SRC.read_bytes(), 9, mtime=0))
+    out_gz = len(gzip.compress(out.read_bytes(), 9, mtime=0))
+    print(f"{SRC.name}: {src_size:>10,} bytes  (gzip {src_gz:,})")
+    print(f"{out.name}: {out_size:>10,} bytes  (gzip {out_gz:,})  {src_size / out_size:.1f}x smaller raw, "
+          f"{src_gz / out_gz:.1f}x gzipped")
+    print(f"\n✅ {len(Dawg.open(out)):,} words {'unchanged' if fresh else 'compiled'}"
+          f"{'; verified' if args.verify else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
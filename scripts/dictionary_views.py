@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Generate the dictionary views from one canonical store.
+
+Canonical:  assets/data/dict_letters/*.json
+            assets/data/dictionary/profile_overrides.json
+Views:      assets/data/word_profiles/*.json      (committed, fetched by the site)
+            assets/data/dictionary/chunks/*.json  (build output for the Python tools, gitignored)
+
+Usage:
+  python scripts/dictionary_views.py            # verify views match the store + byte report
+  python scripts/dictionary_views.py --write    # regenerate the view files
+  python scripts/dictionary_views.py --extract  # refresh profile_overrides.json from the current views
+
+With no flags (check mode), exit code 1 if a view differs from the store.
+
+The site deploys straight from the repo, so word_profiles/ stays committed.
+Nothing on the site reads dictionary/chunks/, so it is built locally (and in CI
+before audit_dictionary.py); check mode skips it until it has been built.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from pipeline import write_text_if_changed
+from pipeline.dictstore import (
+    CHUNKS_DIR, LETTERS_DIR, OVERRIDES, PROFILES_DIR, ROOT,
+    extract_overrides, load_overrides, write_views,
+)
+
+
+def dir_size(d: Path) -> int:
+    return sum(p.stat().st_size for p in d.glob("*.json")) if d.exists() else 0
+
+
+def fmt(n: int) -> str:
+    return f"{n / 1e6:,.2f} MB"
+
+
+def report(views: list) -> None:
+    letters = dir_size(LETTERS_DIR)
+    overrides = OVERRIDES.stat().st_size if OVERRIDES.exists() else 0
+    profiles = sum(w.size for w in views if w.path.parent == PROFILES_DIR)
+    chunks = sum(w.size for w in views if w.path.parent == CHUNKS_DIR)
+    print("\nBytes:")
+    print(f"  canonical store            {fmt(letters + overrides)}  (dict_letters + {OVERRIDES.name})")
+    print(f"  word_profiles/             {fmt(profiles)}  (committed: the site fetches it)")
+    print(f"  dictionary/chunks/         {fmt(chunks)}  (build output, not committed)")
+    print(f"  committed                  {fmt(letters + overrides + profiles)}"
+          f"  ({fmt(chunks - overrides)} less than committing every layout)")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--write", action="store_true", help="regenerate word_profiles/ and dictionary/chunks/")
+    mode.add_argument("--extract", action="store_true", help="rebuild profile_overrides.json from the current views")
+    args = ap.parse_args()
+
+    if args.extract:
+        ov = extract_overrides()
+        text = json.dumps(ov, ensure_ascii=False, separators=(",", ":")) + "\n"
+        write_text_if_changed(OVERRIDES, text)
+        print(f"✅ {OVERRIDES.relative_to(ROOT)}: {len(ov['replace'])} replaced, "
+              f"{len(ov['extra'])} extra profiles ({fmt(len(text.encode('utf-8')))})")
+        return 0
+
+    chunks_built = any(CHUNKS_DIR.glob("*.json"))
+    views = write_views(load_overrides(), write=args.write)
+    changed = [w.path.relative_to(ROOT).as_posix() for w in views if w.changed]
+    # chunks that were never built are not stale, just absent
+    stale = [] if args.write else [rel for rel in changed if chunks_built or not rel.startswith(
+        CHUNKS_DIR.relative_to(ROOT).as_posix() + "/")]
+
+    if args.write:
+        print(f"✅ Views regenerated ({len(changed)} file(s) changed)")
+    elif stale:
+        print("❌ Views out of sync with the canonical store (run --write, or --extract after editing views):")
+        for s in stale:
+            print(f"   {s}")
+    elif chunks_built:
+        print("✅ word_profiles/ and dictionary/chunks/ match the canonical store")
+    else:
+        print("✅ word_profiles/ matches the canonical store (dictionary/chunks/ is not built; run --write)")
+    report(views)
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Emit js/scene-rules.js from the scene rules table in scripts/pipeline/scenes.py.
+
+js/collocation-generator.js classifies lessons with the same compiled pattern
+and rule table as scripts/generate_collocations.py, so edit the rules only in
+pipeline/scenes.py and re-run this script.
+
+Usage:
+  python scripts/emit_scene_rules.py
+  python scripts/emit_scene_rules.py --check   # exit 1 if js/scene-rules.js is stale
+"""
+from __future__ import annotations
+
+import argparse
+
+from pipeline import ROOT, write_text_if_changed
+from pipeline.scenes import render_js
+
+OUT = ROOT / "js" / "scene-rules.js"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--check", action="store_true", help="only verify that js/scene-rules.js is up to date")
+    args = ap.parse_args()
+
+    text = render_js()
+    rel = OUT.relative_to(ROOT)
+    if args.check:
+        current = OUT.read_text(encoding="utf-8") if OUT.exists() else ""
+        if current != text:
+            print(f"❌ {rel} is out of date (run scripts/emit_scene_rules.py)")
+            return 1
+        print(f"✅ {rel} matches scripts/pipeline/scenes.py")
+        return 0
+    state = "Wrote" if write_text_if_changed(OUT, text) else "Unchanged"
+    print(f"✅ {state} {rel}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
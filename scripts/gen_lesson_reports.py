@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Generate the lesson integrity and Persian-mixing reports and the registry summary.
+
+Scans every registry lesson (section sizes, and every bilingual {en, fa}
+field for fa text that is still largely English). Per-lesson results are
+cached by file hash (.build/manifest.json), so after editing one lesson only
+that lesson is parsed again (see scripts/pipeline/lessonreports.py).
+
+Output:
+  assets/data/lesson_integrity_report.json
+  assets/data/lesson_fa_mixed_report.json
+  assets/data/registry_summary.json      (card stats for the index page)
+
+Usage:
+  python scripts/gen_lesson_reports.py
+  python scripts/gen_lesson_reports.py --check          # exit 1 if an output is stale
+  python scripts/gen_lesson_reports.py --threshold 0.5  # only fields that are mostly English
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+
+from pipeline import ROOT, BuildManifest, write_text_if_changed
+from pipeline.lessonreports import MIXED_RATIO, render_outputs, scan_lessons
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--check", action="store_true", help="only verify that the reports and the summary are up to date")
+    ap.add_argument("--threshold", type=float, default=MIXED_RATIO,
+                    help=f"flag fa text whose Latin letter share is at least this (default: {MIXED_RATIO})")
+    ap.add_argument("--no-cache", action="store_true", help="re-scan every lesson")
+    ap.add_argument("--top", type=int, default=5, help="most frequently mixed fields to list")
+    args = ap.parse_args()
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    res = scan_lessons(ROOT, manifest, args.threshold)
+    manifest.save()
+
+    outputs = render_outputs(ROOT, res)
+    for p in res.problems:
+        print(f"❌ {p}")
+    if args.check:
+        stale = [rel for rel, text in outputs.items()
+                 if not (ROOT / rel).exists() or (ROOT / rel).read_text(encoding="utf-8") != text]
+        for rel in stale:
+            print(f"❌ {rel} is out of date (run scripts/gen_lesson_reports.py)")
+        if not stale:
+            print("✅ Lesson reports and registry summary match the lessons")
+        return 1 if stale or res.problems else 0
+
+    print(f"Lessons scanned: {res.lessons} ({res.parsed} parsed, {res.lessons - res.parsed} cached)")
+    print(f"Mixed fa fields: {res.fields} in {len(res.mixed)} lesson(s) (Latin share >= {args.threshold:g})")
+    by_field = Counter(f["field"].split("[", 1)[0].split(".", 1)[0] for l in res.mixed for f in l["fields"])
+    for name, n in by_field.most_common(args.top):
+        print(f"  {n:>5}  {name}")
+    for rel, text in outputs.items():
+        print(f"✅ {'Wrote' if write_text_if_changed(ROOT / rel, text) else 'Unchanged'} {rel}")
+    return 1 if res.problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,20 +7,44 @@ Output:
 
 Usage:
   python scripts/gen_placeholders.py
+  python scripts/gen_placeholders.py --all --jobs 8
+  python scripts/gen_placeholders.py --no-cache
+  python scripts/gen_placeholders.py --profile=prod   # also write a minified copy to dist/
+
+By default only registry images are (re)generated; --all covers every raster
+image under assets/images. Images are encoded across a process pool (--jobs,
+default: all cores) and the output is sorted by path, so it is identical
+whatever the job count.
+
+Images whose content hash matches .build/manifest.json reuse their existing
+placeholder instead of being decoded and blurred again, and placeholders.json
+is only rewritten when a placeholder actually changed.
 """
 from __future__ import annotations
+import argparse
 import base64
 import io
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageFilter
 
+from pipeline import BuildManifest, hash_file, write_text_if_changed
+from pipeline.dist import PROFILES, DistWriter, print_report
+
 ROOT = Path(__file__).resolve().parents[1]
 REGISTRY = ROOT / "assets/data/registry.json"
+IMAGES_DIR = ROOT / "assets/images"
 OUT = ROOT / "assets/images/placeholders.json"
+CACHE_NS = "placeholders"
+RASTER_EXTS = (".webp", ".png", ".jpg", ".jpeg")
 
-def tiny_blur_webp(path: Path, width: int = 24) -> str:
+WIDTH = 24
+QUALITY = 40
+
+def tiny_blur_webp(path: Path, width: int = WIDTH, method: int = 6) -> str:
     img = Image.open(path).convert("RGB")
     w, h = img.size
     if w == 0 or h == 0:
@@ -28,31 +52,100 @@ def tiny_blur_webp(path: Path, width: int = 24) -> str:
     new_h = max(1, int(h * (width / w)))
     img = img.resize((width, new_h), Image.LANCZOS).filter(ImageFilter.GaussianBlur(2))
     buf = io.BytesIO()
-    img.save(buf, format="WEBP", quality=40, method=6)
+    img.save(buf, format="WEBP", quality=QUALITY, method=method)
     b64 = base64.b64encode(buf.getvalue()).decode("ascii")
     return "data:image/webp;base64," + b64
 
-def main() -> int:
+def _encode(job: tuple[str, int]) -> tuple[str, str | None, str | None]:
+    """Process-pool worker: (src, method) -> (src, data URI, error)."""
+    src, method = job
+    try:
+        return src, tiny_blur_webp(ROOT / src, method=method), None
+    except Exception as e:
+        return src, None, str(e)
+
+def registry_images() -> list[str]:
     reg = json.loads(REGISTRY.read_text(encoding="utf-8"))
     lessons = reg["lessons"] if isinstance(reg, dict) else reg
-    mapping = {}
-    missing = []
+    out = []
     for item in lessons:
-        src = (item.get("image") or "").lstrip("./")
-        if not src:
-            continue
-        p = ROOT / src
-        if not p.exists():
-            missing.append(src)
-            continue
-        try:
-            mapping[src] = tiny_blur_webp(p)
-        except Exception as e:
-            raise SystemExit(f"Failed placeholder for {src}: {e}")
+        # registry schemas: legacy `image`, current `image800`
+        src = (item.get("image") or item.get("image800") or "").lstrip("./")
+        if src and src not in out:
+            out.append(src)
+    return out
+
+def all_images() -> list[str]:
+    return sorted(
+        p.relative_to(ROOT).as_posix()
+        for p in IMAGES_DIR.rglob("*")
+        if p.is_file() and p.suffix.lower() in RASTER_EXTS
+    )
+
+def load_existing() -> dict[str, str]:
+    try:
+        return json.loads(OUT.read_text(encoding="utf-8")).get("placeholders", {})
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--all", action="store_true", help="cover every raster image under assets/images, not only registry images")
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    ap.add_argument("--method", type=int, default=6, choices=range(7), help="WebP encoder effort 0-6 (default: 6)")
+    ap.add_argument("--no-cache", action="store_true", help="re-encode every image, ignoring .build/manifest.json")
+    ap.add_argument("--profile", choices=PROFILES, default="dev", help="prod: also write a minified copy to dist/")
+    args = ap.parse_args()
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    existing = load_existing()
+    selected = registry_images()
+    if args.all:
+        selected = sorted(set(selected) | set(all_images()))
+
+    missing = [src for src in selected if not (ROOT / src).exists()]
     if missing:
         raise SystemExit("Missing referenced images:\n" + "\n".join(missing))
-    OUT.write_text(json.dumps({"placeholders": mapping}, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"✅ Wrote {OUT} ({len(mapping)} placeholders)")
+
+    # Entries outside the selection are kept as long as their image still exists.
+    mapping = {k: v for k, v in existing.items() if k not in selected and (ROOT / k).exists()}
+
+    todo = []
+    digests = {}
+    for src in selected:
+        # Encoder settings are part of the key so changing them invalidates the cache.
+        digests[src] = f"{hash_file(ROOT / src)}:w{WIDTH}q{QUALITY}m{args.method}"
+        if manifest.get(CACHE_NS, src, digests[src]) is not None and src in existing:
+            mapping[src] = existing[src]
+        else:
+            todo.append((src, args.method))
+
+    jobs = max(1, min(args.jobs, len(todo)))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_encode, todo, chunksize=max(1, len(todo) // (jobs * 4))))
+    else:
+        results = [_encode(job) for job in todo]
+
+    failed = [f"{src}: {err}" for src, _, err in results if err]
+    if failed:
+        raise SystemExit("Failed placeholders:\n" + "\n".join(failed))
+    for src, uri, _ in results:
+        mapping[src] = uri
+        manifest.put(CACHE_NS, src, digests[src], True)
+
+    if args.all:
+        manifest.prune(CACHE_NS)
+    manifest.save()
+    ordered = {k: mapping[k] for k in sorted(mapping)}
+    changed = write_text_if_changed(OUT, json.dumps({"placeholders": ordered}, ensure_ascii=False, indent=2))
+    state = "Wrote" if changed else "Unchanged"
+    print(f"✅ {state} {OUT} ({len(ordered)} placeholders, {len(todo)} re-encoded with {jobs} job(s))")
+    if args.profile == "prod":
+        writer = DistWriter(ROOT)
+        writer.emit(OUT)
+        writer.close()
+        print_report(writer.results, root=ROOT)
     return 0
 
 if __name__ == "__main__":
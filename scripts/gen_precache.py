@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Generate precache-manifest.js (URLs + content revisions) for sw.js.
+
+The precache list is every top-level page, the local CSS/JS they reference
+and the data files/icons in scripts/pipeline/precache.py. After a release the
+service worker re-downloads only the entries whose revision changed.
+
+Usage:
+  python scripts/gen_precache.py
+  python scripts/gen_precache.py --check               # exit 1 if precache-manifest.js is stale
+  python scripts/gen_precache.py --budget 256 --strict # KB per file; over budget = exit 1
+"""
+from __future__ import annotations
+
+import argparse
+
+from pipeline import ROOT, write_text_if_changed
+from pipeline.precache import DEFAULT_BUDGET, DEFAULT_TOTAL_BUDGET, OUT_REL, PrecacheEntry, budget_warnings, generate
+
+
+def print_report(entries: list[PrecacheEntry], top: int) -> None:
+    total = sum(e.size for e in entries)
+    print(f"Precache: {len(entries)} file(s), {total / 1024:,.0f} KB")
+    for e in sorted(entries, key=lambda e: -e.size)[:top]:
+        print(f"  {e.size / 1024:>8,.0f} KB  {e.url}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--check", action="store_true", help=f"only verify that {OUT_REL} is up to date")
+    ap.add_argument("--budget", type=int, default=DEFAULT_BUDGET // 1024, help="per-file size budget in KB")
+    ap.add_argument("--total-budget", type=int, default=DEFAULT_TOTAL_BUDGET // 1024, help="total size budget in KB")
+    ap.add_argument("--strict", action="store_true", help="exit 1 when a budget is exceeded")
+    ap.add_argument("--top", type=int, default=5, help="largest precached files to list")
+    args = ap.parse_args()
+
+    text, entries, missing = generate(ROOT)
+    out = ROOT / OUT_REL
+    for m in missing:
+        print(f"⚠️  Not precached, file missing: {m}")
+    if args.check:
+        current = out.read_text(encoding="utf-8") if out.exists() else ""
+        if current != text:
+            print(f"❌ {OUT_REL} is out of date (run scripts/gen_precache.py)")
+            return 1
+        print(f"✅ {OUT_REL} matches the shipped assets")
+        return 0
+
+    state = "Wrote" if write_text_if_changed(out, text) else "Unchanged"
+    print_report(entries, args.top)
+    warnings = budget_warnings(entries, args.budget * 1024, args.total_budget * 1024)
+    for w in warnings:
+        print(f"⚠️  Over budget: {w}")
+    print(f"✅ {state} {OUT_REL}")
+    return 1 if warnings and args.strict else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
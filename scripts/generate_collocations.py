@@ -13,6 +13,13 @@ Run:
 Options:
   --dry-run   : don't write files, only print summary
   --keep      : keep existing collocations if they already match the generated set (same IDs)
+  --fill-missing : only fill lessons that have no collocations (hand-written ones are kept;
+                   this is what scripts/build.py does)
+  --no-cache  : ignore .build/manifest.json and reprocess every lesson
+  --profile=prod : also write minified copies of the lessons and index to dist/
+
+Only lessons whose generated collocations differ are rewritten (and get a new
+updatedAt); collocations_index.json is left alone when its entries are unchanged.
 """
 
 from __future__ import annotations
@@ -25,6 +32,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
+from pipeline import BuildManifest, Corpus, hash_file, load_corpus, write_text_if_changed
+from pipeline.dist import PROFILES, DistWriter, print_report
+from pipeline.scenes import classify_scene
+
 BLACK_FA = {"فعل/عمل", "موضوع/مفهوم", "شیء/وسیله"}
 
 def slugify(s: str) -> str:
@@ -34,74 +45,9 @@ def slugify(s: str) -> str:
     s = re.sub(r"-{2,}", "-", s).strip("-")
     return (s[:64] or "item")
 
-def norm(s: str) -> str:
-    return (s or "").lower()
-
 def classify(lesson: Dict[str, Any]) -> str:
-    a = lesson.get("analysis") or {}
-    parts = []
-    for k in ("place", "fullDescription"):
-        if lesson.get(k): parts.append(str(lesson.get(k)))
-    for k in ("setting", "settingFa", "mood", "moodFa"):
-        if a.get(k): parts.append(str(a.get(k)))
-    for k in ("objects", "themes"):
-        v = a.get(k)
-        if isinstance(v, list):
-            parts.extend([str(x) for x in v if x])
-    t = norm(" | ".join(parts))
-
-    # Urban (specific first)
-    if re.search(r"(subway|metro|underground|station|platform|turnstile)", t) and re.search(r"(exit|stairs|escalator)", t):
-        return "subway-exit"
-    if re.search(r"(public transport|carriage|train car|subway car|bus interior|inside a bus|inside a train)", t):
-        return "public-transport"
-    if re.search(r"(bus stop|timetable|schedule|route)", t):
-        return "bus-stop"
-    if re.search(r"(crosswalk|marked crosswalk|intersection|traffic light)", t):
-        return "city-crosswalk"
-    if re.search(r"(outdoor caf|cafe|coffee shop)", t) and re.search(r"(street|sidewalk|urban|city)", t):
-        return "outdoor-cafe"
-    if re.search(r"(shopping street|storefront|shop window|boutique|sale|market)", t):
-        return "urban-shopping"
-    if re.search(r"(rooftop|skyline|city view|elevated urban)", t) and re.search(r"(sunset|dusk|evening)", t):
-        return "rooftop-sunset"
-    if re.search(r"(sidewalk|bicycles|bike|cafés|cafe)", t) and re.search(r"(city|urban)", t):
-        return "city-sidewalk"
-    if re.search(r"(busy city street|urban street|city street|downtown)", t):
-        return "city-street"
-
-    # Nature (specific first)
-    if re.search(r"(dark forest|night forest|flashlight)", t):
-        return "forest-night"
-    if re.search(r"(rapids|whitewater|strong current|fast-flowing|rushing water|torrent)", t):
-        return "river-rapids"
-    if re.search(r"(coastal cliff|cliff|coastline)", t) and re.search(r"(sunset|dusk)", t):
-        return "coastal-cliff"
-    if re.search(r"(beach|shoreline|ocean|waves)", t):
-        return "beach"
-    if re.search(r"(winter|snowfall|snow|icy|blizzard)", t):
-        return "winter-snow"
-    if re.search(r"(desert|dunes|sand dune)", t):
-        return "desert-dunes"
-    if re.search(r"(high mountain|cliffs|altitude|harness|climbing)", t):
-        return "mountain-cliffs"
-    if re.search(r"(mountain valley|valley|snow-capped|scenic trail|breathtaking)", t):
-        return "mountain-valley"
-    if re.search(r"(lake|overlook|horizon|golden hour)", t) and re.search(r"(sunset|dusk)", t):
-        return "lake-sunset"
-
-    if re.search(r"(campsite|camp site|tent|string lights|campfire)", t) and re.search(r"(star|night)", t):
-        return "campsite-night"
-    if re.search(r"(campsite|camp site|tent|string lights|campfire)", t):
-        return "campsite"
-    if re.search(r"(park|walking paths|bench)", t):
-        return "park"
-    if re.search(r"(office|workspace|desk|computer)", t):
-        return "office"
-    if re.search(r"(forest|woodland|trail|path)", t):
-        return "forest-day"
-
-    return "general"
+    """Scene category of a lesson (rules table in pipeline/scenes.py, shared with js/scene-rules.js)."""
+    return classify_scene(lesson)
 
 
 TEMPLATES: Dict[str, List[Tuple[str,str]]] = {
@@ -347,48 +293,68 @@ TEMPLATES: Dict[str, List[Tuple[str,str]]] = {
   ],
 }
 
-def generate_for_lesson(lesson: Dict[str, Any]) -> List[Dict[str, str]]:
-    cat = classify(lesson)
+def generate_for_lesson(lesson: Dict[str, Any], cat: str | None = None) -> List[Dict[str, str]]:
+    cat = cat or classify(lesson)
     tpl = TEMPLATES.get(cat) or TEMPLATES["general"]
     out = []
     for en, fa in tpl:
         out.append({"id": slugify(en), "en": en, "fa": fa})
     return out
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--dry-run", action="store_true")
-    ap.add_argument("--keep", action="store_true", help="keep existing collocations if already matching generated ids")
-    args = ap.parse_args()
+CACHE_NS = "collocations"
+# Any edit to this file (templates) or to the scene rules invalidates cached lesson results.
+GENERATOR_HASH = hash_file(Path(__file__)) + hash_file(Path(__file__).parent / "pipeline" / "scenes.py")
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00","Z")
 
-    root = Path(__file__).resolve().parents[1]
-    lessons_dir = root / "assets" / "data" / "lessons"
-    idx_path = root / "assets" / "data" / "collocations_index.json"
+def _digest(lesson: Any, fill_missing: bool) -> str:
+    # the mode is part of the key: a lesson skipped in fill-only mode is not "done" for a full run
+    return lesson.digest + GENERATOR_HASH + (":fill" if fill_missing else "")
 
-    lesson_files = sorted([p for p in lessons_dir.glob("toefl-ax34-*.json")])
+def apply_collocations(corpus: Corpus, keep: bool = False, manifest: BuildManifest | None = None,
+                       fill_missing: bool = False) -> Dict[str, Any]:
+    """Regenerate collocations for every ax34 lesson in ``corpus`` in memory.
+
+    With ``fill_missing`` only lessons without any collocations get the
+    generated set; existing (hand-written) collocations are left alone.
+
+    Lessons whose collocations actually change are marked dirty (and get a
+    fresh ``updatedAt``); the caller decides whether to save them. With a
+    ``manifest``, lessons whose content hash is unchanged since the last run
+    are not reclassified. Returns the rebuilt index object and counters.
+    """
+    lessons = corpus.glob("toefl-ax34-*.json")
     updated = 0
-    generated_count = 0
+    cached = 0
+    categories: Dict[str, str] = {}
     idx_entries: List[Dict[str, Any]] = []
 
-    for p in lesson_files:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        lesson_id = data.get("id") or p.stem
+    for lesson in lessons:
+        data = lesson.data
+        lesson_id = data.get("id") or lesson.path.stem
 
-        gen = generate_for_lesson(data)
-        gen_ids = [x["id"] for x in gen]
-        existing = data.get("collocations") if isinstance(data.get("collocations"), list) else []
-        existing_ids = [x.get("id") for x in existing if isinstance(x, dict)]
+        hit = manifest.get(CACHE_NS, lesson.rel, _digest(lesson, fill_missing)) if manifest else None
+        if hit is not None:
+            category = hit["category"]
+            cached += 1
+        else:
+            category = classify(data)
+            gen = generate_for_lesson(data, category)
+            gen_ids = [x["id"] for x in gen]
+            existing = data.get("collocations") if isinstance(data.get("collocations"), list) else []
+            existing_ids = [x.get("id") for x in existing if isinstance(x, dict)]
 
-        should_write = True
-        if args.keep and existing_ids and existing_ids == gen_ids:
-            should_write = False
+            should_write = existing != gen and not (fill_missing and existing)
+            if keep and existing_ids and existing_ids == gen_ids:
+                should_write = False
 
-        if should_write:
-            data["collocations"] = gen
-            data["updatedAt"] = datetime.now(timezone.utc).isoformat().replace("+00:00","Z")
-            updated += 1
-            if not args.dry_run:
-                p.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            if should_write:
+                data["collocations"] = gen
+                data["updatedAt"] = _now()
+                lesson.mark_dirty()
+                updated += 1
+        categories[lesson.rel] = category
 
         # Build index entries
         for c in (data.get("collocations") or []):
@@ -401,20 +367,50 @@ def main():
                 "en": en,
                 "fa": fa,
                 "lesson": lesson_id,
-                "category": classify(data),
+                "category": category,
             })
-            generated_count += 1
 
-    # write index
     idx_obj = {
-        "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00","Z"),
+        "generatedAt": _now(),
         "entries": idx_entries,
     }
-    if not args.dry_run:
-        idx_path.write_text(json.dumps(idx_obj, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return {"processed": len(lessons), "updated": updated, "cached": cached,
+            "categories": categories, "index": idx_obj, "fill_missing": fill_missing}
 
-    print(f"Lessons processed: {len(lesson_files)}")
-    print(f"Lessons updated: {updated} (dry_run={args.dry_run})")
+def remember(corpus: Corpus, manifest: BuildManifest, result: Dict[str, Any]) -> None:
+    """Record per-lesson results; call after the corpus has been saved."""
+    for rel, category in result["categories"].items():
+        lesson = corpus.by_path[(corpus.root / rel).resolve()]
+        manifest.put(CACHE_NS, rel, _digest(lesson, result["fill_missing"]), {"category": category})
+    manifest.prune(CACHE_NS)
+
+def index_path(root: Path) -> Path:
+    return root / "assets" / "data" / "collocations_index.json"
+
+def emit_dist(corpus: Corpus, result: Dict[str, Any]) -> None:
+    """Write minified dist copies of every processed lesson and the index."""
+    writer = DistWriter(corpus.root)
+    for rel in result["categories"]:
+        writer.emit(corpus.root / rel)
+    writer.emit(index_path(corpus.root))
+    writer.close()
+    print_report(writer.results, root=corpus.root, top=5)
+
+def write_index(root: Path, idx_obj: Dict[str, Any]) -> bool:
+    """Write collocations_index.json; keep the old file (and its generatedAt) if entries are unchanged."""
+    idx_path = index_path(root)
+    try:
+        old = json.loads(idx_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        old = None
+    if isinstance(old, dict) and old.get("entries") == idx_obj["entries"]:
+        return False
+    return write_text_if_changed(idx_path, json.dumps(idx_obj, ensure_ascii=False, indent=2) + "\n")
+
+def print_summary(result: Dict[str, Any], dry_run: bool) -> None:
+    idx_entries = result["index"]["entries"]
+    print(f"Lessons processed: {result['processed']} (unchanged since last build: {result['cached']})")
+    print(f"Lessons updated: {result['updated']} (dry_run={dry_run})")
     print(f"Index entries: {len(idx_entries)}")
     # quick duplicate report (same id across lessons)
     from collections import Counter
@@ -424,5 +420,26 @@ def main():
     if dups[:10]:
         print("Examples:", ", ".join(dups[:10]))
 
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--keep", action="store_true", help="keep existing collocations if already matching generated ids")
+    ap.add_argument("--fill-missing", action="store_true", help="only fill lessons that have no collocations")
+    ap.add_argument("--no-cache", action="store_true", help="ignore the build manifest and reprocess every lesson")
+    ap.add_argument("--profile", choices=PROFILES, default="dev", help="prod: also write minified copies to dist/")
+    args = ap.parse_args()
+
+    corpus = load_corpus()
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    result = apply_collocations(corpus, keep=args.keep, manifest=manifest, fill_missing=args.fill_missing)
+    if not args.dry_run:
+        corpus.save()
+        write_index(corpus.root, result["index"])
+        remember(corpus, manifest, result)
+        manifest.save()
+    print_summary(result, args.dry_run)
+    if args.profile == "prod" and not args.dry_run:
+        emit_dist(corpus, result)
+
 if __name__ == "__main__":
     main()
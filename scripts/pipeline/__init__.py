@@ -0,0 +1,24 @@
+"""Shared build pipeline for the lesson dataset.
+
+Scripts in ``scripts/`` load the lesson corpus through ``load_corpus`` so that
+``scripts/build.py`` can run generation, validation and report stages over a
+single in-memory model instead of each script re-reading every lesson.
+"""
+
+from __future__ import annotations
+
+from .cache import BuildManifest, hash_bytes, hash_file, write_bytes_if_changed, write_text_if_changed
+from .corpus import ROOT, Corpus, Lesson, load_corpus, resolve_lesson_path
+
+__all__ = [
+    "ROOT",
+    "BuildManifest",
+    "Corpus",
+    "Lesson",
+    "hash_bytes",
+    "hash_file",
+    "load_corpus",
+    "resolve_lesson_path",
+    "write_bytes_if_changed",
+    "write_text_if_changed",
+]
@@ -0,0 +1,111 @@
+"""Content-hash build manifest for incremental builds.
+
+The manifest (``.build/manifest.json``, git-ignored) remembers, per stage
+namespace, the content hash of each input (lesson JSON, image, ...) and a
+small cached result derived from it. A stage asks ``manifest.get(ns, key,
+digest)``; a hit means the input is unchanged since the last run and the
+cached result can be reused without reprocessing.
+
+``write_text_if_changed`` is the other half: outputs are only rewritten when
+their bytes actually differ, so a no-op rebuild leaves the tree untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = Path(__file__).resolve().parents[2] / ".build" / "manifest.json"
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` to ``path`` unless the file already holds exactly it."""
+    return write_bytes_if_changed(path, text.encode("utf-8"))
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds exactly it."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+class BuildManifest:
+    def __init__(self, path: Path = DEFAULT_MANIFEST):
+        self.path = Path(path)
+        self.entries: dict[str, dict[str, dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen: dict[str, set[str]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MANIFEST) -> "BuildManifest":
+        m = cls(path)
+        try:
+            raw = json.loads(m.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return m
+        if isinstance(raw, dict) and raw.get("version") == MANIFEST_VERSION:
+            entries = raw.get("entries")
+            if isinstance(entries, dict):
+                m.entries = entries
+        return m
+
+    def get(self, ns: str, key: str, digest: str) -> Any | None:
+        """Cached result for ``key`` if its input hash is still ``digest``."""
+        self._seen.setdefault(ns, set()).add(key)
+        rec = self.entries.get(ns, {}).get(key)
+        if rec is not None and rec.get("hash") == digest:
+            self.hits += 1
+            return rec.get("result")
+        self.misses += 1
+        return None
+
+    def put(self, ns: str, key: str, digest: str, result: Any = None) -> None:
+        self._seen.setdefault(ns, set()).add(key)
+        bucket = self.entries.setdefault(ns, {})
+        rec = {"hash": digest, "result": result}
+        if bucket.get(key) != rec:
+            bucket[key] = rec
+            self._dirty = True
+
+    def prune(self, ns: str) -> int:
+        """Drop entries in ``ns`` that were not looked up during this run."""
+        seen = self._seen.get(ns, set())
+        bucket = self.entries.get(ns, {})
+        stale = [k for k in bucket if k not in seen]
+        for k in stale:
+            del bucket[k]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self) -> bool:
+        if not self._dirty:
+            return False
+        text = json.dumps({"version": MANIFEST_VERSION, "entries": self.entries},
+                          ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        write_text_if_changed(self.path, text + "\n")
+        self._dirty = False
+        return True
@@ -0,0 +1,184 @@
+"""Precompressed ``.gz`` / ``.br`` siblings for static data artifacts.
+
+Every artifact ``foo.json`` gets ``foo.json.gz`` (gzip level 9) and, when the
+optional ``brotli`` package is installed, ``foo.json.br`` (quality 11), so a
+CDN or ``gzip_static``-style server can send precompressed bytes instead of
+compressing on every request.
+
+Output is deterministic (no gzip timestamp or file name), and a sibling that
+would not be smaller than its source is not written. Sources whose content
+hash matches ``.build/manifest.json`` and whose siblings are still on disk
+are skipped without being recompressed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from .cache import BuildManifest, hash_file, write_bytes_if_changed
+from .corpus import ROOT
+
+try:  # optional: pip install brotli
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+CACHE_NS = "precompress"
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+BROTLI_LGWIN = 24
+DATA_DIR = ROOT / "assets" / "data"
+DATA_EXTS = (".json", ".tdic", ".dawg")
+MIN_SIZE = 1024
+
+
+def available_encodings() -> list[str]:
+    return ["gz", "br"] if brotli is not None else ["gz"]
+
+
+def _encode(data: bytes, enc: str) -> bytes:
+    if enc == "gz":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if enc == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY, lgwin=BROTLI_LGWIN)
+    raise ValueError(f"unknown encoding {enc!r}")
+
+
+@dataclass
+class Compressed:
+    rel: str
+    raw: int
+    sizes: dict[str, int] = field(default_factory=dict)  # enc -> bytes (0: not smaller, not written)
+    cached: bool = False
+    written: int = 0
+    error: str | None = None
+
+
+def _compress(job: tuple[str, str, tuple[str, ...]]) -> Compressed:
+    """Process-pool worker: compress one source into its siblings."""
+    root, rel, encodings = job
+    src = Path(root) / rel
+    try:
+        data = src.read_bytes()
+        out = Compressed(rel, len(data))
+        for enc in encodings:
+            sibling = src.with_name(f"{src.name}.{enc}")
+            blob = _encode(data, enc)
+            if len(blob) < len(data):
+                out.written += write_bytes_if_changed(sibling, blob)
+                out.sizes[enc] = len(blob)
+            else:
+                sibling.unlink(missing_ok=True)
+                out.sizes[enc] = 0
+        return out
+    except Exception as e:
+        return Compressed(rel, 0, error=str(e))
+
+
+def data_artifacts(base: Path = DATA_DIR, min_size: int = MIN_SIZE) -> list[Path]:
+    """Every data artifact under ``base`` worth precompressing, sorted."""
+    return sorted(
+        p for p in base.rglob("*")
+        if p.is_file() and p.suffix in DATA_EXTS and p.stat().st_size >= min_size
+    )
+
+
+def _siblings_present(src: Path, sizes: dict[str, int]) -> bool:
+    for enc, n in sizes.items():
+        sibling = src.with_name(f"{src.name}.{enc}")
+        if n and (not sibling.exists() or sibling.stat().st_size != n):
+            return False
+    return True
+
+
+def precompress(
+    paths: Iterable[Path],
+    manifest: BuildManifest,
+    jobs: int | None = None,
+    root: Path = ROOT,
+) -> list[Compressed]:
+    """Write ``.gz``/``.br`` siblings for ``paths``; return one result per path."""
+    encodings = tuple(available_encodings())
+    results: dict[str, Compressed] = {}
+    digests: dict[str, str] = {}
+    todo = []
+    for p in paths:
+        rel = p.relative_to(root).as_posix()
+        # the encoder settings are part of the key so changing them invalidates the cache
+        digests[rel] = f"{hash_file(p)}:{','.join(encodings)}:g{GZIP_LEVEL}b{BROTLI_QUALITY}w{BROTLI_LGWIN}"
+        cached = manifest.get(CACHE_NS, rel, digests[rel])
+        if cached is not None and _siblings_present(p, cached["sizes"]):
+            results[rel] = Compressed(rel, cached["raw"], cached["sizes"], cached=True)
+        else:
+            todo.append((str(root), rel, encodings))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(todo)))
+    if jobs > 1:
+        # largest first so one huge file does not end up alone at the tail
+        todo.sort(key=lambda j: -(root / j[1]).stat().st_size)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            done = list(pool.map(_compress, todo))
+    else:
+        done = [_compress(job) for job in todo]
+
+    for r in done:
+        results[r.rel] = r
+        if r.error is None:
+            manifest.put(CACHE_NS, r.rel, digests[r.rel], {"raw": r.raw, "sizes": r.sizes})
+    return [results[k] for k in sorted(results)]
+
+
+def clean_orphans(base: Path = DATA_DIR) -> list[Path]:
+    """Remove ``.gz``/``.br`` files whose source no longer exists."""
+    removed = []
+    for p in sorted(base.rglob("*")):
+        if p.suffix in (".gz", ".br") and p.is_file() and not p.with_suffix("").exists():
+            p.unlink()
+            removed.append(p)
+    return removed
+
+
+def _fmt(n: int) -> str:
+    return f"{n / 1e6:,.2f} MB" if n >= 1e5 else f"{n / 1e3:,.1f} KB"
+
+
+def print_report(results: list[Compressed], top: int = 10, root: Path = ROOT) -> None:
+    encodings = available_encodings()
+    ok = [r for r in results if r.error is None]
+    raw = sum(r.raw for r in ok)
+    print(f"{len(ok)} artifact(s), {_fmt(raw)} raw "
+          f"({sum(r.cached for r in ok)} up to date, {sum(r.written for r in ok)} sibling(s) written)")
+    for enc in encodings:
+        # a skipped sibling means the server falls back to the raw bytes
+        total = sum(r.sizes.get(enc) or r.raw for r in ok)
+        print(f"  .{enc:<3} {_fmt(total):>10}  ({total / raw:.1%} of raw)" if raw else f"  .{enc}: -")
+    if brotli is None:
+        print("  ⚠️  brotli not installed (pip install brotli): .br siblings skipped")
+
+    groups: dict[str, list[Compressed]] = {}
+    for r in ok:
+        groups.setdefault(r.rel.rsplit("/", 1)[0] if "/" in r.rel else ".", []).append(r)
+    print("\nBy directory:")
+    for d in sorted(groups):
+        rs = groups[d]
+        line = f"  {d:<40} {len(rs):>4} file(s) {_fmt(sum(r.raw for r in rs)):>10}"
+        for enc in encodings:
+            line += f"  .{enc} {_fmt(sum(r.sizes.get(enc) or r.raw for r in rs)):>10}"
+        print(line)
+
+    print(f"\nLargest {min(top, len(ok))}:")
+    for r in sorted(ok, key=lambda r: -r.raw)[:top]:
+        line = f"  {r.rel:<52} {_fmt(r.raw):>10}"
+        for enc in encodings:
+            n = r.sizes.get(enc)
+            line += f"  .{enc} {_fmt(n):>10}" if n else f"  .{enc} {'(skipped)':>10}"
+        print(line)
+
+    failed = [r for r in results if r.error]
+    for r in failed:
+        print(f"❌ {r.rel}: {r.error}")
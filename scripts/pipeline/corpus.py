@@ -0,0 +1,181 @@
+"""In-memory lesson corpus shared by every build stage.
+
+The registry and each lesson JSON are read and parsed exactly once; stages
+(generation, validation, reports) then work on the same ``Lesson`` objects.
+Stages that change lesson data call ``lesson.mark_dirty()`` and the build
+writes only those files back.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from .cache import hash_bytes, write_text_if_changed
+
+ROOT = Path(__file__).resolve().parents[2]
+
+REGISTRY_REL = "assets/data/registry.json"
+LESSONS_REL = "assets/data/lessons"
+
+
+def resolve_lesson_path(root: Path, file_name: str) -> Path:
+    """Resolve a registry ``file`` value to a path under ``root``.
+
+    Registry entries may store a full relative path
+    (``assets/data/lessons/xyz.json``) or a bare file name.
+    """
+    file_rel = str(file_name)
+    if file_rel.startswith("./"):
+        file_rel = file_rel[2:]
+    file_rel = file_rel.lstrip("/")
+    if "/" in file_rel:
+        return root / file_rel
+    return root / LESSONS_REL / file_rel
+
+
+@dataclass
+class Lesson:
+    path: Path
+    rel: str
+    entry: dict[str, Any] | None = None  # registry entry (None for orphans)
+    data: dict[str, Any] | None = None
+    error: str | None = None  # parse error, if the file could not be read
+    digest: str = ""  # sha256 of the file bytes as last read/written
+    dirty: bool = False
+
+    @property
+    def id(self) -> str:
+        if isinstance(self.data, dict) and self.data.get("id"):
+            return str(self.data["id"])
+        if self.entry and self.entry.get("id"):
+            return str(self.entry["id"])
+        return self.path.stem
+
+    @property
+    def loaded(self) -> bool:
+        return isinstance(self.data, dict)
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    def save(self) -> bool:
+        """Write the lesson back; returns False if the bytes were unchanged."""
+        text = json.dumps(self.data, ensure_ascii=False, indent=2) + "\n"
+        written = write_text_if_changed(self.path, text)
+        self.digest = hash_bytes(text.encode("utf-8"))
+        self.dirty = False
+        return written
+
+
+@dataclass
+class Corpus:
+    root: Path
+    registry: dict[str, Any] | None = None
+    registry_error: str | None = None
+    lessons: list[Lesson] = field(default_factory=list)  # registry order
+    orphans: list[Lesson] = field(default_factory=list)  # on disk, not in registry
+    missing: list[tuple[dict[str, Any], Path]] = field(default_factory=list)
+    by_path: dict[Path, Lesson] = field(default_factory=dict)
+
+    @property
+    def entries(self) -> list[dict[str, Any]]:
+        reg = self.registry
+        if isinstance(reg, dict):
+            items = reg.get("lessons", [])
+        elif isinstance(reg, list):
+            items = reg
+        else:
+            items = []
+        return items if isinstance(items, list) else []
+
+    @property
+    def lessons_dir(self) -> Path:
+        return self.root / LESSONS_REL
+
+    def lesson_for(self, entry: dict[str, Any]) -> Lesson | None:
+        """The parsed lesson a registry entry points to (None if missing)."""
+        if not isinstance(entry, dict) or not entry.get("file"):
+            return None
+        return self.by_path.get(resolve_lesson_path(self.root, entry["file"]).resolve())
+
+    def all_lessons(self) -> Iterator[Lesson]:
+        """Registry lessons followed by orphans, each file exactly once."""
+        yield from self.lessons
+        yield from self.orphans
+
+    def glob(self, pattern: str) -> list[Lesson]:
+        """Loaded lessons whose file name matches ``pattern``, sorted by path."""
+        hits = [l for l in self.all_lessons() if l.loaded and l.path.match(pattern)]
+        return sorted(hits, key=lambda l: l.path.name)
+
+    def dirty(self) -> list[Lesson]:
+        return [l for l in self.all_lessons() if l.dirty]
+
+    def save(self) -> int:
+        """Write back every lesson a stage marked dirty; return how many changed on disk."""
+        return sum(1 for lesson in self.dirty() if lesson.save())
+
+
+def _read_lesson(root: Path, path: Path, entry: dict[str, Any] | None) -> Lesson:
+    try:
+        rel = path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        rel = str(path)
+    lesson = Lesson(path=path, rel=rel, entry=entry)
+    try:
+        raw = path.read_bytes()
+        lesson.digest = hash_bytes(raw)
+        data = json.loads(raw.decode("utf-8"))
+    except Exception as e:
+        lesson.error = str(e)
+        return lesson
+    if isinstance(data, dict):
+        lesson.data = data
+    else:
+        lesson.error = "lesson JSON is not an object"
+    return lesson
+
+
+def load_corpus(root: Path | str = ROOT) -> Corpus:
+    """Parse the registry and every lesson file (registry + orphans) once."""
+    root = Path(root).resolve()
+    corpus = Corpus(root=root)
+
+    registry_path = root / REGISTRY_REL
+    if not registry_path.exists():
+        corpus.registry_error = f"Missing registry: {registry_path}"
+    else:
+        try:
+            corpus.registry = json.loads(registry_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            corpus.registry_error = f"Registry JSON parse error: {e}"
+
+    seen: set[Path] = set()
+    for entry in corpus.entries:
+        if not isinstance(entry, dict) or not entry.get("file"):
+            continue
+        path = resolve_lesson_path(root, entry["file"])
+        key = path.resolve()
+        if key in seen:
+            continue
+        if not path.exists():
+            corpus.missing.append((entry, path))
+            continue
+        seen.add(key)
+        lesson = _read_lesson(root, path, entry)
+        corpus.lessons.append(lesson)
+        corpus.by_path[key] = lesson
+
+    if corpus.lessons_dir.exists():
+        for path in sorted(corpus.lessons_dir.glob("*.json")):
+            if path.resolve() in seen:
+                continue
+            seen.add(path.resolve())
+            lesson = _read_lesson(root, path, None)
+            corpus.orphans.append(lesson)
+            corpus.by_path[path.resolve()] = lesson
+
+    return corpus
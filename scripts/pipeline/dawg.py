@@ -0,0 +1,311 @@
+"""Minimized DAWG encoding of a sorted word list (``.dawg``).
+
+``lexicon_updated.json`` is a flat JSON array of ~121k words used only for
+"is this a known word" and prefix lookups. A DAWG (directed acyclic word
+graph) shares both prefixes and suffixes, so the same set fits in a small
+fraction of the bytes and still answers membership and prefix/autocomplete
+queries without being expanded.
+
+Layout (integers little-endian, varints LEB128)::
+
+    header     magic "TDWG", u16 version, u16 alphabet bytes, u32 n_words,
+               u32 n_nodes, u32 edge blob bytes
+    alphabet   UTF-8 symbols, sorted; a symbol is stored as its index (< 64)
+    edge blob  one edge list per node that has outgoing edges
+
+An edge is one byte ``symbol | END << 6 | LAST << 7`` (END: a word ends after
+this symbol; LAST: last edge of its node) followed by a varint target:
+0 = the target has no outgoing edges, 1 = the target is the next node in the
+blob, otherwise ``node index + 2``. Node 0 is the root. The nodes referenced
+most often come right after it so their indices fit in one varint byte; the
+rest are in DFS order, which makes one child of most nodes "the next node".
+Node start offsets are not stored: the reader rebuilds them with one scan.
+Edges of a node are sorted by symbol, so enumeration yields sorted words.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+
+MAGIC = b"TDWG"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+MAX_SYMBOLS = 64
+END = 0x40
+LAST = 0x80
+T_LEAF = 0
+T_NEXT = 1
+
+
+class DawgFormatError(ValueError):
+    pass
+
+
+def _varint(n: int, out: bytearray) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+# ---------------------------------------------------------------- building
+
+class _Node:
+    __slots__ = ("edges", "final", "id")
+
+    def __init__(self) -> None:
+        self.edges: dict[str, _Node] = {}
+        self.final = False
+        self.id = -1
+
+    def signature(self) -> tuple:
+        return (self.final, tuple((ch, child.id) for ch, child in self.edges.items()))
+
+
+def build_graph(words: Iterable[str]) -> tuple[_Node, int, int]:
+    """Incremental construction of the minimal DAWG for sorted, unique words.
+
+    Returns ``(root, n_words, n_nodes)``.
+    """
+    root = _Node()
+    registry: dict[tuple, _Node] = {}
+    unchecked: list[tuple[_Node, str, _Node]] = []
+    prev = ""
+    count = 0
+
+    def minimize(down_to: int) -> None:
+        while len(unchecked) > down_to:
+            parent, ch, child = unchecked.pop()
+            sig = child.signature()
+            twin = registry.get(sig)
+            if twin is not None:
+                parent.edges[ch] = twin
+            else:
+                child.id = len(registry)
+                registry[sig] = child
+
+    for word in words:
+        if not word:
+            raise DawgFormatError("empty word")
+        if word <= prev:
+            raise DawgFormatError(f"words must be sorted and unique ({prev!r} >= {word!r})")
+        common = 0
+        for a, b in zip(prev, word):
+            if a != b:
+                break
+            common += 1
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for ch in word[common:]:
+            child = _Node()
+            node.edges[ch] = child
+            unchecked.append((node, ch, child))
+            node = child
+        node.final = True
+        prev = word
+        count += 1
+    minimize(0)
+    return root, count, len(registry) + 1
+
+
+HOT_NODES = 126  # indices 0..125 (+2) still fit in a one-byte varint
+
+
+def _layout(root: _Node) -> list[tuple[_Node, _Node | None]]:
+    """Nodes with edges in blob order, each with the child placed right after it."""
+    indegree: dict[int, int] = {}
+    nodes: list[_Node] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for child in node.edges.values():
+            n = indegree.get(id(child))
+            indegree[id(child)] = 1 if n is None else n + 1
+            if n is None:
+                nodes.append(child)
+                stack.append(child)
+    hot = sorted((n for n in nodes if n.edges and indegree[id(n)] > 1),
+                 key=lambda n: -indegree[id(n)])[:HOT_NODES - 1]
+
+    order: list[tuple[_Node, _Node | None]] = [(root, None)]
+    placed = {id(root)}
+    for node in hot:
+        placed.add(id(node))
+        order.append((node, None))
+    stack = [c for n, _ in reversed(order) for c in reversed(list(n.edges.values()))]
+    while stack:
+        node = stack.pop()
+        if id(node) in placed or not node.edges:
+            continue
+        placed.add(id(node))
+        kids: list[_Node] = []
+        for child in node.edges.values():
+            if child.edges and id(child) not in placed and all(child is not k for k in kids):
+                kids.append(child)
+        # the last pushed child is popped (and placed) next
+        stack.extend(kids)
+        order.append((node, kids[-1] if kids else None))
+    return order
+
+
+def encode(words: Iterable[str]) -> bytes:
+    """Encode sorted, unique ``words`` into ``.dawg`` bytes."""
+    words = list(words)
+    alphabet = sorted({ch for w in words for ch in w})
+    if len(alphabet) > MAX_SYMBOLS:
+        raise DawgFormatError(f"alphabet has {len(alphabet)} symbols, at most {MAX_SYMBOLS} are supported")
+    sym = {ch: i for i, ch in enumerate(alphabet)}
+    root, n_words, _ = build_graph(words)
+    order = _layout(root) if root.edges else []
+    index = {id(node): i for i, (node, _) in enumerate(order)}
+
+    blob = bytearray()
+    for node, follow in order:
+        items = list(node.edges.items())
+        for i, (ch, child) in enumerate(items):
+            flags = (END if child.final else 0) | (LAST if i == len(items) - 1 else 0)
+            blob.append(sym[ch] | flags)
+            if not child.edges:
+                code = T_LEAF
+            elif child is follow:
+                code = T_NEXT
+            else:
+                code = index[id(child)] + 2
+            _varint(code, blob)
+    alpha = "".join(alphabet).encode("utf-8")
+    return HEADER.pack(MAGIC, VERSION, len(alpha), n_words, len(order), len(blob)) + alpha + bytes(blob)
+
+
+# ---------------------------------------------------------------- reading
+
+class Dawg:
+    """Reference decoder: membership, prefix and full enumeration."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise DawgFormatError("truncated .dawg")
+        magic, version, alpha_len, self.n_words, n_nodes, blob_len = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise DawgFormatError("not a .dawg file")
+        if version != VERSION:
+            raise DawgFormatError(f"unsupported .dawg version {version}")
+        start = HEADER.size
+        self.alphabet = data[start:start + alpha_len].decode("utf-8")
+        self._sym = {ch: i for i, ch in enumerate(self.alphabet)}
+        self._blob = data[start + alpha_len:start + alpha_len + blob_len]
+        if len(self._blob) != blob_len:
+            raise DawgFormatError("truncated .dawg edge blob")
+        self._starts = self._scan(n_nodes)
+
+    def _scan(self, n_nodes: int) -> list[int]:
+        """Start offset of every node's edge list."""
+        blob = self._blob
+        starts = []
+        pos = 0
+        new_node = True
+        while pos < len(blob):
+            if new_node:
+                starts.append(pos)
+            b = blob[pos]
+            pos += 1
+            while blob[pos] & 0x80:
+                pos += 1
+            pos += 1
+            new_node = bool(b & LAST)
+        if len(starts) != n_nodes:
+            raise DawgFormatError(f"expected {n_nodes} nodes, found {len(starts)}")
+        return starts
+
+    @classmethod
+    def open(cls, path: Path | str) -> "Dawg":
+        return cls(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        return self.n_words
+
+    def _edges(self, node: int) -> Iterator[tuple[int, bool, int]]:
+        """Edges of ``node`` as ``(symbol, ends a word, target node or -1)``."""
+        if node < 0 or not self._starts:
+            return
+        blob = self._blob
+        pos = self._starts[node]
+        while True:
+            b = blob[pos]
+            code, pos = _read_varint(blob, pos + 1)
+            yield b & 0x3F, bool(b & END), -1 if code == T_LEAF else node + 1 if code == T_NEXT else code - 2
+            if b & LAST:
+                return
+
+    def _walk(self, word: str) -> tuple[bool, int] | None:
+        """Follow ``word`` from the root; ``(ends a word, node)`` or None."""
+        node = 0 if self._starts else -1
+        end = False
+        for ch in word:
+            s = self._sym.get(ch)
+            if s is None:
+                return None
+            for sym, e, target in self._edges(node):
+                if sym == s:
+                    end, node = e, target
+                    break
+                if sym > s:
+                    return None
+            else:
+                return None
+        return end, node
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        hit = self._walk(word)
+        return hit is not None and hit[0]
+
+    def _enumerate(self, prefix: str, node: int) -> Iterator[str]:
+        stack = [(prefix, self._edges(node))]
+        while stack:
+            word, edges = stack[-1]
+            edge = next(edges, None)
+            if edge is None:
+                stack.pop()
+                continue
+            s, end, target = edge
+            w = word + self.alphabet[s]
+            if end:
+                yield w
+            stack.append((w, self._edges(target)))
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Words starting with ``prefix`` (sorted), at most ``limit``."""
+        out: list[str] = []
+        if limit is not None and limit <= 0:
+            return out
+        if prefix:
+            hit = self._walk(prefix)
+            if hit is None:
+                return out
+            end, node = hit
+            if end:
+                out.append(prefix)
+        else:
+            node = 0 if self._starts else -1
+        for w in self._enumerate(prefix, node):
+            if limit is not None and len(out) >= limit:
+                break
+            out.append(w)
+        return out
+
+    def __iter__(self) -> Iterator[str]:
+        return self._enumerate("", 0 if self._starts else -1)
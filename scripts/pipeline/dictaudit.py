@@ -0,0 +1,181 @@
+"""Consistency audit across the three dictionary layouts.
+
+``dict_letters/`` (the canonical store), ``dictionary/chunks/`` and
+``word_profiles/`` describe the same headwords three ways, and nothing else
+checks that they agree. ``audit`` streams all three (``pipeline/jsonstream``)
+and joins them on the lowercase headword in a single pass:
+
+* missing headwords -- a key present in one layout but not another
+  (profiles listed under ``extra`` in ``profile_overrides.json`` are
+  expected to have no store entry);
+* sense mismatches -- chunk ``m`` against the store's ``MEANINGS`` (count,
+  part of speech, definition, per-sense synonyms/examples), and the profile's
+  ``pos``/``definition`` against the first senses;
+* synonym drift -- chunk ``s``/``a`` and profile ``synonyms``/``antonyms``
+  against the store, as a set (error) and, where the layout keeps the store
+  order, as a sequence (warning). Profile synonyms are sorted by design.
+
+The layouts are not sorted by key, but the views are generated in store
+order, so the join is a merge over that shared order: each stream is read
+one entry per step and an entry waits in a small buffer only until the same
+key has arrived from the other layouts. Buffers stay near-empty while the
+layouts agree; whatever is left at the end is a missing headword.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from .dictstore import (
+    CHUNK_SHARDS, CHUNKS_DIR, LETTERS, LETTERS_DIR, PROFILE_SHARDS, PROFILES_DIR, ROOT,
+    derive_profile, load_overrides,
+)
+from .jsonstream import iter_items
+from .validate import WARNING, Issue, pointer
+
+STORE, CHUNKS, PROFILES = 0, 1, 2
+LAYOUTS = ("dict_letters", "dictionary/chunks", "word_profiles")
+MEANING_FIELDS = ("pos", "definition", "synonyms", "examples")
+MAX_LISTED = 5
+
+
+@dataclass
+class AuditStats:
+    headwords: int = 0
+    joined: int = 0
+    extra_profiles: int = 0
+    overridden_profiles: int = 0
+    max_buffered: int = 0
+
+
+def _rel(path: Any) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def _stream(layout: int, shards: Iterable[str]) -> Iterator[tuple[str, tuple[str, Any, str]]]:
+    """``(key, (headword, value, file))`` for every entry of one layout."""
+    base = (LETTERS_DIR, CHUNKS_DIR, PROFILES_DIR)[layout]
+    for shard in shards:
+        path = base / f"{shard}.json"
+        if not path.exists():
+            continue
+        rel = _rel(path)
+        for key, value in iter_items(path):
+            yield key.lower(), (key, value, rel)
+
+
+def _listed(values: Iterable[str]) -> str:
+    values = sorted(values)
+    more = f" (+{len(values) - MAX_LISTED} more)" if len(values) > MAX_LISTED else ""
+    return ", ".join(repr(v) for v in values[:MAX_LISTED]) + more
+
+
+def _drift(check: str, what: str, got: list, want: list, file: str, ptr: tuple, ordered: bool) -> list[Issue]:
+    if got == want:
+        return []
+    ptr = pointer(*ptr)
+    missing, added = set(want) - set(got), set(got) - set(want)
+    if missing or added:
+        parts = ([f"missing {_listed(missing)}"] if missing else []) + ([f"extra {_listed(added)}"] if added else [])
+        return [Issue(check, f"{what} differ from the store: {'; '.join(parts)}", file=file, pointer=ptr)]
+    if ordered:
+        return [Issue(check, f"{what} are in a different order than in the store", file=file, pointer=ptr,
+                      severity=WARNING)]
+    return []
+
+
+def compare_chunk(key: str, entry: dict[str, Any], chunk: dict[str, Any], file: str) -> list[Issue]:
+    senses = list((entry.get("MEANINGS") or {}).items())
+    got = chunk.get("m") or []
+    if (got == [m for _, m in senses] and chunk.get("s") == (entry.get("SYNONYMS") or [])
+            and chunk.get("a") == (entry.get("ANTONYMS") or [])):
+        return []
+    issues: list[Issue] = []
+    if len(got) != len(senses):
+        issues.append(Issue("dict-senses", f"{len(got)} sense(s), store has {len(senses)}",
+                            file=file, pointer=pointer(key, "m")))
+    for i, ((sense, meaning), m) in enumerate(zip(senses, got)):
+        diff = [name for name, a, b in zip(MEANING_FIELDS, meaning, m) if a != b]
+        if diff or len(m) != len(meaning):
+            issues.append(Issue("dict-senses", f"sense {sense} differs from the store ({', '.join(diff) or 'shape'})",
+                                file=file, pointer=pointer(key, "m", i)))
+    issues += _drift("dict-synonyms", "synonyms", chunk.get("s") or [], entry.get("SYNONYMS") or [],
+                     file, (key, "s"), ordered=True)
+    issues += _drift("dict-synonyms", "antonyms", chunk.get("a") or [], entry.get("ANTONYMS") or [],
+                     file, (key, "a"), ordered=True)
+    return issues
+
+
+def compare_profile(key: str, headword: str, entry: dict[str, Any], profile: dict[str, Any], file: str) -> list[Issue]:
+    want = derive_profile(headword, entry)
+    if profile == want:
+        return []
+    issues: list[Issue] = []
+    for name in ("pos", "definition"):
+        if profile.get(name) != want.get(name):
+            issues.append(Issue("dict-senses", f"{name} does not match the store's first senses",
+                                file=file, pointer=pointer(key, name)))
+    issues += _drift("dict-synonyms", "synonyms", profile.get("synonyms") or [], want.get("synonyms") or [],
+                     file, (key, "synonyms"), ordered=False)
+    issues += _drift("dict-synonyms", "antonyms", profile.get("antonyms") or [], want.get("antonyms") or [],
+                     file, (key, "antonyms"), ordered=True)
+    return issues
+
+
+def audit(letters: Iterable[str] = LETTERS) -> tuple[list[Issue], AuditStats]:
+    """Join the three layouts for ``letters`` and return ``(issues, stats)``."""
+    letters = list(letters)
+    full = letters == list(LETTERS)
+    overrides = load_overrides()
+    extra, replaced = overrides["extra"], overrides["replace"]
+    stats = AuditStats()
+    streams = [
+        _stream(STORE, letters),
+        _stream(CHUNKS, [s for s in CHUNK_SHARDS if s in letters or (full and s not in LETTERS)]),
+        _stream(PROFILES, [s for s in PROFILE_SHARDS if s in letters or (full and s not in LETTERS)]),
+    ]
+    buffers: list[dict[str, tuple[str, Any, str]]] = [{}, {}, {}]
+    issues: list[Issue] = []
+
+    def join(key: str) -> None:
+        (headword, entry, _), (_, chunk, chunk_file), (_, profile, profile_file) = (b.pop(key) for b in buffers)
+        stats.joined += 1
+        issues.extend(compare_chunk(key, entry, chunk, chunk_file))
+        if key in replaced:
+            stats.overridden_profiles += 1
+        else:
+            issues.extend(compare_profile(key, headword, entry, profile, profile_file))
+
+    live = list(range(3))
+    while live:
+        for layout in list(live):
+            item = next(streams[layout], None)
+            if item is None:
+                live.remove(layout)
+                continue
+            key, value = item
+            if layout == STORE:
+                stats.headwords += 1
+            buffers[layout][key] = value
+            if all(key in b for b in buffers):
+                join(key)
+        stats.max_buffered = max(stats.max_buffered, sum(len(b) for b in buffers))
+
+    # Whatever is still buffered is missing from at least one layout.
+    store, chunks, profiles = buffers
+    for key in sorted(set().union(*buffers)):
+        if key not in store:
+            if key in profiles and key in extra and key not in chunks:
+                stats.extra_profiles += 1
+                continue
+            for layout in (CHUNKS, PROFILES):
+                if key in buffers[layout]:
+                    issues.append(Issue("dict-missing", f"headword not in {LAYOUTS[STORE]}",
+                                        file=buffers[layout][key][2], pointer=pointer(key)))
+            continue
+        for layout in (CHUNKS, PROFILES):
+            if key not in buffers[layout]:
+                issues.append(Issue("dict-missing", f"headword missing from {LAYOUTS[layout]}",
+                                    file=store[key][2], pointer=pointer(store[key][0])))
+    return issues, stats
@@ -0,0 +1,266 @@
+"""Compact binary dictionary shard format (``.tdic``).
+
+One shard holds the same data as ``assets/data/dict_letters/<letter>.json``
+but can be queried without parsing the whole file: a reader binary-searches a
+sorted key index and then decodes a single entry, touching a few kilobytes
+(a handful of small reads, or HTTP range requests on the client) instead of
+megabytes.
+
+Layout (all integers little-endian)::
+
+    header      magic "TDIC", u16 version, u16 flags, u32 n_keys, u32 n_strings,
+                u32 offsets of the six sections below
+    key table   (n_keys + 1) x u32 offsets into the key blob
+    key blob    UTF-8 headwords, sorted by their UTF-8 bytes
+    entry table (n_keys + 1) x u32 offsets into the entry blob
+    entry blob  one varint-encoded record per key (same order as the keys)
+    str table   (n_strings + 1) x u32 offsets into the string blob
+    str blob    UTF-8 strings, interned: each distinct string stored once,
+                most frequent first so they get the shortest varint ids
+
+An entry record is::
+
+    n_meanings, then per meaning: sense, pos, definition, n, synonyms..., n, examples...
+    n, ANTONYMS...
+    n, SYNONYMS...
+
+where every string is a varint string id. Decoding yields the same
+``{"MEANINGS": {...}, "ANTONYMS": [...], "SYNONYMS": [...]}`` shape as the
+JSON shard.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+MAGIC = b"TDIC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII6I")
+U32 = struct.Struct("<I")
+
+
+class DictFormatError(ValueError):
+    pass
+
+
+def _varint(n: int, out: bytearray) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _entry_strings(entry: dict[str, Any]) -> Iterator[str]:
+    for sense, meaning in (entry.get("MEANINGS") or {}).items():
+        if not (isinstance(meaning, list) and len(meaning) == 4):
+            raise DictFormatError(f"unexpected meaning shape for sense {sense!r}: {meaning!r}")
+        pos, definition, syns, examples = meaning
+        yield sense
+        yield pos
+        yield definition
+        yield from syns
+        yield from examples
+    yield from entry.get("ANTONYMS") or []
+    yield from entry.get("SYNONYMS") or []
+
+
+def _offset_table(chunks: list[bytes]) -> bytes:
+    out = bytearray()
+    off = 0
+    for c in chunks:
+        out += U32.pack(off)
+        off += len(c)
+    out += U32.pack(off)
+    return bytes(out)
+
+
+def encode_shard(entries: dict[str, dict[str, Any]]) -> bytes:
+    """Encode ``{headword: entry}`` (dict_letters shape) into ``.tdic`` bytes."""
+    freq: Counter[str] = Counter()
+    for entry in entries.values():
+        for s in _entry_strings(entry):
+            if not isinstance(s, str):
+                raise DictFormatError(f"non-string value in dictionary entry: {s!r}")
+            freq[s] += 1
+    strings = sorted(freq, key=lambda s: (-freq[s], s))
+    sid = {s: i for i, s in enumerate(strings)}
+
+    def ids(values: list[str], out: bytearray) -> None:
+        _varint(len(values), out)
+        for v in values:
+            _varint(sid[v], out)
+
+    keys = sorted(entries, key=lambda k: k.encode("utf-8"))
+    key_chunks = [k.encode("utf-8") for k in keys]
+    entry_chunks = []
+    for k in keys:
+        entry = entries[k]
+        rec = bytearray()
+        meanings = entry.get("MEANINGS") or {}
+        _varint(len(meanings), rec)
+        for sense, (pos, definition, syns, examples) in meanings.items():
+            _varint(sid[sense], rec)
+            _varint(sid[pos], rec)
+            _varint(sid[definition], rec)
+            ids(syns, rec)
+            ids(examples, rec)
+        ids(entry.get("ANTONYMS") or [], rec)
+        ids(entry.get("SYNONYMS") or [], rec)
+        entry_chunks.append(bytes(rec))
+    str_chunks = [s.encode("utf-8") for s in strings]
+
+    sections = [
+        _offset_table(key_chunks), b"".join(key_chunks),
+        _offset_table(entry_chunks), b"".join(entry_chunks),
+        _offset_table(str_chunks), b"".join(str_chunks),
+    ]
+    offsets = []
+    pos = HEADER.size
+    for sec in sections:
+        offsets.append(pos)
+        pos += len(sec)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(keys), len(strings), *offsets)
+    return header + b"".join(sections)
+
+
+class DictShard:
+    """Random-access reader for a ``.tdic`` shard.
+
+    Only the header is read up front; ``get`` binary-searches the key index
+    with small positioned reads. ``bytes_read`` counts every byte fetched,
+    which is what a client doing HTTP range requests would download.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self._fh = fh
+        self.bytes_read = 0
+        head = self._read(0, HEADER.size)
+        magic, version, _flags, self.n_keys, self.n_strings, *offs = HEADER.unpack(head)
+        if magic != MAGIC:
+            raise DictFormatError("not a .tdic shard")
+        if version != VERSION:
+            raise DictFormatError(f"unsupported .tdic version {version}")
+        (self._key_tab, self._key_blob, self._ent_tab,
+         self._ent_blob, self._str_tab, self._str_blob) = offs
+        self._strings: dict[int, str] = {}
+
+    @classmethod
+    def open(cls, path: Path | str) -> "DictShard":
+        return cls(open(path, "rb"))
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "DictShard":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_keys
+
+    def _read(self, off: int, n: int) -> bytes:
+        self._fh.seek(off)
+        data = self._fh.read(n)
+        self.bytes_read += len(data)
+        return data
+
+    def _span(self, table: int, i: int) -> tuple[int, int]:
+        start, end = struct.unpack("<II", self._read(table + 4 * i, 8))
+        return start, end
+
+    def key(self, i: int) -> str:
+        start, end = self._span(self._key_tab, i)
+        return self._read(self._key_blob + start, end - start).decode("utf-8")
+
+    def _string(self, i: int) -> str:
+        s = self._strings.get(i)
+        if s is None:
+            start, end = self._span(self._str_tab, i)
+            s = self._read(self._str_blob + start, end - start).decode("utf-8")
+            self._strings[i] = s
+        return s
+
+    def _find(self, headword: str) -> int:
+        target = headword.encode("utf-8")
+        lo, hi = 0, self.n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = self._span(self._key_tab, mid)
+            k = self._read(self._key_blob + start, end - start)
+            if k < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def index_of(self, headword: str) -> int:
+        i = self._find(headword)
+        if i < self.n_keys and self.key(i) == headword:
+            return i
+        return -1
+
+    def __contains__(self, headword: object) -> bool:
+        return isinstance(headword, str) and self.index_of(headword) >= 0
+
+    def entry(self, i: int) -> dict[str, Any]:
+        start, end = self._span(self._ent_tab, i)
+        rec = self._read(self._ent_blob + start, end - start)
+        pos = 0
+
+        def strs() -> list[str]:
+            nonlocal pos
+            n, pos = _read_varint(rec, pos)
+            out = []
+            for _ in range(n):
+                v, pos = _read_varint(rec, pos)
+                out.append(self._string(v))
+            return out
+
+        meanings: dict[str, list[Any]] = {}
+        n, pos = _read_varint(rec, pos)
+        for _ in range(n):
+            sense, pos = _read_varint(rec, pos)
+            p, pos = _read_varint(rec, pos)
+            d, pos = _read_varint(rec, pos)
+            syns = strs()
+            examples = strs()
+            meanings[self._string(sense)] = [self._string(p), self._string(d), syns, examples]
+        antonyms = strs()
+        synonyms = strs()
+        return {"MEANINGS": meanings, "ANTONYMS": antonyms, "SYNONYMS": synonyms}
+
+    def get(self, headword: str, default: Any = None) -> dict[str, Any] | Any:
+        i = self.index_of(headword)
+        return self.entry(i) if i >= 0 else default
+
+    def keys(self) -> Iterator[str]:
+        for i in range(self.n_keys):
+            yield self.key(i)
+
+    def prefix(self, prefix: str, limit: int = 50) -> list[str]:
+        """Up to ``limit`` headwords starting with ``prefix``, in key order."""
+        out = []
+        i = self._find(prefix)
+        while i < self.n_keys and len(out) < limit:
+            k = self.key(i)
+            if not k.startswith(prefix):
+                break
+            out.append(k)
+            i += 1
+        return out
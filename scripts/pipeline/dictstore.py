@@ -0,0 +1,172 @@
+"""Canonical dictionary store and the views derived from it.
+
+The canonical store is ``assets/data/dict_letters/<letter>.json`` (headword ->
+``{MEANINGS: {sense: [pos, definition, synonyms, examples]}, ANTONYMS,
+SYNONYMS}``) plus ``assets/data/dictionary/profile_overrides.json`` for the
+few word profiles that cannot be derived (hand-enriched lesson words and
+lesson phrases that are not dictionary headwords).
+
+Views are generated from it:
+
+* ``word_profiles/<letter>.json``    -- lowercase key -> flattened profile
+  (``_.json`` for keys that do not start with a-z); fetched by the site and
+  committed
+* ``dictionary/chunks/<letter>.json`` -- lowercase key -> ``{m, s, a}``; only
+  read by the Python tools, so a gitignored build output
+
+Views are serialized exactly like the checked-in files, so regenerating them
+from an unchanged store is byte-for-byte identical. The store is streamed
+(``pipeline/jsonstream.py``), one entry at a time, into all view shards at
+once, so no letter is ever held in memory whole.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .cache import hash_bytes
+from .corpus import ROOT
+from .jsonstream import ObjectWriter, iter_items
+
+DATA = ROOT / "assets" / "data"
+LETTERS_DIR = DATA / "dict_letters"
+PROFILES_DIR = DATA / "word_profiles"
+CHUNKS_DIR = DATA / "dictionary" / "chunks"
+OVERRIDES = DATA / "dictionary" / "profile_overrides.json"
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+PROFILE_SHARDS = list(LETTERS) + ["_"]
+CHUNK_SHARDS = list(LETTERS) + ["other"]
+
+# word_profiles keep only the first few senses
+PROFILE_SENSES = 3
+PROFILE_EXAMPLES_PER_SENSE = 2
+
+
+def dumps_view(obj: Any) -> str:
+    """Serialize a view shard the way the checked-in files are written."""
+    if not obj:
+        return "{}"
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def profile_shard(key: str) -> str:
+    return key[0] if key and re.match(r"[a-z]", key[0]) else "_"
+
+
+def chunk_shard(key: str) -> str:
+    return key[0] if key and re.match(r"[a-z]", key[0]) else "other"
+
+
+def _sense_order(sense: str) -> float:
+    try:
+        return float(sense)
+    except ValueError:
+        return float("inf")
+
+
+def derive_chunk(entry: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "m": list((entry.get("MEANINGS") or {}).values()),
+        "s": entry.get("SYNONYMS") or [],
+        "a": entry.get("ANTONYMS") or [],
+    }
+
+
+def derive_profile(headword: str, entry: dict[str, Any]) -> dict[str, Any]:
+    senses = sorted((entry.get("MEANINGS") or {}).items(), key=lambda kv: _sense_order(kv[0]))
+    senses = senses[:PROFILE_SENSES]
+    out: dict[str, Any] = {"en": headword}
+    if senses:
+        out["pos"] = senses[0][1][0]
+        if len(senses) == 1:
+            out["definition"] = senses[0][1][1].strip()
+        else:
+            out["definition"] = "\n".join(f"{s}) {m[1].strip()}" for s, m in senses)
+    synonyms = set(entry.get("SYNONYMS") or [])
+    for _, m in senses:
+        synonyms.update(m[2])
+    if synonyms:
+        out["synonyms"] = sorted(synonyms)
+    if entry.get("ANTONYMS"):
+        out["antonyms"] = entry["ANTONYMS"]
+    examples = [e.strip() for _, m in senses for e in m[3][:PROFILE_EXAMPLES_PER_SENSE]]
+    if examples:
+        out["examples"] = [{"en": e} for e in examples]
+    return out
+
+
+def iter_letters(letters: Iterable[str] = LETTERS) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Stream ``(letter, headword, entry)`` from the canonical store."""
+    for letter in letters:
+        p = LETTERS_DIR / f"{letter}.json"
+        if p.exists():
+            for headword, entry in iter_items(p):
+                yield letter, headword, entry
+
+
+def load_overrides(path: Path = OVERRIDES) -> dict[str, dict[str, Any]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"replace": {}, "extra": {}}
+    return {"replace": raw.get("replace") or {}, "extra": raw.get("extra") or {}}
+
+
+def write_views(overrides: dict[str, dict[str, Any]], write: bool = True) -> list[ObjectWriter]:
+    """Stream the store into every view shard; return the closed writers.
+
+    All view shards are written side by side while the store is read once,
+    one entry at a time. With ``write=False`` nothing is replaced and each
+    writer's ``changed`` tells whether the checked-in shard is out of date.
+    """
+    paths = [PROFILES_DIR / f"{s}.json" for s in PROFILE_SHARDS] + [CHUNKS_DIR / f"{s}.json" for s in CHUNK_SHARDS]
+    writers = {path: ObjectWriter(path, replace=write) for path in paths}
+    try:
+        replace, extra = overrides["replace"], overrides["extra"]
+        seen: set[str] = set()
+        for _, headword, entry in iter_letters():
+            key = headword.lower()
+            if key in seen:
+                raise ValueError(f"dictionary store: {headword!r} collides with an earlier headword")
+            seen.add(key)
+            writers[CHUNKS_DIR / f"{chunk_shard(key)}.json"].write(key, derive_chunk(entry))
+            prof = extra.get(key, replace.get(key))
+            writers[PROFILES_DIR / f"{profile_shard(key)}.json"].write(
+                key, prof if prof is not None else derive_profile(headword, entry))
+        for key, prof in extra.items():
+            if key not in seen:
+                writers[PROFILES_DIR / f"{profile_shard(key)}.json"].write(key, prof)
+    except BaseException:
+        for w in writers.values():
+            w.abort()
+        raise
+    for w in writers.values():
+        w.close()
+    return list(writers.values())
+
+
+def extract_overrides() -> dict[str, Any]:
+    """Compute the overrides that reproduce the current word_profiles exactly.
+
+    Only a digest of each derived profile is kept, not the profile itself.
+    """
+    derived: dict[str, str] = {}
+    for _, headword, entry in iter_letters():
+        derived[headword.lower()] = hash_bytes(dumps_view(derive_profile(headword, entry)).encode("utf-8"))
+    replace: dict[str, Any] = {}
+    extra: dict[str, Any] = {}
+    for shard in PROFILE_SHARDS:
+        p = PROFILES_DIR / f"{shard}.json"
+        if not p.exists():
+            continue
+        for key, prof in iter_items(p):
+            digest = derived.get(key)
+            if digest is None:
+                extra[key] = prof
+            elif hash_bytes(dumps_view(prof).encode("utf-8")) != digest:
+                replace[key] = prof
+    return {"version": 1, "replace": replace, "extra": extra}
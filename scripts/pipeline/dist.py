@@ -0,0 +1,134 @@
+"""Production (``--profile=prod``) JSON output.
+
+Source JSON stays pretty-printed for review and diffs; the prod profile
+additionally writes a minified copy of each artifact into ``dist/`` (same
+relative path), with compact separators and without build-only bookkeeping
+fields (``createdAt``/``updatedAt``/``generatedAt``). Nothing in the front end
+reads those fields, so they are moved into one sidecar,
+``dist/_build_meta.json`` (``{rel path: {JSON pointer: value}}``), instead of
+being shipped and cached with every file.
+
+A dist file is always derived from the source file on disk, so it can be
+regenerated at any time and a no-op run rewrites nothing.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from .cache import write_text_if_changed
+from .corpus import ROOT
+
+PROFILES = ("dev", "prod")
+DIST_DIR = ROOT / "dist"
+SIDECAR = "_build_meta.json"
+BUILD_ONLY_FIELDS = frozenset({"createdAt", "updatedAt", "generatedAt"})
+
+
+@dataclass
+class DistFile:
+    rel: str
+    src_bytes: int
+    dist_bytes: int
+    stripped: int
+    written: bool
+    error: str | None = None
+
+    @property
+    def saved(self) -> int:
+        return self.src_bytes - self.dist_bytes
+
+
+def _pointer(parent: str, key: str | int) -> str:
+    return f"{parent}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def strip_build_fields(obj: Any, path: str = "", out: dict[str, Any] | None = None) -> tuple[Any, dict[str, Any]]:
+    """Return ``obj`` without build-only fields and ``{pointer: removed value}``."""
+    out = {} if out is None else out
+    if isinstance(obj, dict):
+        kept = {}
+        for k, v in obj.items():
+            if k in BUILD_ONLY_FIELDS:
+                out[_pointer(path, k)] = v
+            else:
+                kept[k] = strip_build_fields(v, _pointer(path, k), out)[0]
+        return kept, out
+    if isinstance(obj, list):
+        return [strip_build_fields(v, _pointer(path, i), out)[0] for i, v in enumerate(obj)], out
+    return obj, out
+
+
+def dumps_prod(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class DistWriter:
+    """Write minified copies of source JSON files into the dist tree.
+
+    ``emit`` may be called any number of times; ``close`` merges the
+    stripped fields into the sidecar (keeping entries for files that were not
+    emitted in this run).
+    """
+
+    def __init__(self, root: Path = ROOT, dist: Path = DIST_DIR):
+        self.root = root
+        self.dist = dist
+        self.results: list[DistFile] = []
+        self._meta: dict[str, dict[str, Any]] = {}
+
+    def emit(self, src: Path) -> DistFile:
+        rel = src.resolve().relative_to(self.root).as_posix()
+        try:
+            raw = src.read_bytes()
+            obj, stripped = strip_build_fields(json.loads(raw.decode("utf-8")))
+        except (OSError, ValueError) as e:
+            res = DistFile(rel, 0, 0, 0, False, error=str(e))
+        else:
+            text = dumps_prod(obj)
+            written = write_text_if_changed(self.dist / rel, text)
+            self._meta[rel] = stripped
+            res = DistFile(rel, len(raw), len(text.encode("utf-8")), len(stripped), written)
+        self.results.append(res)
+        return res
+
+    def emit_all(self, paths: Iterable[Path]) -> list[DistFile]:
+        return [self.emit(p) for p in paths]
+
+    def close(self, prune: bool = False) -> bool:
+        """Update the sidecar; with ``prune`` drop entries whose dist file is gone."""
+        path = self.dist / SIDECAR
+        try:
+            meta = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            meta = {}
+        meta.update(self._meta)
+        meta = {k: v for k, v in meta.items() if v and (not prune or (self.dist / k).exists())}
+        if not meta and not path.exists():
+            return False
+        return write_text_if_changed(path, json.dumps(dict(sorted(meta.items())), ensure_ascii=False, indent=2) + "\n")
+
+
+def print_report(results: list[DistFile], root: Path = ROOT, dist: Path = DIST_DIR, top: int | None = None) -> None:
+    ok = [r for r in results if r.error is None]
+    shown = sorted(ok, key=lambda r: -r.saved)
+    if top is not None:
+        shown = shown[:top]
+    for r in shown:
+        pct = r.saved / r.src_bytes if r.src_bytes else 0.0
+        note = f", {r.stripped} build field(s) stripped" if r.stripped else ""
+        print(f"  {r.rel:<52} {r.src_bytes:>10,} -> {r.dist_bytes:>10,} B  (-{pct:.1%}{note})")
+    if top is not None and len(ok) > top:
+        print(f"  ... and {len(ok) - top} more")
+    src = sum(r.src_bytes for r in ok)
+    out = sum(r.dist_bytes for r in ok)
+    if src:
+        print(f"📦 prod: {len(ok)} file(s) -> {dist.relative_to(root)}/ "
+              f"({sum(r.written for r in ok)} written), {src:,} -> {out:,} bytes "
+              f"(saved {src - out:,}, {(src - out) / src:.1%})")
+    for r in results:
+        if r.error:
+            print(f"❌ {r.rel}: {r.error}")
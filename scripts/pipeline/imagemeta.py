@@ -0,0 +1,152 @@
+"""Header-only image metadata (WebP, PNG, SVG) and variant size checks.
+
+The checkers used to stop at ``exists()`` for ``src800``/``src1600``.
+``scan_images`` reads the dimensions of every image under ``assets/images``
+from its first bytes only -- the PNG ``IHDR`` chunk, the WebP ``VP8``/``VP8L``
+/``VP8X`` header, or the root ``<svg>`` tag's ``width``/``height``/``viewBox``
+-- without decoding pixels, on a thread pool, so the whole directory takes
+milliseconds.
+
+``variant_issues`` turns one ``<name>-<width>.<ext>`` variant's metadata
+into issues:
+
+* wider than its nominal width (e.g. a 1600 px file shipped as ``-800``) --
+  error;
+* over ``BYTE_BUDGETS`` -- warning;
+* a header that cannot be read -- error.
+
+``sibling_issues`` adds a warning for a ``-1600`` variant that is no wider
+than its ``-800`` sibling, so the larger download buys nothing.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .validate import WARNING, Issue
+
+IMAGES_REL = "assets/images"
+HEADER_BYTES = 32
+SVG_HEAD_BYTES = 4096
+SCANNED_EXTS = (".webp", ".png", ".svg")
+BYTE_BUDGETS = {800: 200 * 1024, 1600: 400 * 1024}
+
+_VARIANT = re.compile(r"-(\d+)\.(?:webp|png|avif|jpe?g)$", re.I)
+_SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.I | re.S)
+_SVG_ATTR = re.compile(rb"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""", re.I)
+_SVG_LENGTH = re.compile(r"\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$")
+
+
+@dataclass
+class ImageMeta:
+    rel: str
+    fmt: str
+    size: int
+    width: int = 0
+    height: int = 0
+    error: str | None = None
+
+
+def _webp_dims(head: bytes) -> tuple[int, int]:
+    if len(head) < 30 or head[:4] != b"RIFF" or head[8:12] != b"WEBP":
+        raise ValueError("not a RIFF/WEBP file")
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        if head[23:26] != b"\x9d\x01\x2a":
+            raise ValueError("bad VP8 start code")
+        w, h = struct.unpack("<HH", head[26:30])
+        return w & 0x3FFF, h & 0x3FFF
+    if chunk == b"VP8L":
+        if head[20] != 0x2F:
+            raise ValueError("bad VP8L signature")
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    raise ValueError(f"unknown WebP chunk {chunk!r}")
+
+
+def _png_dims(head: bytes) -> tuple[int, int]:
+    if head[:8] != b"\x89PNG\r\n\x1a\n" or head[12:16] != b"IHDR":
+        raise ValueError("not a PNG file")
+    return struct.unpack(">II", head[16:24])
+
+
+def _svg_dims(head: bytes) -> tuple[int, int]:
+    tag = _SVG_TAG.search(head)
+    if not tag:
+        raise ValueError(f"no <svg> tag in the first {SVG_HEAD_BYTES} bytes")
+    attrs = {k.decode().lower(): v.decode("utf-8", "replace") for k, v in _SVG_ATTR.findall(tag.group(0))}
+    lengths = [_SVG_LENGTH.match(attrs.get(k, "")) for k in ("width", "height")]
+    if all(lengths):
+        return tuple(round(float(m.group(1))) for m in lengths)  # type: ignore[return-value]
+    box = attrs.get("viewbox", "").replace(",", " ").split()
+    if len(box) == 4:
+        return round(float(box[2])), round(float(box[3]))
+    raise ValueError("no width/height or viewBox")
+
+
+def read_meta(path: Path, rel: str) -> ImageMeta:
+    """Dimensions of one image from its header."""
+    fmt = path.suffix.lower().lstrip(".")
+    meta = ImageMeta(rel, fmt, 0)
+    try:
+        meta.size = path.stat().st_size
+        with open(path, "rb") as f:
+            head = f.read(SVG_HEAD_BYTES if fmt == "svg" else HEADER_BYTES)
+        meta.width, meta.height = {"webp": _webp_dims, "png": _png_dims, "svg": _svg_dims}[fmt](head)
+    except (OSError, ValueError, struct.error) as e:
+        meta.error = str(e)
+    return meta
+
+
+def scan_images(root: Path, base: str = IMAGES_REL, jobs: int | None = None) -> dict[str, ImageMeta]:
+    """``{rel: ImageMeta}`` for every WebP/PNG/SVG under ``base``, sorted by path."""
+    paths = sorted(
+        Path(dirpath) / n
+        for dirpath, _, names in os.walk(root / base)
+        for n in names if n.lower().endswith(SCANNED_EXTS)
+    )
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        metas = pool.map(lambda p: read_meta(p, p.relative_to(root).as_posix()), paths)
+        return {m.rel: m for m in metas}
+
+
+def nominal_width(rel: str) -> int | None:
+    m = _VARIANT.search(rel)
+    return int(m.group(1)) if m else None
+
+
+def variant_issues(meta: ImageMeta) -> list[Issue]:
+    """Dimension and byte-budget issues of one variant (messages do not repeat the file)."""
+    if meta.error:
+        return [Issue("image-size", f"unreadable {meta.fmt} header ({meta.error})", file=meta.rel)]
+    nominal = nominal_width(meta.rel)
+    if nominal is None:
+        return []
+    issues = []
+    if meta.width > nominal:
+        issues.append(Issue("image-size", f"{meta.width}x{meta.height}, wider than its -{nominal} name",
+                            file=meta.rel))
+    budget = BYTE_BUDGETS.get(nominal)
+    if budget and meta.size > budget:
+        issues.append(Issue("image-size", f"{meta.size // 1024} KB, over the {budget // 1024} KB budget",
+                            file=meta.rel, severity=WARNING))
+    return issues
+
+
+def sibling_issues(meta: ImageMeta, images: dict[str, ImageMeta]) -> list[Issue]:
+    """A ``-1600`` variant that is no wider than its ``-800`` sibling."""
+    if meta.error or nominal_width(meta.rel) != 1600:
+        return []
+    stem, ext = meta.rel.rsplit("-1600.", 1)
+    small = images.get(f"{stem}-800.{ext}")
+    if small is None or small.error or meta.width > small.width:
+        return []
+    return [Issue("image-size", f"only {meta.width} px wide, no wider than its -800 sibling ({small.width} px)",
+                  file=meta.rel, severity=WARNING)]
@@ -0,0 +1,197 @@
+"""Responsive image variants (``<name>-<width>.webp`` / ``.avif``).
+
+The lesson pages and ``check_project.py`` expect every lesson photo as
+``assets/images/<name>-800.webp`` plus ``<name>-1600.webp``. They are
+generated here from one source image per name (``image_sources/<name>.jpg``,
+``.png``, ``.webp``, ...): each source is decoded once, resized to every
+width in ``WIDTHS`` and encoded as WebP and, when the installed Pillow was
+built with it, AVIF.
+
+Sources are never upscaled: a width above the source's own is written at the
+source width and reported as ``capped``. Jobs run over a process pool,
+largest source first. A source whose content hash (and encoder settings)
+matches ``.build/manifest.json`` and whose variants are still on disk with
+the recorded sizes is skipped without being decoded; outputs are only
+rewritten when their bytes change.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from PIL import Image, ImageOps, features
+
+from .cache import BuildManifest, hash_file, write_bytes_if_changed
+from .corpus import ROOT
+
+CACHE_NS = "image_variants"
+SOURCES_DIR = ROOT / "image_sources"
+IMAGES_DIR = ROOT / "assets" / "images"
+SOURCE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+WIDTHS = (400, 800, 1600)
+WEBP_QUALITY = 80
+WEBP_METHOD = 6
+AVIF_QUALITY = 60
+AVIF_SPEED = 6
+
+
+def available_formats() -> list[str]:
+    return ["webp", "avif"] if features.check("avif") else ["webp"]
+
+
+def variant_name(stem: str, width: int, fmt: str) -> str:
+    return f"{stem}-{width}.{fmt}"
+
+
+def _encode(img: Image.Image, fmt: str, quality: int) -> bytes:
+    buf = io.BytesIO()
+    if fmt == "webp":
+        img.save(buf, format="WEBP", quality=quality, method=WEBP_METHOD)
+    elif fmt == "avif":
+        img.save(buf, format="AVIF", quality=quality, speed=AVIF_SPEED)
+    else:
+        raise ValueError(f"unknown format {fmt!r}")
+    return buf.getvalue()
+
+
+@dataclass
+class Variant:
+    rel: str
+    width: int
+    fmt: str
+    size: int
+    capped: bool = False  # source narrower than the requested width
+
+
+@dataclass
+class SourceResult:
+    rel: str
+    raw: int
+    dims: tuple[int, int] = (0, 0)
+    variants: list[Variant] = field(default_factory=list)
+    cached: bool = False
+    written: int = 0
+    error: str | None = None
+
+
+def _render(job: tuple[str, str, str, tuple[int, ...], tuple[str, ...], int, int]) -> SourceResult:
+    """Process-pool worker: one source -> every width and format."""
+    root, rel, out_dir, widths, formats, webp_q, avif_q = job
+    src = Path(root) / rel
+    try:
+        out = SourceResult(rel, src.stat().st_size)
+        with Image.open(src) as im:
+            img = ImageOps.exif_transpose(im)
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        out.dims = img.size
+        w, h = img.size
+        stem = src.stem
+        for width in widths:
+            target = min(width, w)
+            frame = img if target == w else img.resize((target, max(1, round(h * target / w))), Image.LANCZOS)
+            for fmt in formats:
+                blob = _encode(frame, fmt, webp_q if fmt == "webp" else avif_q)
+                dest = Path(root) / out_dir / variant_name(stem, width, fmt)
+                out.written += write_bytes_if_changed(dest, blob)
+                out.variants.append(Variant(dest.relative_to(root).as_posix(), width, fmt, len(blob), target < width))
+        return out
+    except Exception as e:
+        return SourceResult(rel, 0, error=str(e))
+
+
+def source_images(base: Path = SOURCES_DIR) -> list[Path]:
+    """Every source image under ``base`` (not recursive), sorted."""
+    if not base.is_dir():
+        return []
+    return sorted(p for p in base.iterdir() if p.is_file() and p.suffix.lower() in SOURCE_EXTS)
+
+
+def _variants_present(root: Path, variants: list[dict]) -> bool:
+    return all((root / v["rel"]).is_file() and (root / v["rel"]).stat().st_size == v["size"] for v in variants)
+
+
+def build_variants(
+    paths: Iterable[Path],
+    manifest: BuildManifest,
+    widths: tuple[int, ...] = WIDTHS,
+    formats: tuple[str, ...] | None = None,
+    jobs: int | None = None,
+    root: Path = ROOT,
+    out_dir: Path = IMAGES_DIR,
+    webp_quality: int = WEBP_QUALITY,
+    avif_quality: int = AVIF_QUALITY,
+) -> list[SourceResult]:
+    """Write the variants of ``paths`` into ``out_dir``; return one result per source."""
+    formats = tuple(formats or available_formats())
+    out_rel = out_dir.relative_to(root).as_posix()
+    results: dict[str, SourceResult] = {}
+    digests: dict[str, str] = {}
+    todo = []
+    for p in paths:
+        rel = p.relative_to(root).as_posix()
+        # the output set and encoder settings are part of the key so changing them invalidates the cache
+        digests[rel] = (f"{hash_file(p)}:{out_rel}:{','.join(map(str, widths))}:{','.join(formats)}"
+                        f":w{webp_quality}m{WEBP_METHOD}a{avif_quality}s{AVIF_SPEED}")
+        cached = manifest.get(CACHE_NS, rel, digests[rel])
+        if cached is not None and _variants_present(root, cached["variants"]):
+            results[rel] = SourceResult(rel, cached["raw"], tuple(cached["dims"]),
+                                        [Variant(**v) for v in cached["variants"]], cached=True)
+        else:
+            todo.append((str(root), rel, out_rel, widths, formats, webp_quality, avif_quality))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(todo)))
+    if jobs > 1:
+        # largest first so one huge photo does not end up alone at the tail
+        todo.sort(key=lambda j: -(root / j[1]).stat().st_size)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            done = list(pool.map(_render, todo))
+    else:
+        done = [_render(job) for job in todo]
+
+    for r in done:
+        results[r.rel] = r
+        if r.error is None:
+            manifest.put(CACHE_NS, r.rel, digests[r.rel],
+                         {"raw": r.raw, "dims": list(r.dims), "variants": [vars(v) for v in r.variants]})
+    return [results[k] for k in sorted(results)]
+
+
+def _fmt(n: int) -> str:
+    return f"{n / 1e6:,.2f} MB" if n >= 1e5 else f"{n / 1e3:,.1f} KB"
+
+
+def print_report(results: list[SourceResult], top: int = 10) -> None:
+    ok = [r for r in results if r.error is None]
+    variants = [v for r in ok for v in r.variants]
+    print(f"{len(ok)} source image(s), {_fmt(sum(r.raw for r in ok))} "
+          f"({sum(r.cached for r in ok)} up to date, {sum(r.written for r in ok)} variant(s) written)")
+    if "avif" not in available_formats():
+        print("  ⚠️  Pillow has no AVIF support here: only WebP variants written")
+
+    by_kind: dict[tuple[int, str], list[Variant]] = {}
+    for v in variants:
+        by_kind.setdefault((v.width, v.fmt), []).append(v)
+    print("\nBy width:")
+    for (width, fmt), vs in sorted(by_kind.items()):
+        print(f"  {width:>5} px .{fmt:<5} {len(vs):>4} file(s) {_fmt(sum(v.size for v in vs)):>10}"
+              f"  (avg {_fmt(sum(v.size for v in vs) // len(vs))})")
+
+    capped = sorted({r.rel for r in ok for v in r.variants if v.capped})
+    if capped:
+        print(f"\n⚠️  {len(capped)} source(s) narrower than the largest width (not upscaled):")
+        for rel in capped[:top]:
+            r = next(r for r in ok if r.rel == rel)
+            print(f"  {rel} ({r.dims[0]}x{r.dims[1]})")
+
+    print(f"\nLargest {min(top, len(variants))}:")
+    for v in sorted(variants, key=lambda v: -v.size)[:top]:
+        print(f"  {v.rel:<60} {_fmt(v.size):>10}")
+
+    for r in results:
+        if r.error:
+            print(f"❌ {r.rel}: {r.error}")
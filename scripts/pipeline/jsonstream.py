@@ -0,0 +1,169 @@
+"""Streaming access to large single-object JSON shards.
+
+The dictionary shards (``dict_letters/*.json``, ``word_profiles/*.json``,
+``dictionary/chunks/*.json``) are one-line ``{headword: entry}`` objects of
+up to ~1.5 MB each. ``iter_items`` yields their ``(key, value)`` pairs while
+holding only a read chunk plus the entry being decoded, and ``ObjectWriter``
+writes such an object one item at a time, so transforms, audits and
+re-sharding run in bounded memory instead of materializing whole letters.
+
+Members are decoded with the C ``json`` scanner (``scan_once``) and the
+writer produces exactly the bytes ``json.dumps`` would, so streamed outputs
+are byte-for-byte identical to the checked-in files.
+"""
+
+from __future__ import annotations
+
+import filecmp
+import json
+import os
+import re
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+CHUNK_SIZE = 1 << 16
+
+_WS = re.compile(r"[ \t\n\r]*")
+_COLON = re.compile(r"[ \t\n\r]*:[ \t\n\r]*")
+_NEXT = re.compile(r"[ \t\n\r]*([,}])")
+
+
+class StreamFormatError(ValueError):
+    pass
+
+
+class _Reader:
+    def __init__(self, fh: Any, path: Path, chunk_size: int):
+        self.fh = fh
+        self.path = path
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.base = 0  # characters dropped from the front of ``buf``
+        self.eof = False
+
+    def fill(self) -> None:
+        chunk = self.fh.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+        self.base += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def error(self, message: str) -> StreamFormatError:
+        return StreamFormatError(f"{self.path}: {message} at character {self.base + self.pos}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise self.error(f"expected {ch!r}")
+        self.pos += 1
+
+    def member(self, scan: Any) -> tuple[str, Any, bool]:
+        """Decode ``"key": value`` plus the ``,``/``}`` after it; ``(key, value, last)``."""
+        while True:
+            buf = self.buf
+            pos = _WS.match(buf, self.pos).end()
+            try:
+                if buf[pos] != '"':
+                    raise ValueError("expected a string key")
+                key, pos = scanstring(buf, pos + 1)
+                pos = _COLON.match(buf, pos).end()
+                value, pos = scan(buf, pos)
+                # a following delimiter also proves a trailing number was not cut off
+                m = _NEXT.match(buf, pos)
+                self.pos = m.end()
+                return key, value, m.group(1) == "}"
+            except (IndexError, ValueError, AttributeError, StopIteration):
+                # incomplete member at the end of the buffer: read on and retry
+                if self.eof:
+                    raise self.error("malformed or truncated member") from None
+                self.fill()
+
+
+def iter_items(path: Path | str, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Yield ``(key, value)`` for each member of the top-level object in ``path``."""
+    path = Path(path)
+    scan = json.JSONDecoder().scan_once
+    with path.open(encoding="utf-8") as fh:
+        r = _Reader(fh, path, chunk_size)
+        r.expect("{")
+        if r.peek() == "}":
+            r.pos += 1
+        else:
+            while True:
+                key, value, last = r.member(scan)
+                yield key, value
+                if last:
+                    break
+        if r.peek():
+            raise r.error("trailing data after the object")
+
+
+def iter_many(paths: Iterable[Path | str]) -> Iterator[tuple[str, Any]]:
+    """``iter_items`` over several shards, in order."""
+    for p in paths:
+        yield from iter_items(p)
+
+
+class ObjectWriter:
+    """Write a JSON object item by item, replacing ``path`` only if it changed.
+
+    Output matches ``json.dumps(obj, ensure_ascii=False, separators=...)``.
+    Items go to a sibling temp file; ``close`` compares it with the existing
+    file and reports whether it differed (with ``replace=False`` the file is
+    left untouched -- a check mode).
+    """
+
+    def __init__(self, path: Path | str, *, separators: tuple[str, str] = (", ", ": "),
+                 replace: bool = True, trailer: str = ""):
+        self.path = Path(path)
+        self.separators = separators
+        self.replace = replace
+        self.trailer = trailer
+        self.count = 0
+        self.size = 0
+        self.changed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._fh = self._tmp.open("w", encoding="utf-8", newline="")
+        self._fh.write("{")
+
+    def write(self, key: str, value: Any) -> None:
+        item_sep, key_sep = self.separators
+        self._fh.write(("" if not self.count else item_sep)
+                       + json.dumps(key, ensure_ascii=False) + key_sep
+                       + json.dumps(value, ensure_ascii=False, separators=self.separators))
+        self.count += 1
+
+    def close(self) -> bool:
+        self._fh.write("}" + self.trailer)
+        self._fh.close()
+        self.size = self._tmp.stat().st_size
+        self.changed = not (self.path.exists() and filecmp.cmp(self._tmp, self.path, shallow=False))
+        if self.changed and self.replace:
+            os.replace(self._tmp, self.path)
+        else:
+            self._tmp.unlink()
+        return self.changed
+
+    def abort(self) -> None:
+        self._fh.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ObjectWriter":
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
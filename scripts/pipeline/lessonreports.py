@@ -0,0 +1,236 @@
+"""Lesson integrity and Persian-mixing reports, and the registry summary.
+
+Three checked-in files are generated here from the registry lessons:
+
+* ``assets/data/lesson_integrity_report.json`` -- per lesson id, the size of
+  the vocabulary, collocation, grammar and exercise sections;
+* ``assets/data/lesson_fa_mixed_report.json`` -- every bilingual
+  ``{"en": ..., "fa": ...}`` field, at any depth, whose ``fa`` text is still
+  largely English (machine-translation leftovers such as
+  ``"Two coworkers ایستاده‌اند در یک کارخانه"``), with short snippets of both
+  sides;
+* ``assets/data/registry_summary.json`` -- compact per-lesson card stats
+  (``lesson_stats``, the same numbers ``computeLessonStats`` in
+  ``js/main.js`` derives, plus the integrity counts), so the index page
+  reads one small file instead of fetching every lesson.
+
+Script detection is one precompiled pass per ``fa`` string: the share of
+Latin letters among Latin + Persian letters. A field is flagged when that
+share reaches ``MIXED_RATIO``. Each lesson's scan result is cached in the
+build manifest by file hash (and scan settings), so after one lesson edit
+only that lesson is parsed again.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from .cache import BuildManifest, hash_file
+from .corpus import REGISTRY_REL, resolve_lesson_path
+
+INTEGRITY_REL = "assets/data/lesson_integrity_report.json"
+FA_MIXED_REL = "assets/data/lesson_fa_mixed_report.json"
+SUMMARY_REL = "assets/data/registry_summary.json"
+CACHE_NS = "lesson_reports"
+SCAN_VERSION = 2
+SUMMARY_VERSION = 1
+
+MIXED_RATIO = 0.2
+SNIP_CHARS = 160
+
+# Output key order (the build manifest stores cached results with sorted keys).
+INTEGRITY_KEYS = ("vocabulary_count", "vocabularyDetailed_count", "collocations_count", "has_grammar", "has_exercises")
+FIELD_KEYS = ("field", "latin", "en_snip", "fa_snip")
+STATS_KEYS = ("vocab", "practice", "levels", "versions", "hasToefl",
+              "vocabulary", "vocabularyDetailed", "collocations", "grammar", "exercises")
+
+TEXT_VERSIONS = ("simpleEnglish", "intermediateEnglish", "advancedEnglish")
+TOEFL_PRACTICE = ("questions", "speakingTasks", "writingTasks", "reading", "listening")
+
+_LATIN = re.compile(r"[A-Za-z]+")
+_PERSIAN = re.compile(r"[\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFC]+")
+
+
+def latin_share(text: str) -> float:
+    """Share of Latin letters among the Latin and Persian/Arabic letters of ``text``."""
+    latin = sum(map(len, _LATIN.findall(text)))
+    if not latin:
+        return 0.0
+    persian = sum(map(len, _PERSIAN.findall(text)))
+    return latin / (latin + persian)
+
+
+def bilingual_fields(value: Any, path: str = "") -> Iterator[tuple[str, str, str]]:
+    """``(path, en, fa)`` for every ``{en, fa}`` string pair, e.g. ``scenarios[2]``."""
+    if isinstance(value, dict):
+        en, fa = value.get("en"), value.get("fa")
+        if isinstance(en, str) and isinstance(fa, str):
+            yield path, en, fa
+        for k, v in value.items():
+            if isinstance(v, (dict, list)):
+                yield from bilingual_fields(v, f"{path}.{k}" if path else k)
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            if isinstance(v, (dict, list)):
+                yield from bilingual_fields(v, f"{path}[{i}]")
+
+
+def _count(value: Any) -> int:
+    return len(value) if isinstance(value, (list, dict)) else 0
+
+
+def integrity_row(lesson: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "vocabulary_count": _count(lesson.get("vocabulary")),
+        "vocabularyDetailed_count": _count(lesson.get("vocabularyDetailed")),
+        "collocations_count": _count(lesson.get("collocations")),
+        "has_grammar": bool(lesson.get("grammar")),
+        "has_exercises": bool(lesson.get("exercises")),
+    }
+
+
+def _truthy(value: Any) -> bool:
+    """JavaScript truthiness (``{}`` and ``[]`` are true)."""
+    return value is not None and value is not False and value != 0 and value != ""
+
+
+def _values(value: Any) -> list[Any]:
+    """``Object.values`` of a JSON object or array (``[]`` for anything else)."""
+    if isinstance(value, dict):
+        return list(value.values())
+    return value if isinstance(value, list) else []
+
+
+def lesson_stats(lesson: dict[str, Any]) -> dict[str, Any]:
+    """Card stats, kept in step with ``computeLessonStats`` in ``js/main.js``."""
+    vocab = _count(lesson.get("vocabularyDetailed")) if isinstance(lesson.get("vocabularyDetailed"), list) else 0
+    vocab += sum(len(v) for v in _values(lesson.get("vocabularyExtended")) if isinstance(v, list))
+
+    practice = 0
+    for v in _values(lesson.get("practice")):
+        if isinstance(v, list):
+            practice += len(v)
+        elif isinstance(v, dict):
+            practice += sum(len(vv) for vv in v.values() if isinstance(vv, list))
+    toefl = lesson.get("toefl")
+    if isinstance(toefl, dict):
+        practice += sum(len(toefl[k]) for k in TOEFL_PRACTICE if isinstance(toefl.get(k), list))
+
+    versions = sum(1 for k in TEXT_VERSIONS if _truthy(lesson.get(k)))
+    descriptions = lesson.get("descriptions")
+    levels = len(descriptions) if isinstance(descriptions, (dict, list)) else versions
+
+    integrity = integrity_row(lesson)
+    return {
+        "vocab": vocab,
+        "practice": practice,
+        "levels": levels,
+        "versions": versions,
+        "hasToefl": _truthy(toefl),
+        "vocabulary": integrity["vocabulary_count"],
+        "vocabularyDetailed": integrity["vocabularyDetailed_count"],
+        "collocations": integrity["collocations_count"],
+        "grammar": integrity["has_grammar"],
+        "exercises": integrity["has_exercises"],
+    }
+
+
+def mixed_fields(lesson: dict[str, Any], ratio: float = MIXED_RATIO) -> list[dict[str, Any]]:
+    out = []
+    for path, en, fa in bilingual_fields(lesson):
+        share = latin_share(fa)
+        if share and share >= ratio and fa.strip():
+            out.append({
+                "field": path,
+                "latin": round(share, 2),
+                "en_snip": en.strip()[:SNIP_CHARS],
+                "fa_snip": fa.strip()[:SNIP_CHARS],
+            })
+    return out
+
+
+@dataclass
+class ReportResult:
+    lessons: int = 0
+    parsed: int = 0
+    fields: int = 0
+    problems: list[str] = field(default_factory=list)
+    integrity: dict[str, Any] = field(default_factory=dict)
+    stats: dict[str, Any] = field(default_factory=dict)
+    mixed: list[dict[str, Any]] = field(default_factory=list)
+
+
+def scan_lessons(root: Path, manifest: BuildManifest | None = None, ratio: float = MIXED_RATIO) -> ReportResult:
+    """Scan the registry lessons, reusing cached results of unchanged files."""
+    res = ReportResult()
+    registry = json.loads((root / REGISTRY_REL).read_text(encoding="utf-8"))
+    done: set[str] = set()
+    for entry in registry.get("lessons", []):
+        if not (isinstance(entry, dict) and entry.get("id")) or str(entry["id"]) in done:
+            continue
+        lid = str(entry["id"])
+        done.add(lid)
+        path = resolve_lesson_path(root, entry.get("file", ""))
+        rel = path.relative_to(root).as_posix()
+        if not path.exists():
+            res.problems.append(f"{lid}: lesson file missing ({rel})")
+            continue
+        digest = f"{hash_file(path)}:v{SCAN_VERSION}:{ratio}"
+        scan = manifest.get(CACHE_NS, rel, digest) if manifest else None
+        if scan is None:
+            try:
+                lesson = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError as e:
+                res.problems.append(f"{lid}: {rel} is not valid JSON ({e})")
+                continue
+            scan = {"integrity": integrity_row(lesson), "stats": lesson_stats(lesson),
+                    "fields": mixed_fields(lesson, ratio)}
+            res.parsed += 1
+            if manifest:
+                manifest.put(CACHE_NS, rel, digest, scan)
+        res.lessons += 1
+        res.integrity[lid] = {k: scan["integrity"][k] for k in INTEGRITY_KEYS}
+        res.stats[lid] = {k: scan["stats"][k] for k in STATS_KEYS}
+        if scan["fields"]:
+            fields = [{k: f[k] for k in FIELD_KEYS} for f in scan["fields"]]
+            res.mixed.append({"id": lid, "file": rel, "fields": fields})
+            res.fields += len(scan["fields"])
+    if manifest:
+        manifest.prune(CACHE_NS)
+    return res
+
+
+def render_integrity(res: ReportResult) -> str:
+    return json.dumps(res.integrity, ensure_ascii=False, indent=2)
+
+
+def render_fa_mixed(res: ReportResult, generated_at: str) -> str:
+    return json.dumps({"generatedAt": generated_at, "count": len(res.mixed), "lessons": res.mixed},
+                      ensure_ascii=False, indent=2)
+
+
+def render_summary(res: ReportResult) -> str:
+    return json.dumps({"version": SUMMARY_VERSION, "lessons": res.stats},
+                      ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def render_outputs(root: Path, res: ReportResult) -> dict[str, str]:
+    """``{rel: text}`` for all three files; ``generatedAt`` is kept while the findings are unchanged."""
+    try:
+        old = json.loads((root / FA_MIXED_REL).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        old = {}
+    if isinstance(old, dict) and old.get("lessons") == res.mixed and "generatedAt" in old:
+        generated_at = old["generatedAt"]
+    else:
+        generated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return {
+        INTEGRITY_REL: render_integrity(res),
+        FA_MIXED_REL: render_fa_mixed(res, generated_at),
+        SUMMARY_REL: render_summary(res),
+    }
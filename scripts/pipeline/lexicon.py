@@ -0,0 +1,81 @@
+"""Prebuilt en -> fa lexicon lookup (``lexicon_lookup.json``).
+
+``lexicon.json`` is an ``entries`` list that ``js/word.js`` used to re-index
+into ``byEn``/``byId`` maps on every page load, and ``js/lesson.js`` looked
+words up in ``lexicon_updated.json``, a plain word list with no
+translations. ``sanitize_lexicon.py`` now writes the index itself::
+
+    assets/data/lexicon_lookup.json
+        {"version": 1, "normalize": ..., "count": n,
+         "byEn": {normalized en: {id, en, fa, lessons}}, "byId": {id: normalized en}}
+
+``byEn`` keys use ``normalize_word`` (``normalizeWord`` in the browser:
+trim, lowercase, collapse whitespace, curly apostrophe -> ``'``); like the
+old in-browser index, a later entry wins over an earlier one with the same
+key. With ``prefix > 0`` the maps are split by the first ``prefix``
+characters of the key into ``lexicon_lookup/<prefix>.json`` plus a
+``manifest.json``, so a page loads only the shards its words need.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+LOOKUP_REL = "assets/data/lexicon_lookup.json"
+SHARDS_REL = "assets/data/lexicon_lookup"
+MANIFEST_NAME = "manifest.json"
+LOOKUP_VERSION = 1
+NORMALIZE = "trim+lowercase+collapse-whitespace+apostrophe"
+
+_WS = re.compile(r"\s+")
+_SHARD_CHAR = re.compile(r"[a-z0-9]")
+
+
+def normalize_word(text: Any) -> str:
+    """``normalizeWord`` in ``js/word.js`` / ``js/utils.js``."""
+    return _WS.sub(" ", str(text or "").strip().lower()).replace("’", "'")
+
+
+def shard_of(key: str, prefix: int) -> str:
+    """First ``prefix`` characters of ``key``, non a-z/0-9 as ``_``, padded with ``_``."""
+    head = "".join(c if _SHARD_CHAR.fullmatch(c) else "_" for c in key[:prefix])
+    return head.ljust(prefix, "_")
+
+
+def build_lookup(entries: list[Any]) -> tuple[dict[str, Any], dict[str, str]]:
+    """``(byEn, byId)`` for the lexicon entries, keyed the way the browser looks them up."""
+    by_en: dict[str, Any] = {}
+    by_id: dict[str, str] = {}
+    for e in entries:
+        if not isinstance(e, dict):
+            continue
+        key = normalize_word(e.get("en") or e.get("word") or e.get("id"))
+        if not key:
+            continue
+        by_en[key] = {k: e[k] for k in ("id", "en", "fa", "lessons") if k in e}
+        if e.get("id"):
+            by_id[str(e["id"])] = key
+    return by_en, by_id
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def render_lookup(entries: list[Any], prefix: int = 0) -> dict[str, str]:
+    """``{rel: text}`` of every lookup file for ``prefix`` (0 = one file)."""
+    by_en, by_id = build_lookup(entries)
+    head = {"version": LOOKUP_VERSION, "normalize": NORMALIZE, "count": len(by_en)}
+    if prefix <= 0:
+        return {LOOKUP_REL: _dumps({**head, "byEn": by_en, "byId": by_id})}
+
+    shards: dict[str, dict[str, dict[str, Any]]] = {}
+    for key, entry in by_en.items():
+        shards.setdefault(shard_of(key, prefix), {"byEn": {}, "byId": {}})["byEn"][key] = entry
+    for eid, key in by_id.items():
+        shards.setdefault(shard_of(normalize_word(eid), prefix), {"byEn": {}, "byId": {}})["byId"][eid] = key
+    files = {f"{SHARDS_REL}/{name}.json": _dumps(shards[name]) for name in sorted(shards)}
+    files[f"{SHARDS_REL}/{MANIFEST_NAME}"] = _dumps({**head, "prefix": prefix, "shards": sorted(shards)})
+    return files
@@ -0,0 +1,155 @@
+"""Content-hashed precache manifest for the service worker.
+
+``sw.js`` used to precache a hand-maintained ``CORE_ASSETS`` list under a
+hand-bumped ``CACHE_VERSION``, so every release threw away the whole cache,
+multi-MB data files included. The precache list is now derived here:
+
+* every top-level ``*.html`` page,
+* every local stylesheet/script those pages reference,
+* the data files and icons in ``DATA_ASSETS`` (or their ``DATA_LAYOUTS``
+  alternative, e.g. the lexicon lookup shards),
+
+each with a revision (a prefix of the sha256 of its bytes) and its size. The
+list is emitted as ``precache-manifest.js`` (``self.__PRECACHE``), which
+``sw.js`` loads with ``importScripts``; on install it only re-fetches entries
+whose revision changed, and on activate it drops entries that are no longer
+listed.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+
+from .cache import hash_bytes
+
+OUT_REL = "precache-manifest.js"
+REVISION_CHARS = 16
+DEFAULT_BUDGET = 512 * 1024  # per file
+DEFAULT_TOTAL_BUDGET = 8 * 1024 * 1024
+
+# Shell references that are precached (besides the pages themselves).
+REF_SUFFIXES = (".css", ".js")
+DATA_ASSETS = (
+    "manifest.json",
+    "assets/data/registry.json",
+    "assets/data/registry_summary.json",
+    "assets/data/lexicon.json",
+    "assets/data/lexicon_lookup.json",
+    "assets/data/lexicon_updated.json",
+    "assets/data/word_context_index.json",
+    "assets/data/dict_en_subset.json",
+    "assets/data/collocations_index.json",
+    "assets/images/placeholders.json",
+    "assets/icons/icon-192.png",
+    "assets/icons/icon-512.png",
+)
+# Data assets with an alternative layout, precached instead when the listed
+# file is absent (``sanitize_lexicon.py --shard-prefix`` replaces the lookup
+# map with its shards and manifest).
+DATA_LAYOUTS = {
+    "assets/data/lexicon_lookup.json": "assets/data/lexicon_lookup/*.json",
+}
+
+
+class _RefParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.refs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        for k, v in attrs:
+            if k in ("href", "src") and v and not v.startswith(("http://", "https://", "//", "data:", "#")):
+                self.refs.append(v)
+
+
+@dataclass
+class PrecacheEntry:
+    url: str
+    revision: str
+    size: int
+
+
+def _local_ref(value: str) -> str:
+    return value.split("#", 1)[0].split("?", 1)[0].removeprefix("./").lstrip("/")
+
+
+def precache_urls(root: Path) -> tuple[list[str], list[str]]:
+    """Precached paths (relative to the site root) and missing references."""
+    urls: set[str] = set()
+    missing: list[str] = []
+    for page in sorted(root.glob("*.html")):
+        urls.add(page.name)
+        parser = _RefParser()
+        parser.feed(page.read_text(encoding="utf-8", errors="replace"))
+        for ref in parser.refs:
+            rel = _local_ref(ref)
+            if rel.endswith(REF_SUFFIXES):
+                if (root / rel).is_file():
+                    urls.add(rel)
+                else:
+                    missing.append(f"{page.name}: {ref}")
+    for rel in DATA_ASSETS:
+        alt = sorted(p.relative_to(root).as_posix() for p in root.glob(DATA_LAYOUTS[rel])) if rel in DATA_LAYOUTS else []
+        if (root / rel).is_file():
+            urls.add(rel)
+        elif alt:
+            urls.update(alt)
+        else:
+            missing.append(f"DATA_ASSETS: {rel}")
+    return sorted(urls), sorted(set(missing))
+
+
+def build_entries(root: Path, urls: list[str]) -> list[PrecacheEntry]:
+    entries = []
+    for rel in urls:
+        data = (root / rel).read_bytes()
+        entries.append(PrecacheEntry(rel, hash_bytes(data)[:REVISION_CHARS], len(data)))
+    return entries
+
+
+def manifest_version(entries: list[PrecacheEntry]) -> str:
+    return hash_bytes("\n".join(f"{e.url} {e.revision}" for e in entries).encode("utf-8"))[:12]
+
+
+def render_js(entries: list[PrecacheEntry]) -> str:
+    lines = ",\n".join(
+        "    " + json.dumps({"url": e.url, "revision": e.revision, "size": e.size}, ensure_ascii=False)
+        for e in entries
+    )
+    return (
+        "/* Precache manifest for sw.js.\n"
+        " * GENERATED by scripts/gen_precache.py -- do not edit.\n"
+        " */\n"
+        "self.__PRECACHE = {\n"
+        f'  "version": "{manifest_version(entries)}",\n'
+        '  "entries": [\n'
+        f"{lines}\n"
+        "  ]\n"
+        "};\n"
+    )
+
+
+def budget_warnings(entries: list[PrecacheEntry], budget: int = DEFAULT_BUDGET,
+                    total_budget: int = DEFAULT_TOTAL_BUDGET) -> list[str]:
+    """Files (and the total) over the precache size budget."""
+    out = [f"{e.url} is {e.size / 1024:,.0f} KB (budget {budget / 1024:,.0f} KB)"
+           for e in sorted(entries, key=lambda e: -e.size) if e.size > budget]
+    total = sum(e.size for e in entries)
+    if total > total_budget:
+        out.append(f"precache total is {total / 1024:,.0f} KB (budget {total_budget / 1024:,.0f} KB)")
+    return out
+
+
+def generate(root: Path) -> tuple[str, list[PrecacheEntry], list[str]]:
+    """``(precache-manifest.js text, entries, missing references)``."""
+    urls, missing = precache_urls(root)
+    entries = build_entries(root, urls)
+    return render_js(entries), entries, missing
+
+
+def is_current(root: Path) -> bool:
+    path = root / OUT_REL
+    return path.exists() and path.read_text(encoding="utf-8") == generate(root)[0]
@@ -0,0 +1,139 @@
+"""Lesson quality stage (hard errors + warnings) over a loaded corpus.
+
+Used by ``scripts/lesson-quality-check.py`` and ``scripts/build.py``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from .cache import write_text_if_changed
+from .corpus import Corpus
+from .imagemeta import scan_images, sibling_issues, variant_issues
+from .schema import validate_lesson, validate_registry
+from .validate import WARNING
+
+def check_quality(corpus: Corpus) -> dict[str, Any]:
+    """Return ``{"info", "errors", "warnings"}`` for the corpus."""
+    root = corpus.root
+    errors: list[str] = []
+    warnings: list[str] = []
+    info: dict[str, Any] = {}
+
+    if corpus.registry_error:
+        errors.append(corpus.registry_error)
+
+    registry = corpus.registry
+    lessons_index = corpus.entries
+    info["registry_lessonCount"] = registry.get("lessonCount") if isinstance(registry, dict) else None
+    info["registry_entries"] = len(lessons_index)
+
+    if not corpus.lessons_dir.exists():
+        errors.append(f"Missing lessons directory: {corpus.lessons_dir}")
+    info["lesson_files_on_disk"] = sum(
+        1 for l in corpus.all_lessons() if l.path.parent.resolve() == corpus.lessons_dir.resolve()
+    )
+
+    if isinstance(registry, dict):
+        errors.extend(f"registry.json: {i.pointer} {i.message}" for i in validate_registry(registry))
+
+    images = scan_images(root)
+    info["images_scanned"] = len(images)
+    # a -1600 no wider than its -800 is reported by check_project.py; counted here only
+    info["images_1600_not_wider"] = sum(bool(sibling_issues(m, images)) for m in images.values())
+
+    # Validate each registry entry
+    seen_ids = set()
+    titles = []
+    for entry in lessons_index:
+        lid = entry.get("id")
+        title = entry.get("title")
+        titles.append(title or "")
+        if not lid:
+            continue  # reported by the registry schema
+        if lid in seen_ids:
+            errors.append(f"Duplicate lesson id in registry: {lid}")
+        seen_ids.add(lid)
+
+        file_rel = entry.get("file")
+        if not file_rel:
+            continue  # reported by the registry schema
+        item = corpus.lesson_for(entry)
+        if item is None:
+            errors.append(f"{lid}: lesson file missing: {file_rel}")
+            continue
+        if not item.loaded:
+            errors.append(f"{lid}: lesson JSON parse error: {item.error}")
+            continue
+        lesson = item.data
+
+        # Structure: the shared lesson schema (errors + warnings)
+        for issue in validate_lesson(lesson):
+            msg = f"{lid}: {issue.pointer} {issue.message}"
+            (warnings if issue.severity == WARNING else errors).append(msg)
+
+        if lesson.get("id") != lid:
+            errors.append(f"{lid}: lesson.id mismatch (found {lesson.get('id')})")
+        img = lesson.get("image") if isinstance(lesson.get("image"), dict) else {}
+        for k in ("src800", "src1600"):
+            rel = img.get(k)
+            if isinstance(rel, str) and rel and not (root / rel).exists():
+                errors.append(f"{lid}: missing image asset: {rel}")
+            elif isinstance(rel, str) and rel.lstrip("./") in images:
+                for issue in variant_issues(images[rel.lstrip("./")]):
+                    (warnings if issue.severity == WARNING else errors).append(f"{lid}: image.{k} {rel}: {issue.message}")
+
+    # Duplicate title warnings
+    title_counts = Counter([t.strip().lower() for t in titles if t and t.strip()])
+    dup_titles = [t for t, c in title_counts.items() if c > 1]
+    for t in dup_titles:
+        warnings.append(f"Duplicate title appears {title_counts[t]} times: {t}")
+
+    # Orphan lesson files (warnings)
+    for orphan in corpus.orphans:
+        warnings.append(f"Orphan lesson JSON not referenced in registry: {orphan.rel}")
+
+    return {"info": info, "errors": errors, "warnings": warnings}
+
+
+def render_markdown(report: dict[str, Any]) -> str:
+    info = report["info"]
+    errors = report["errors"]
+    warnings = report["warnings"]
+    md = []
+    md.append(f"# Lesson Quality Report\n")
+    md.append(f"- Registry entries: {info.get('registry_entries')}\n")
+    md.append(f"- Lesson files on disk: {info.get('lesson_files_on_disk')}\n")
+    md.append(f"- Errors: {len(errors)}\n")
+    md.append(f"- Warnings: {len(warnings)}\n")
+    if errors:
+        md.append("\n## Errors\n")
+        for e in errors: md.append(f"- {e}\n")
+    if warnings:
+        md.append("\n## Warnings\n")
+        for w in warnings: md.append(f"- {w}\n")
+    return "".join(md)
+
+
+def write_reports(report: dict[str, Any], root: Path, json_out: str = "", md_out: str = "") -> None:
+    if json_out:
+        write_text_if_changed(root / json_out, json.dumps(report, ensure_ascii=False, indent=2))
+    if md_out:
+        write_text_if_changed(root / md_out, render_markdown(report))
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    errors = report["errors"]
+    warnings = report["warnings"]
+    print(f"OK: {report['ok']}")
+    print(f"Errors: {len(errors)}")
+    print(f"Warnings: {len(warnings)}")
+    if errors:
+        print("\nERRORS:")
+        for e in errors[:50]: print(" -", e)
+    if warnings:
+        print("\nWARNINGS:")
+        for w in warnings[:50]: print(" -", w)
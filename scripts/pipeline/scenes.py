@@ -0,0 +1,189 @@
+"""Scene classification rules shared by the Python generator and the browser.
+
+``SCENE_RULES`` is the single source of truth: an ordered table of
+``(category, conditions)`` where every condition is a list of literal terms
+and a rule fires when each of its conditions has at least one term somewhere
+in the lesson text. The first rule that fires wins; ``general`` otherwise.
+
+All terms of all rules are compiled into one trie-shaped regex, so a lesson's
+text is scanned once (instead of one ``re.search`` per condition) and the set
+of satisfied conditions is collected in that single pass. The same compiled
+pattern and tables are emitted to ``js/scene-rules.js`` for
+``js/collocation-generator.js`` (see ``scripts/emit_scene_rules.py``), so the
+two engines cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator
+
+# Lesson fields whose text is classified (dotted paths; nested lists/objects
+# contribute every string they contain).
+SCENE_FIELDS = (
+    "place", "fullDescription",
+    "analysis.setting", "analysis.settingFa", "analysis.mood", "analysis.moodFa",
+    "analysis.objects", "analysis.themes",
+)
+
+FALLBACK = "general"
+
+# Order matters: more specific scenes first.
+SCENE_RULES: list[tuple[str, list[list[str]]]] = [
+    # Urban
+    ("subway-exit", [["subway", "metro", "underground", "station", "platform", "turnstile"], ["exit", "stairs", "escalator"]]),
+    ("public-transport", [["public transport", "carriage", "train car", "subway car", "bus interior", "inside a bus", "inside a train"]]),
+    ("bus-stop", [["bus stop", "timetable", "schedule", "route"]]),
+    ("city-crosswalk", [["crosswalk", "marked crosswalk", "intersection", "traffic light"]]),
+    ("outdoor-cafe", [["outdoor caf", "cafe", "coffee shop"], ["street", "sidewalk", "urban", "city"]]),
+    ("urban-shopping", [["shopping street", "storefront", "shop window", "boutique", "sale", "market"]]),
+    ("rooftop-sunset", [["rooftop", "skyline", "city view", "elevated urban"], ["sunset", "dusk", "evening"]]),
+    ("city-sidewalk", [["sidewalk", "bicycles", "bike", "cafés", "cafe"], ["city", "urban"]]),
+    ("city-street", [["busy city street", "urban street", "city street", "downtown"]]),
+    # Nature
+    ("forest-night", [["dark forest", "night forest", "flashlight"]]),
+    ("river-rapids", [["rapids", "whitewater", "strong current", "fast-flowing", "rushing water", "torrent"]]),
+    ("coastal-cliff", [["coastal cliff", "cliff", "coastline"], ["sunset", "dusk"]]),
+    ("beach", [["beach", "shoreline", "ocean", "waves"]]),
+    ("winter-snow", [["winter", "snowfall", "snow", "icy", "blizzard"]]),
+    ("desert-dunes", [["desert", "dunes", "sand dune"]]),
+    ("mountain-cliffs", [["high mountain", "cliffs", "altitude", "harness", "climbing"]]),
+    ("mountain-valley", [["mountain valley", "valley", "snow-capped", "scenic trail", "breathtaking"]]),
+    ("lake-sunset", [["lake", "overlook", "horizon", "golden hour"], ["sunset", "dusk"]]),
+    ("campsite-night", [["campsite", "camp site", "tent", "string lights", "campfire"], ["star", "night"]]),
+    ("campsite", [["campsite", "camp site", "tent", "string lights", "campfire"]]),
+    ("park", [["park", "walking paths", "bench"]]),
+    ("office", [["office", "workspace", "desk", "computer"]]),
+    ("forest-day", [["forest", "woodland", "trail", "path"]]),
+]
+
+# Escaped the same way for Python and JavaScript regex syntax.
+_META = re.compile(r"([\\^$.|?*+()\[\]{}/])")
+
+
+def _escape(s: str) -> str:
+    return _META.sub(r"\\\1", s)
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    """Regex for a character trie; optional tails are greedy, so the longest term wins."""
+    end = "" in node
+    alts = [_escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not alts:
+        return ""
+    body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    if end:
+        return ("(?:" + body + ")?") if len(alts) > 1 or len(body) > 1 else body + "?"
+    return body
+
+
+class SceneMatcher:
+    """The rules table compiled into one single-pass matcher."""
+
+    def __init__(self, rules: list[tuple[str, list[list[str]]]] = SCENE_RULES, fallback: str = FALLBACK):
+        self.fallback = fallback
+        self.conditions: list[frozenset[str]] = []
+        cond_ids: dict[frozenset[str], int] = {}
+        self.rules: list[tuple[str, list[int]]] = []
+        for category, conds in rules:
+            ids = []
+            for terms in conds:
+                key = frozenset(t.lower() for t in terms)
+                if key not in cond_ids:
+                    cond_ids[key] = len(self.conditions)
+                    self.conditions.append(key)
+                ids.append(cond_ids[key])
+            self.rules.append((category, ids))
+
+        terms = sorted({t for c in self.conditions for t in c})
+        direct: dict[str, set[int]] = {t: set() for t in terms}
+        for i, cond in enumerate(self.conditions):
+            for t in cond:
+                direct[t].add(i)
+        # Only the longest term starting at a position is reported, so a hit
+        # also credits every term that is a prefix of it.
+        self.credits: dict[str, list[int]] = {
+            t: sorted(set().union(*(direct[p] for p in terms if t.startswith(p))))
+            for t in terms
+        }
+
+        trie: dict[str, Any] = {}
+        for t in terms:
+            node = trie
+            for ch in t:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        self.pattern = _trie_pattern(trie)
+        self._regex = re.compile(f"(?=({self.pattern}))")
+
+    def hits(self, text: str) -> set[int]:
+        """Ids of the conditions satisfied somewhere in (lowercased) ``text``."""
+        found: set[int] = set()
+        seen: set[str] = set()
+        for m in self._regex.finditer(text):
+            term = m.group(1)
+            if term not in seen:
+                seen.add(term)
+                found.update(self.credits[term])
+        return found
+
+    def classify_text(self, text: str) -> str:
+        found = self.hits(text.lower())
+        for category, ids in self.rules:
+            if all(i in found for i in ids):
+                return category
+        return self.fallback
+
+    def classify(self, lesson: dict[str, Any]) -> str:
+        return self.classify_text(scene_text(lesson))
+
+    def to_js_payload(self) -> dict[str, Any]:
+        return {
+            "version": 1,
+            "fields": list(SCENE_FIELDS),
+            "pattern": self.pattern,
+            "credits": self.credits,
+            "rules": [[category, ids] for category, ids in self.rules],
+            "fallback": self.fallback,
+        }
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value:
+            yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+
+
+def scene_text(lesson: dict[str, Any]) -> str:
+    """The text a lesson is classified on (``SCENE_FIELDS`` joined by `` | ``)."""
+    parts: list[str] = []
+    for path in SCENE_FIELDS:
+        value: Any = lesson
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        parts.extend(_strings(value))
+    return " | ".join(parts)
+
+
+MATCHER = SceneMatcher()
+
+
+def classify_scene(lesson: dict[str, Any]) -> str:
+    return MATCHER.classify(lesson)
+
+
+def render_js(matcher: SceneMatcher = MATCHER) -> str:
+    payload = json.dumps(matcher.to_js_payload(), ensure_ascii=False, indent=2)
+    return (
+        "/* Scene classification rules for js/collocation-generator.js.\n"
+        " * GENERATED by scripts/emit_scene_rules.py from scripts/pipeline/scenes.py -- do not edit.\n"
+        " */\n"
+        f"window.SceneRules = {payload};\n"
+    )
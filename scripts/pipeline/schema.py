@@ -0,0 +1,193 @@
+"""Declarative lesson/registry schema, compiled once into validator closures.
+
+The structural rules used to be written out separately in
+``check_project.py`` (>= 35 ``vocabularyDetailed``), ``pipeline/quality.py``
+(warn under 12) and ``pipeline/smoke.py`` (its own ``REQUIRED_TOP``), and they
+disagreed. ``LESSON_SCHEMA`` and ``REGISTRY_SCHEMA`` are now the only copy;
+all three checkers call ``validate_lesson`` / ``validate_registry``.
+
+A schema is a tree of ``Obj``/``Arr``/``Str``/``Int``/``Present`` nodes.
+``compile_schema`` turns it into nested closures with every key, escaped
+pointer suffix and threshold bound as a local, so validation walks the data
+without consulting the schema objects again. Findings are ``Issue`` records
+with RFC 6901 pointers (``/toefl/questions/1/answer``); ``error`` rules are
+hard requirements, ``warn_*`` thresholds produce warnings.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .validate import ERROR, WARNING, Issue
+
+# check(value, pointer, out) -- ``out`` collects (severity, pointer, message)
+Check = Callable[[Any, str, list], None]
+
+_WORD = re.compile(r"[A-Za-z']+")
+
+
+def _escape(key: str) -> str:
+    return "/" + key.replace("~", "~0").replace("/", "~1")
+
+
+@dataclass
+class Node:
+    required: bool = True
+
+
+@dataclass
+class Present(Node):
+    """Any value; only its presence is required."""
+
+
+@dataclass
+class Str(Node):
+    nonempty: bool = True
+    warn_min_words: int = 0
+
+
+@dataclass
+class Int(Node):
+    pass
+
+
+@dataclass
+class Arr(Node):
+    min_items: int = 0
+    warn_min_items: int = 0
+    items: Node | None = None
+
+
+@dataclass
+class Obj(Node):
+    fields: dict[str, Node] = field(default_factory=dict)
+
+
+def _compile(node: Node) -> Check:
+    if isinstance(node, Obj):
+        children = [(key, _escape(key), _compile(child), child.required) for key, child in node.fields.items()]
+
+        def check_obj(value: Any, ptr: str, out: list) -> None:
+            if not isinstance(value, dict):
+                out.append((ERROR, ptr, "must be an object"))
+                return
+            get = value.get
+            for key, suffix, check, required in children:
+                v = get(key)
+                if v is None:
+                    if required:
+                        out.append((ERROR, ptr + suffix, "missing"))
+                    continue
+                check(v, ptr + suffix, out)
+        return check_obj
+
+    if isinstance(node, Arr):
+        min_items, warn_min, item_check = node.min_items, node.warn_min_items, node.items and _compile(node.items)
+
+        def check_arr(value: Any, ptr: str, out: list) -> None:
+            if not isinstance(value, list):
+                out.append((ERROR, ptr, "must be an array"))
+                return
+            n = len(value)
+            if n < min_items:
+                out.append((ERROR, ptr, f"needs at least {min_items} item(s), found {n}"))
+            elif n < warn_min:
+                out.append((WARNING, ptr, f"has only {n} item(s) (recommended >= {warn_min})"))
+            if item_check is not None:
+                for i, item in enumerate(value):
+                    item_check(item, f"{ptr}/{i}", out)
+        return check_arr
+
+    if isinstance(node, Str):
+        nonempty, warn_words = node.nonempty, node.warn_min_words
+
+        def check_str(value: Any, ptr: str, out: list) -> None:
+            if not isinstance(value, str):
+                out.append((ERROR, ptr, "must be a string"))
+            elif nonempty and not value.strip():
+                out.append((ERROR, ptr, "must not be empty"))
+            elif warn_words:
+                words = len(_WORD.findall(value))
+                if words < warn_words:
+                    out.append((WARNING, ptr, f"is short ({words} words, recommended >= {warn_words})"))
+        return check_str
+
+    if isinstance(node, Int):
+        def check_int(value: Any, ptr: str, out: list) -> None:
+            if not isinstance(value, int) or isinstance(value, bool):
+                out.append((ERROR, ptr, "must be an integer"))
+        return check_int
+
+    def check_present(value: Any, ptr: str, out: list) -> None:
+        return None
+    return check_present
+
+
+def compile_schema(schema: Node, check_name: str) -> Callable[[Any, str], list[Issue]]:
+    """``validate(data, file) -> [Issue]`` for ``schema``."""
+    check = _compile(schema)
+
+    def validate(data: Any, file: str = "") -> list[Issue]:
+        out: list[tuple[str, str, str]] = []
+        check(data, "", out)
+        return [Issue(check_name, message, file=file, pointer=ptr, severity=severity)
+                for severity, ptr, message in out]
+    return validate
+
+
+_TASK = Obj(fields={"prompt": Str()})
+
+LESSON_SCHEMA = Obj(fields={
+    "id": Str(),
+    "title": Str(),
+    "image": Obj(fields={
+        "src800": Str(),
+        "src1600": Str(),
+        "alt": Str(warn_min_words=5),
+    }),
+    "fullDescription": Present(),
+    "simpleEnglish": Present(),
+    "advancedEnglish": Present(),
+    "actions": Arr(min_items=1),
+    "objects": Present(),
+    "feelings": Present(),
+    "analysis": Obj(),
+    "descriptions": Obj(fields={
+        "simple": Str(warn_min_words=12),
+        "intermediate": Str(warn_min_words=25),
+        "advanced": Str(warn_min_words=40),
+    }),
+    "vocabularyDetailed": Arr(min_items=35),
+    "vocabularyExtended": Obj(fields={
+        "academicPhrases": Arr(min_items=8),
+        "actions": Arr(required=False, warn_min_items=8),
+        "feelings": Arr(required=False, warn_min_items=6),
+    }),
+    "toefl": Obj(fields={
+        "speakingTasks": Arr(min_items=3, items=_TASK),
+        "writingTasks": Arr(min_items=3, items=_TASK),
+        "questions": Arr(min_items=3, items=Obj(fields={
+            "question": Str(),
+            "choices": Arr(min_items=3),
+            "answer": Int(),
+        })),
+    }),
+    "practice": Obj(fields={
+        "sentences": Arr(min_items=1),
+        "qa": Arr(min_items=1),
+        "speakingPrompts": Arr(min_items=1),
+    }),
+})
+
+REGISTRY_SCHEMA = Obj(fields={
+    "lessons": Arr(min_items=1, items=Obj(fields={
+        "id": Str(),
+        "file": Str(),
+        "title": Str(required=False),
+    })),
+})
+
+validate_lesson = compile_schema(LESSON_SCHEMA, "schema")
+validate_registry = compile_schema(REGISTRY_SCHEMA, "registry-schema")
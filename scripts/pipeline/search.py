@@ -0,0 +1,278 @@
+"""BM25 full-text index over the lesson corpus, exported as static shards.
+
+Every string in a lesson is tokenized twice: Latin-script words go to the
+English index (lowercase, stopwords dropped, Harman "S" stemmer) and
+Arabic-script runs go to the Persian index (Arabic yeh/kaf folded to the
+Persian letters, diacritics, tatweel and ZWNJ removed, stopwords dropped).
+The two languages keep separate document lengths and statistics, and a
+query term is scored against the index of its own script.
+
+Term frequencies are weighted by the top-level field they occur in
+(``FIELD_WEIGHTS``; title and vocabulary count more than body text), i.e. a
+simple BM25F. Output::
+
+    assets/data/search/manifest.json   docs, doc lengths, BM25 params, shard count
+    assets/data/search/tNN.json        {term: [doc, tf, doc delta, tf, ...]}
+
+A term lives in shard ``fnv1a32(term) % shards``, so a query downloads one
+small shard per distinct term; doc ordinals in a postings list are
+delta-encoded to keep the shards compact.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from .cache import write_text_if_changed
+from .corpus import REGISTRY_REL, resolve_lesson_path
+from .wordctx import fnv1a32
+
+INDEX_REL = "assets/data/search"
+MANIFEST_NAME = "manifest.json"
+INDEX_VERSION = 1
+LANGS = ("en", "fa")
+K1 = 1.2
+B = 0.75
+TARGET_SHARD_BYTES = 32 * 1024
+
+FIELD_WEIGHTS = {
+    "title": 3, "caption": 2, "vocabularyDetailed": 2, "vocabularyExtended": 2, "collocations": 2,
+}
+SKIP_FIELDS = {"id", "image", "createdAt", "updatedAt"}
+
+EN_STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below
+between both but by can did do does doing down during each few for from further had has have having
+he her here hers herself him himself his how i if in into is it its itself just me more most my
+myself no nor not now of off on once only or other our ours ourselves out over own same she should
+so some such than that the their theirs them themselves then there these they this those through to
+too under until up very was we were what when where which while who whom why will with you your
+yours yourself yourselves
+""".split())
+FA_STOPWORDS = frozenset("""
+و در به از که این را با است برای آن یک تا می های هم یا شود شده بود کرد کند نیز اما اگر هر ها ای
+""".split())
+
+_EN_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+# Letters plus the marks normalize_fa removes, so a ZWNJ does not split a word.
+_FA_TOKEN = re.compile(r"[\u0621-\u0670\u0640\u066E-\u06D3\u06F0-\u06F9\u200C\u200D]+")
+_FA_FOLD = str.maketrans({"\u064A": "\u06CC", "\u0649": "\u06CC", "\u0643": "\u06A9", "\u0629": "\u0647"})
+_FA_DROP = re.compile(r"[\u064B-\u0670\u0640\u200C\u200D]")
+
+
+@lru_cache(maxsize=1 << 16)
+def stem_en(word: str) -> str:
+    """Harman's S stemmer plus possessive stripping."""
+    if word.endswith("'s"):
+        word = word[:-2]
+    word = word.replace("'", "")
+    if len(word) > 3 and word.endswith("ies") and not word.endswith(("eies", "aies")):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+        return word[:-1]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("us", "ss")):
+        return word[:-1]
+    return word
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize_fa(text: str) -> str:
+    return _FA_DROP.sub("", text.translate(_FA_FOLD))
+
+
+def term_counts(lang: str, text: str) -> Counter[str]:
+    """Index terms of ``text`` for one language, with their frequencies."""
+    out: Counter[str] = Counter()
+    if lang == "en":
+        for w, n in Counter(_EN_TOKEN.findall(text.lower())).items():
+            if len(w) > 1 and w not in EN_STOPWORDS:
+                out[stem_en(w)] += n
+    else:
+        for w, n in Counter(_FA_TOKEN.findall(text)).items():
+            w = normalize_fa(w)
+            if len(w) > 1 and w not in FA_STOPWORDS:
+                out[w] += n
+    return out
+
+
+def query_terms(query: str) -> list[tuple[str, str]]:
+    """Distinct ``(lang, term)`` pairs of a query, in query order."""
+    return [(lang, t) for lang in LANGS for t in term_counts(lang, query)]
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value and not value.startswith(("assets/", "http://", "https://")):
+            yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+
+
+def lesson_terms(lesson: dict[str, Any]) -> dict[str, dict[str, int]]:
+    """Field-weighted term frequencies of one lesson, per language."""
+    tf: dict[str, dict[str, int]] = {lang: {} for lang in LANGS}
+    for key, value in lesson.items():
+        if key in SKIP_FIELDS:
+            continue
+        weight = FIELD_WEIGHTS.get(key, 1)
+        text = "\n".join(_strings(value))
+        for lang in LANGS:
+            bucket = tf[lang]
+            for t, n in term_counts(lang, text).items():
+                bucket[t] = bucket.get(t, 0) + n * weight
+    return tf
+
+
+def term_key(lang: str, term: str) -> str:
+    # Scripts never overlap, but keep the language explicit in the key.
+    return f"{lang}:{term}"
+
+
+def shard_name(i: int) -> str:
+    return f"t{i:02d}.json"
+
+
+def _encode_postings(postings: list[tuple[int, int]]) -> list[int]:
+    flat: list[int] = []
+    prev = 0
+    for doc, tf in postings:
+        flat += (doc - prev, tf)
+        prev = doc
+    return flat
+
+
+@dataclass
+class SearchBuild:
+    docs: list[dict[str, str]] = field(default_factory=list)
+    lengths: dict[str, list[int]] = field(default_factory=lambda: {lang: [] for lang in LANGS})
+    postings: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    problems: list[str] = field(default_factory=list)
+    files: dict[str, str] = field(default_factory=dict)
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def build_search_index(root: Path, shards: int = 0, dry_run: bool = False) -> SearchBuild:
+    """Stream registry lessons into a BM25 index and write it as shards.
+
+    ``shards=0`` picks the smallest count that keeps shards around
+    ``TARGET_SHARD_BYTES``.
+    """
+    res = SearchBuild()
+    registry = json.loads((root / REGISTRY_REL).read_text(encoding="utf-8"))
+    seen: set[str] = set()
+    for entry in registry.get("lessons", []):
+        if not isinstance(entry, dict) or not entry.get("id") or entry["id"] in seen:
+            continue
+        seen.add(entry["id"])
+        path = resolve_lesson_path(root, entry.get("file", ""))
+        try:
+            lesson = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            res.problems.append(f"{entry['id']}: cannot read {path.relative_to(root).as_posix()} ({e})")
+            continue
+        doc = len(res.docs)
+        res.docs.append({"id": str(entry["id"]), "title": str(lesson.get("title") or entry.get("title") or "")})
+        for lang, tf in lesson_terms(lesson).items():
+            res.lengths[lang].append(sum(tf.values()))
+            for term, n in tf.items():
+                res.postings.setdefault(term_key(lang, term), []).append((doc, n))
+
+    encoded = {k: _encode_postings(v) for k, v in sorted(res.postings.items())}
+    if shards <= 0:
+        total = sum(len(json.dumps({k: v}, separators=(",", ":"))) for k, v in encoded.items())
+        shards = max(1, math.ceil(total / TARGET_SHARD_BYTES))
+    buckets: list[dict[str, list[int]]] = [{} for _ in range(shards)]
+    for key, flat in encoded.items():
+        buckets[fnv1a32(key) % shards][key] = flat
+    for i, bucket in enumerate(buckets):
+        res.files[shard_name(i)] = json.dumps(bucket, ensure_ascii=False, separators=(",", ":"))
+
+    n = len(res.docs)
+    manifest = {
+        "version": INDEX_VERSION,
+        "hash": "fnv1a32-utf8",
+        "shards": shards,
+        "k1": K1,
+        "b": B,
+        "fieldWeights": FIELD_WEIGHTS,
+        "docs": res.docs,
+        "lengths": res.lengths,
+        "avgLength": {lang: (sum(res.lengths[lang]) / n if n else 0.0) for lang in LANGS},
+    }
+    res.files[MANIFEST_NAME] = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")) + "\n"
+    if dry_run:
+        return res
+
+    out_dir = root / INDEX_REL
+    for name, text in res.files.items():
+        if write_text_if_changed(out_dir / name, text):
+            res.written.append(name)
+    for f in sorted(out_dir.glob("t*.json")):
+        if f.name not in res.files:
+            f.unlink()
+            res.removed.append(f.name)
+    return res
+
+
+class SearchIndex:
+    """Query side, reading the exported shards exactly like the PWA would."""
+
+    def __init__(self, root: Path):
+        self.dir = root / INDEX_REL
+        self.meta = json.loads((self.dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.docs: list[dict[str, str]] = self.meta["docs"]
+        self._shards: dict[int, dict[str, list[int]]] = {}
+        self._norm_cache: dict[str, list[float]] = {}
+        self.shards_loaded = 0
+
+    def _postings(self, key: str) -> list[int]:
+        i = fnv1a32(key) % self.meta["shards"]
+        shard = self._shards.get(i)
+        if shard is None:
+            shard = json.loads((self.dir / shard_name(i)).read_text(encoding="utf-8"))
+            self._shards[i] = shard
+            self.shards_loaded += 1
+        return shard.get(key, [])
+
+    def _norms(self, lang: str) -> list[float]:
+        """Per-document BM25 length normalization ``k1 * (1 - b + b * len / avg)``."""
+        norms = self._norm_cache.get(lang)
+        if norms is None:
+            k1, b = self.meta["k1"], self.meta["b"]
+            avg = self.meta["avgLength"][lang] or 1.0
+            norms = [k1 * (1 - b + b * n / avg) for n in self.meta["lengths"][lang]]
+            self._norm_cache[lang] = norms
+        return norms
+
+    def search(self, query: str, top: int = 10) -> list[tuple[float, dict[str, str]]]:
+        n = len(self.docs)
+        k1 = self.meta["k1"]
+        scores: dict[int, float] = {}
+        get = scores.get
+        for lang, term in query_terms(query):
+            flat = self._postings(term_key(lang, term))
+            df = len(flat) // 2
+            if not df:
+                continue
+            w = math.log(1 + (n - df + 0.5) / (df + 0.5)) * (k1 + 1)
+            norms = self._norms(lang)
+            doc = 0
+            for i in range(0, len(flat), 2):
+                doc += flat[i]
+                tf = flat[i + 1]
+                scores[doc] = get(doc, 0.0) + w * tf / (tf + norms[doc])
+        best = heapq.nlargest(top, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+        return [(score, self.docs[doc]) for doc, score in best]
@@ -0,0 +1,86 @@
+"""Size-balanced, variable-length prefix sharding.
+
+``plan_shards`` splits a sorted ``{key: value}`` mapping by key prefix until
+every prefix group fits a target byte size (or cannot be split further), then
+packs neighbouring small groups together so there are no near-empty shards.
+The result is a routing table ``prefix -> shard`` that a client resolves by
+longest-prefix match, so a lookup downloads at most one bounded shard.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+
+def entry_size(key: str, value: Any) -> int:
+    """Bytes ``key: value`` adds to a compact JSON object (incl. separator)."""
+    return len(json.dumps(key, ensure_ascii=False).encode("utf-8")) + 1 + \
+        len(json.dumps(value, ensure_ascii=False).encode("utf-8")) + 1
+
+
+@dataclass
+class Shard:
+    index: int
+    prefixes: list[str] = field(default_factory=list)
+    keys: list[str] = field(default_factory=list)
+    size: int = 2  # "{}"
+
+    @property
+    def name(self) -> str:
+        return f"s{self.index:04d}"
+
+
+def _leaves(items: list[tuple[str, int]], prefix: str, target: int, out: list[tuple[str, list[tuple[str, int]]]]) -> None:
+    """Recursively split ``items`` (all starting with ``prefix``) into leaf groups."""
+    total = sum(s for _, s in items)
+    depth = len(prefix)
+    if total <= target or all(len(k) <= depth for k, _ in items):
+        out.append((prefix, items))
+        return
+    exact = [(k, s) for k, s in items if len(k) == depth]
+    if exact:
+        out.append((prefix, exact))
+    groups: dict[str, list[tuple[str, int]]] = {}
+    for k, s in items:
+        if len(k) > depth:
+            groups.setdefault(k[: depth + 1], []).append((k, s))
+    for child in sorted(groups):
+        _leaves(groups[child], child, target, out)
+
+
+def plan_shards(sized: Iterable[tuple[str, int]], target: int) -> tuple[list[Shard], dict[str, int]]:
+    """Plan shards for ``(routing_key, size)`` pairs.
+
+    Returns the shards (in key order) and the routing table
+    ``{prefix: shard index}``.
+    """
+    items = sorted(sized, key=lambda kv: kv[0])
+    leaves: list[tuple[str, list[tuple[str, int]]]] = []
+    if items:
+        _leaves(items, "", target, leaves)
+
+    shards: list[Shard] = []
+    routes: dict[str, int] = {}
+    cur: Shard | None = None
+    for prefix, group in leaves:
+        size = sum(s for _, s in group)
+        if cur is None or (cur.keys and cur.size + size > target):
+            cur = Shard(index=len(shards))
+            shards.append(cur)
+        cur.prefixes.append(prefix)
+        cur.keys.extend(k for k, _ in group)
+        cur.size += size
+        routes[prefix] = cur.index
+    return shards, routes
+
+
+def route(routes: dict[str, int], key: str, max_prefix: int | None = None) -> int | None:
+    """Longest-prefix match of ``key`` in a routing table."""
+    n = len(key) if max_prefix is None else min(len(key), max_prefix)
+    for i in range(n, -1, -1):
+        hit = routes.get(key[:i])
+        if hit is not None:
+            return hit
+    return None
@@ -0,0 +1,51 @@
+"""Advanced smoke checks (registry -> files, lesson keys, lesson.js markers).
+
+Used by ``scripts/smoke-advanced.py`` and ``scripts/build.py``. Each check
+returns a list of failure messages; an empty list means the check passed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .corpus import Corpus
+from .schema import validate_lesson
+from .validate import ERROR
+
+# Hooks/IDs (string presence is acceptable for offline test)
+# (Simple/Intermediate/Advanced are tabs of one "sec-levels" section; the
+# bilingual vocabulary lives in "sec-vocab")
+LESSON_JS_MARKERS = [
+  "sec-levels", "sec-practice",
+  "renderToeflSection(article, tocSections, data.toefl)",
+  "vocabularyDetailed", "sec-vocab"
+]
+
+def check_registry_files(corpus: Corpus) -> list[str]:
+  entries = corpus.entries
+  if not entries:
+    return ["registry.lessons missing/empty"]
+  missing = []
+  for item in entries:
+    f = item.get("file")
+    if not f: missing.append("(missing file field)"); continue
+    if corpus.lesson_for(item) is None: missing.append(f)
+  if missing:
+    return [f"missing lesson files: {missing[:10]}{' ...' if len(missing)>10 else ''}"]
+  return []
+
+def check_lesson_schema(corpus: Corpus) -> list[str]:
+  failures = []
+  for item in corpus.lessons:
+    name = item.path.name
+    if not item.loaded:
+      failures.append(f"{name}: lesson JSON parse error: {item.error}")
+      continue
+    failures.extend(f"{name}: {i.pointer} {i.message}" for i in validate_lesson(item.data) if i.severity == ERROR)
+  return failures
+
+def check_lesson_js(lesson_js: Path) -> list[str]:
+  if not lesson_js.exists():
+    return ["js/lesson.js not found"]
+  js = lesson_js.read_text(encoding="utf-8", errors="ignore")
+  return [f"lesson.js missing required marker: {s}" for s in LESSON_JS_MARKERS if s not in js]
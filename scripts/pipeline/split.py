@@ -0,0 +1,178 @@
+"""Split lesson JSON into a small first-paint core plus lazily loaded sections.
+
+A lesson file is ~67 KB with 35+ top-level keys, but the first render only
+needs the header, the image and the level texts. ``split_lesson`` partitions
+the top-level keys into named sections::
+
+    assets/data/lessons_split/<lesson id>/core.json      (first paint, a few KB)
+    assets/data/lessons_split/<lesson id>/<section>.json (toefl, vocab, ...)
+    assets/data/lessons_split/manifest.json
+
+The manifest follows registry order and records, per lesson, the source file
+and its content hash, each section's file, keys and byte size, and the
+original top-level key order, so a client can rebuild the exact lesson object
+from the parts. Keys not listed in ``SECTIONS`` go to an ``extra`` section,
+so nothing is ever dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from dataclasses import dataclass, field
+from typing import Any
+
+from .cache import write_text_if_changed
+from .corpus import Corpus
+
+SPLIT_REL = "assets/data/lessons_split"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+CORE = "core"
+EXTRA = "extra"
+SECTIONS: dict[str, tuple[str, ...]] = {
+    CORE: (
+        "id", "title", "caption", "image", "scenarioType", "sceneDescription",
+        "simpleEnglish", "intermediateEnglish", "advancedEnglish", "fullDescription",
+        "lessonOverview", "createdAt", "updatedAt",
+    ),
+    "scene": (
+        "people", "ages", "place", "clothing", "appearance", "actions", "objects",
+        "feelings", "environmentType", "weatherLighting", "analysis", "sceneNotes",
+        "scenario", "scenarios",
+    ),
+    "vocab": ("vocabularyExtended", "vocabularyDetailed", "collocations"),
+    "descriptions": ("descriptions", "proDescriptions", "lessonGuide"),
+    "grammar": ("grammar",),
+    "practice": ("practice", "exercises"),
+    "toefl": ("toefl",),
+}
+SECTION_OF = {key: name for name, keys in SECTIONS.items() for key in keys}
+
+
+def dumps_part(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def split_lesson(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Partition a lesson's top-level keys; empty sections are omitted."""
+    parts: dict[str, dict[str, Any]] = {CORE: {}}
+    for key, value in data.items():
+        parts.setdefault(SECTION_OF.get(key, EXTRA), {})[key] = value
+    order = [CORE] + [n for n in SECTIONS if n != CORE] + [EXTRA]
+    return {n: parts[n] for n in order if n in parts}
+
+
+def join_lesson(parts: dict[str, dict[str, Any]], order: list[str]) -> dict[str, Any]:
+    """Inverse of ``split_lesson`` given the manifest's key order."""
+    merged: dict[str, Any] = {}
+    for part in parts.values():
+        merged.update(part)
+    return {k: merged[k] for k in order}
+
+
+@dataclass
+class SplitResult:
+    lessons: int = 0
+    written: int = 0
+    removed: list[str] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+    source_bytes: int = 0
+    core_bytes: int = 0
+    manifest: dict[str, Any] = field(default_factory=dict)
+
+
+def split_corpus(corpus: Corpus, dry_run: bool = False) -> SplitResult:
+    """Split every registry lesson; keep the output in step with the registry."""
+    out_dir = corpus.root / SPLIT_REL
+    res = SplitResult()
+    lessons_meta: dict[str, Any] = {}
+
+    for entry in corpus.entries:
+        if not isinstance(entry, dict):
+            continue
+        reg_id = str(entry.get("id") or "")
+        lesson = corpus.lesson_for(entry)
+        if not reg_id:
+            res.problems.append(f"registry entry without id: {entry.get('file')}")
+            continue
+        if lesson is None or not lesson.loaded:
+            res.problems.append(f"{reg_id}: lesson file missing or unreadable ({entry.get('file')})")
+            continue
+        if lesson.data.get("id") != reg_id:
+            res.problems.append(f"{reg_id}: lesson id is {lesson.data.get('id')!r}, registry says {reg_id!r}")
+            continue
+        if reg_id in lessons_meta:
+            res.problems.append(f"{reg_id}: duplicate registry id")
+            continue
+
+        sections: dict[str, Any] = {}
+        for name, part in split_lesson(lesson.data).items():
+            text = dumps_part(part)
+            rel = f"{reg_id}/{name}.json"
+            if not dry_run:
+                res.written += write_text_if_changed(out_dir / rel, text)
+            sections[name] = {"file": rel, "bytes": len(text.encode("utf-8")), "keys": list(part)}
+        lessons_meta[reg_id] = {
+            "source": lesson.rel,
+            "sourceHash": lesson.digest,
+            "order": list(lesson.data),
+            "sections": sections,
+        }
+        res.lessons += 1
+        res.source_bytes += lesson.path.stat().st_size
+        res.core_bytes += sections[CORE]["bytes"]
+
+    res.manifest = {
+        "version": MANIFEST_VERSION,
+        "registry": "assets/data/registry.json",
+        "core": CORE,
+        "lessons": lessons_meta,
+    }
+    if dry_run:
+        return res
+
+    # lessons dropped from the registry lose their split output
+    if out_dir.exists():
+        for d in sorted(p for p in out_dir.iterdir() if p.is_dir()):
+            if d.name not in lessons_meta:
+                shutil.rmtree(d)
+                res.removed.append(d.name)
+            else:
+                keep = {s["file"].split("/", 1)[1] for s in lessons_meta[d.name]["sections"].values()}
+                for f in d.glob("*.json"):
+                    if f.name not in keep:
+                        f.unlink()
+    res.written += write_text_if_changed(out_dir / MANIFEST_NAME, json.dumps(res.manifest, ensure_ascii=False, indent=2) + "\n")
+    return res
+
+
+def check_split(corpus: Corpus) -> list[str]:
+    """Problems with the split output on disk (stale, missing or inconsistent)."""
+    out_dir = corpus.root / SPLIT_REL
+    try:
+        on_disk = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError) as e:
+        return [f"{SPLIT_REL}/{MANIFEST_NAME}: {e}"]
+    expected = split_corpus(corpus, dry_run=True)
+    problems = list(expected.problems)
+    if on_disk != expected.manifest:
+        want, have = expected.manifest["lessons"], on_disk.get("lessons", {})
+        for lid in sorted(set(want) | set(have)):
+            if want.get(lid) != have.get(lid):
+                problems.append(f"{lid}: split output out of date (run scripts/split_lessons.py)")
+    for lid, meta in (on_disk.get("lessons") or {}).items():
+        lesson = next((l for l in corpus.lessons if l.loaded and l.data.get("id") == lid), None)
+        if lesson is None:
+            continue
+        try:
+            parts = {name: json.loads((out_dir / s["file"]).read_text(encoding="utf-8"))
+                     for name, s in meta["sections"].items()}
+            joined = join_lesson(parts, meta["order"])
+        except (OSError, ValueError, KeyError) as e:
+            problems.append(f"{lid}: cannot rejoin sections ({e})")
+            continue
+        if joined != lesson.data:
+            problems.append(f"{lid}: rejoined sections differ from {lesson.rel}")
+    return problems
@@ -0,0 +1,103 @@
+"""Fail-collecting validation engine.
+
+Checks report ``Issue`` objects instead of exiting on the first problem, so
+one run lists everything that is wrong, each with the file and the JSON
+pointer (RFC 6901) of the offending value. Per-lesson checks run on a thread
+pool over the already parsed corpus; file existence is answered from one
+directory walk (``FileIndex``) instead of a ``stat`` per reference.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence, TypeVar
+
+ERROR = "error"
+WARNING = "warning"
+
+T = TypeVar("T")
+
+
+def pointer(*parts: Any) -> str:
+    """JSON pointer for a path of keys/indexes (``pointer("toefl", 0)`` -> ``/toefl/0``)."""
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+@dataclass
+class Issue:
+    check: str
+    message: str
+    file: str = ""
+    pointer: str = ""
+    severity: str = ERROR
+
+    def location(self) -> str:
+        if self.file and self.pointer:
+            return f"{self.file}#{self.pointer}"
+        return self.file or self.pointer
+
+
+@dataclass
+class ValidationReport:
+    issues: list[Issue] = field(default_factory=list)
+    passed: list[tuple[str, str]] = field(default_factory=list)  # (check, summary)
+    elapsed: float = 0.0
+
+    @property
+    def errors(self) -> list[Issue]:
+        return [i for i in self.issues if i.severity == ERROR]
+
+    @property
+    def warnings(self) -> list[Issue]:
+        return [i for i in self.issues if i.severity == WARNING]
+
+    def run(self, check: str, fn: Callable[[], Iterable[Issue]], ok: str) -> list[Issue]:
+        """Run one check; record ``ok`` if it produced no error."""
+        issues = list(fn())
+        self.issues.extend(issues)
+        if not any(i.severity == ERROR for i in issues):
+            self.passed.append((check, ok))
+        return issues
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ok": not self.errors,
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "elapsed": round(self.elapsed, 3),
+            "passed": [{"check": c, "message": m} for c, m in self.passed],
+            "issues": [asdict(i) for i in self.issues],
+        }
+
+
+class FileIndex:
+    """Relative paths of every file under ``dirs``, collected with one walk."""
+
+    def __init__(self, root: Path, dirs: Sequence[str]):
+        self.root = root
+        self.files: set[str] = set()
+        for d in dirs:
+            for dirpath, _, names in os.walk(root / d, followlinks=True):
+                rel_dir = Path(dirpath).relative_to(root).as_posix()
+                self.files.update(f"{rel_dir}/{n}" for n in names)
+
+    def exists(self, rel: str) -> bool:
+        rel = rel.split("#", 1)[0].split("?", 1)[0]
+        while rel.startswith("./"):
+            rel = rel[2:]
+        rel = rel.lstrip("/")
+        return rel in self.files or (self.root / rel).exists()
+
+
+def run_parallel(items: Sequence[T], fn: Callable[[T], list[Issue]], jobs: int | None = None) -> list[Issue]:
+    """Apply a per-item check on a thread pool; issues keep the input order."""
+    if jobs == 1 or len(items) < 2:
+        results = [fn(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            results = list(pool.map(fn, items))
+    return [issue for issues in results for issue in issues]
+
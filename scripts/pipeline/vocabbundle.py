@@ -0,0 +1,178 @@
+"""Per-lesson vocabulary bundles (profiles + word context).
+
+``js/lesson.js`` enriches every ``vocabularyDetailed`` card with a word
+profile, and a profile lookup used to download the whole first-letter
+``word_profiles/<letter>.json`` shard (about 1.5 MB each), so one lesson
+could pull most of the 20 MB dataset. This module resolves each lesson's
+vocabulary ahead of time::
+
+    assets/data/lesson_vocab/<lesson id>.json
+        {"version": 1, "lesson": id,
+         "profiles": {key: profile | null},
+         "context":  {key: {lessons, examples, collocations} | null}}
+
+``profiles`` keys use ``profile_key`` (``normalizeWordForProfile`` in the
+browser), ``context`` keys use ``wordctx.normalize_key``; ``null`` means the
+word was looked up and has no entry, so the browser does not fall back to the
+shards for it. Context postings carry lesson ids, not ordinals.
+
+Lesson vocabularies are cached in the build manifest by file hash; each
+profile shard is streamed once (``pipeline/jsonstream``) keeping only the
+keys some lesson needs, and the context comes from the same merge that builds
+``word_context/``. Only bundles whose bytes change are rewritten.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .cache import BuildManifest, hash_file, write_text_if_changed
+from .corpus import REGISTRY_REL, resolve_lesson_path
+from .dictstore import profile_shard
+from .jsonstream import iter_items
+from .wordctx import build_index, normalize_key
+
+BUNDLE_REL = "assets/data/lesson_vocab"
+PROFILES_REL = "assets/data/word_profiles"
+CACHE_NS = "lesson_vocab"
+BUNDLE_VERSION = 1
+EXTRACT_VERSION = 1
+
+_WS = re.compile(r"\s+")
+
+
+def profile_key(word: str) -> str:
+    """``normalizeWordForProfile`` in ``js/lesson.js``."""
+    return _WS.sub(" ", str(word or "").strip().lower()).replace("’", "'")
+
+
+def lesson_words(lesson: dict[str, Any]) -> list[str]:
+    """The ``vocabularyDetailed`` words of one lesson, in lesson order."""
+    words = []
+    for item in lesson.get("vocabularyDetailed") or []:
+        en = item.get("en") if isinstance(item, dict) else None
+        if isinstance(en, str) and en.strip():
+            words.append(en.strip())
+    return list(dict.fromkeys(words))
+
+
+def load_profiles(root: Path, keys: set[str]) -> tuple[dict[str, Any], int]:
+    """``(profiles, shards read)`` for ``keys``, streaming only the shards they live in."""
+    wanted: dict[str, set[str]] = {}
+    for key in keys:
+        if key:
+            wanted.setdefault(profile_shard(key), set()).add(key)
+    found: dict[str, Any] = {}
+    read = 0
+    for shard, shard_keys in sorted(wanted.items()):
+        path = root / PROFILES_REL / f"{shard}.json"
+        if not path.exists():
+            continue
+        read += 1
+        for key, profile in iter_items(path):
+            if key in shard_keys:
+                found[key] = profile
+    return found, read
+
+
+def dumps_bundle(bundle: dict[str, Any]) -> str:
+    return json.dumps(bundle, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class BundleResult:
+    lessons: int = 0
+    parsed: int = 0
+    words: int = 0
+    resolved: int = 0
+    shards_read: int = 0
+    bytes: int = 0
+    largest: int = 0
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+    files: dict[str, str] = field(default_factory=dict)  # name -> text
+
+
+def build_bundles(root: Path, manifest: BuildManifest | None = None, dry_run: bool = False) -> BundleResult:
+    """Resolve every registry lesson's vocabulary and write changed bundles."""
+    res = BundleResult()
+    registry = json.loads((root / REGISTRY_REL).read_text(encoding="utf-8"))
+    vocab: dict[str, list[str]] = {}
+    for entry in registry.get("lessons", []):
+        if not (isinstance(entry, dict) and entry.get("id")) or str(entry["id"]) in vocab:
+            continue
+        lid = str(entry["id"])
+        path = resolve_lesson_path(root, entry.get("file", ""))
+        rel = path.relative_to(root).as_posix()
+        if not path.exists():
+            res.problems.append(f"{lid}: lesson file missing ({rel})")
+            continue
+        digest = f"{hash_file(path)}:v{EXTRACT_VERSION}"
+        words = manifest.get(CACHE_NS, rel, digest) if manifest else None
+        if words is None:
+            try:
+                words = lesson_words(json.loads(path.read_text(encoding="utf-8")))
+            except ValueError as e:
+                res.problems.append(f"{lid}: {rel} is not valid JSON ({e})")
+                continue
+            res.parsed += 1
+            if manifest:
+                manifest.put(CACHE_NS, rel, digest, words)
+        vocab[lid] = words
+    if manifest:
+        manifest.prune(CACHE_NS)
+    res.lessons = len(vocab)
+
+    profiles, res.shards_read = load_profiles(root, {profile_key(w) for words in vocab.values() for w in words})
+    ctx = build_index(root, manifest=manifest, dry_run=True)
+    res.problems.extend(p for p in ctx.problems if p not in res.problems)
+    table = ctx.manifest["lessons"]
+
+    for lid, words in vocab.items():
+        bundle: dict[str, Any] = {"version": BUNDLE_VERSION, "lesson": lid, "profiles": {}, "context": {}}
+        for word in words:
+            key = profile_key(word)
+            bundle["profiles"][key] = profiles.get(key)
+            res.words += 1
+            res.resolved += key in profiles
+            entry = ctx.index.get(normalize_key(word))
+            if entry is not None:
+                entry = dict(entry, lessons=[table[i] for i in entry["lessons"] if table[i]])
+            bundle["context"][normalize_key(word)] = entry
+        text = dumps_bundle(bundle)
+        res.files[f"{lid}.json"] = text
+        size = len(text.encode("utf-8"))
+        res.bytes += size
+        res.largest = max(res.largest, size)
+    if dry_run:
+        return res
+
+    out_dir = root / BUNDLE_REL
+    for name, text in res.files.items():
+        if write_text_if_changed(out_dir / name, text):
+            res.written.append(name)
+    for f in sorted(out_dir.glob("*.json")):
+        if f.name not in res.files:
+            f.unlink()
+            res.removed.append(f.name)
+    return res
+
+
+def check_bundles(root: Path) -> list[str]:
+    """Problems with the bundles on disk (missing, stale or extra)."""
+    expected = build_bundles(root, dry_run=True)
+    out_dir = root / BUNDLE_REL
+    problems = list(expected.problems)
+    for name, text in expected.files.items():
+        path = out_dir / name
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            problems.append(f"{BUNDLE_REL}/{name}: out of date (run scripts/build_vocab_bundles.py)")
+    for f in sorted(out_dir.glob("*.json")):
+        if f.name not in expected.files:
+            problems.append(f"{BUNDLE_REL}/{f.name}: not a registry lesson")
+    return problems
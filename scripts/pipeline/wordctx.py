@@ -0,0 +1,271 @@
+"""Sharded word-context index (phrase -> lessons, examples, collocations).
+
+``js/lesson.js`` used to download all of ``word_context_index.json`` to show
+the examples of one vocabulary item. This module builds the same kind of
+index straight from the lessons and splits it by key hash::
+
+    assets/data/word_context/manifest.json   lesson ordinal table, shard count
+    assets/data/word_context/sNN.json        {key: {lessons, examples, collocations}}
+
+Postings store lesson *ordinals* (indexes into the manifest's ``lessons``
+list) instead of repeating ``"toefl-ax34-NN"`` strings. Ordinals are stable:
+existing lessons keep theirs, new lessons are appended and removed lessons
+leave a ``null`` slot, so adding a lesson only changes the shards whose keys
+it actually contributes to.
+
+Lessons are read one at a time and reduced to a small list of rows, cached
+in the build manifest by file hash, so a rebuild only parses changed lessons.
+A key's shard is ``fnv1a32(utf-8 key) % shards``; keys are normalized with
+``normalize_key`` (trim, lowercase, collapse whitespace) on both sides.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .cache import BuildManifest, hash_file, write_text_if_changed
+from .corpus import REGISTRY_REL, resolve_lesson_path
+
+INDEX_REL = "assets/data/word_context"
+MANIFEST_NAME = "manifest.json"
+INDEX_VERSION = 1
+EXTRACT_VERSION = 1
+CACHE_NS = "word_context"
+DEFAULT_SHARDS = 32
+MAX_EXAMPLES = 6
+MAX_COLLOCATIONS = 6
+MAX_NGRAM = 4
+
+_WS = re.compile(r"\s+")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9'’-]*")
+
+# A row is [key, en, fa, is_collocation].
+Row = list[Any]
+
+
+def normalize_key(text: str) -> str:
+    return _WS.sub(" ", str(text or "").strip()).lower()
+
+
+def fnv1a32(text: str) -> int:
+    h = 0x811C9DC5
+    for b in text.encode("utf-8"):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def shard_of(key: str, shards: int) -> int:
+    return fnv1a32(key) % shards
+
+
+def shard_name(i: int) -> str:
+    return f"s{i:02d}.json"
+
+
+def extract_rows(lesson: dict[str, Any]) -> list[Row]:
+    """Vocabulary items and collocations of one lesson, in lesson order."""
+    rows: list[Row] = []
+
+    def add(en: Any, fa: Any = "", colloc: bool = False) -> None:
+        if isinstance(en, str) and en.strip():
+            rows.append([normalize_key(en), en.strip(), fa.strip() if isinstance(fa, str) else "", colloc])
+
+    for item in lesson.get("vocabularyDetailed") or []:
+        if isinstance(item, dict):
+            add(item.get("en"), item.get("fa"))
+    for item in lesson.get("collocations") or []:
+        if isinstance(item, dict):
+            add(item.get("en"), item.get("fa"), True)
+    extended = lesson.get("vocabularyExtended")
+    if isinstance(extended, dict):
+        for terms in extended.values():
+            for t in terms if isinstance(terms, list) else []:
+                add(t)
+    return rows
+
+
+def _ngrams(text: str) -> set[str]:
+    words = _TOKEN.findall(text.lower())
+    return {" ".join(words[i:i + n]) for n in range(1, MAX_NGRAM + 1) for i in range(len(words) - n + 1)}
+
+
+def merge(contribs: Iterable[tuple[int, list[Row]]]) -> dict[str, dict[str, Any]]:
+    """Combine per-lesson rows (by lesson ordinal) into the index.
+
+    A row credits its own key and every other key that occurs in its English
+    text as a whole-word phrase (``navigate`` <- ``navigate the sidewalk``).
+    Direct examples come first, examples with a translation before those
+    without.
+    """
+    contribs = list(contribs)
+    keys = {row[0] for _, rows in contribs for row in rows}
+    hits: dict[str, list[tuple[int, int, int, str, str]]] = {}
+    collocs: dict[str, list[str]] = {}
+    lessons: dict[str, set[int]] = {}
+    seq = 0
+    for ordinal, rows in contribs:
+        for key, en, fa, is_colloc in rows:
+            targets = [(key, 0)] + [(g, 1) for g in sorted(_ngrams(en) & keys) if g != key]
+            for target, indirect in targets:
+                lessons.setdefault(target, set()).add(ordinal)
+                hits.setdefault(target, []).append((indirect, 0 if fa else 1, seq, en, fa))
+                if is_colloc:
+                    collocs.setdefault(target, []).append(en)
+                seq += 1
+
+    index: dict[str, dict[str, Any]] = {}
+    for key in sorted(keys):
+        examples: list[dict[str, str]] = []
+        seen: set[str] = set()
+        for _, _, _, en, fa in sorted(hits[key]):
+            if en.lower() not in seen:
+                seen.add(en.lower())
+                examples.append({"en": en, "fa": fa})
+            if len(examples) >= MAX_EXAMPLES:
+                break
+        index[key] = {
+            "lessons": sorted(lessons[key]),
+            "examples": examples,
+            "collocations": list(dict.fromkeys(collocs.get(key, [])))[:MAX_COLLOCATIONS],
+        }
+    return index
+
+
+def assign_ordinals(previous: list[str | None], ids: list[str]) -> list[str | None]:
+    """Keep existing ordinals, append new ids, null out removed ones."""
+    wanted = set(ids)
+    table = [i if i in wanted else None for i in previous]
+    known = {i for i in table if i}
+    table.extend(i for i in ids if i not in known)
+    while table and table[-1] is None:
+        table.pop()
+    return table
+
+
+def dumps_shard(entries: dict[str, Any]) -> str:
+    return json.dumps(entries, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+@dataclass
+class IndexResult:
+    lessons: int = 0
+    parsed: int = 0
+    keys: int = 0
+    shards_written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+    bytes: int = 0
+    largest: int = 0
+    manifest: dict[str, Any] = field(default_factory=dict)
+    files: dict[str, str] = field(default_factory=dict)  # name -> text
+    index: dict[str, dict[str, Any]] = field(default_factory=dict)  # key -> entry (lesson ordinals)
+
+
+def build_index(root: Path, shards: int = DEFAULT_SHARDS, manifest: BuildManifest | None = None,
+                dry_run: bool = False) -> IndexResult:
+    """Stream registry lessons, merge their rows and write changed shards."""
+    res = IndexResult()
+    out_dir = root / INDEX_REL
+    registry = json.loads((root / REGISTRY_REL).read_text(encoding="utf-8"))
+    entries = [e for e in registry.get("lessons", []) if isinstance(e, dict) and e.get("id")]
+
+    try:
+        previous = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8")).get("lessons") or []
+    except (FileNotFoundError, ValueError):
+        previous = []
+    ids = list(dict.fromkeys(str(e["id"]) for e in entries))
+    table = assign_ordinals(previous, ids)
+    ordinal = {lid: i for i, lid in enumerate(table) if lid}
+
+    contribs: list[tuple[int, list[Row]]] = []
+    done: set[str] = set()
+    for entry in entries:
+        lid = str(entry["id"])
+        if lid in done:
+            continue
+        done.add(lid)
+        path = resolve_lesson_path(root, entry.get("file", ""))
+        rel = path.relative_to(root).as_posix()
+        if not path.exists():
+            res.problems.append(f"{lid}: lesson file missing ({rel})")
+            continue
+        digest = f"{hash_file(path)}:v{EXTRACT_VERSION}"
+        rows = manifest.get(CACHE_NS, rel, digest) if manifest else None
+        if rows is None:
+            try:
+                rows = extract_rows(json.loads(path.read_text(encoding="utf-8")))
+            except ValueError as e:
+                res.problems.append(f"{lid}: {rel} is not valid JSON ({e})")
+                continue
+            res.parsed += 1
+            if manifest:
+                manifest.put(CACHE_NS, rel, digest, rows)
+        contribs.append((ordinal[lid], rows))
+        res.lessons += 1
+    if manifest:
+        manifest.prune(CACHE_NS)
+
+    index = res.index = merge(contribs)
+    res.keys = len(index)
+    buckets: list[dict[str, Any]] = [{} for _ in range(shards)]
+    for key, value in index.items():
+        buckets[shard_of(key, shards)][key] = value
+    for i, bucket in enumerate(buckets):
+        text = dumps_shard(bucket)
+        res.files[shard_name(i)] = text
+        size = len(text.encode("utf-8"))
+        res.bytes += size
+        res.largest = max(res.largest, size)
+    res.manifest = {
+        "version": INDEX_VERSION,
+        "hash": "fnv1a32-utf8",
+        "normalize": "trim+lowercase+collapse-whitespace",
+        "shards": shards,
+        "keys": res.keys,
+        "lessons": table,
+    }
+    res.files[MANIFEST_NAME] = json.dumps(res.manifest, ensure_ascii=False, indent=2) + "\n"
+    if dry_run:
+        return res
+
+    for name, text in res.files.items():
+        if write_text_if_changed(out_dir / name, text):
+            res.shards_written.append(name)
+    for f in sorted(out_dir.glob("s*.json")):
+        if f.name not in res.files:
+            f.unlink()
+            res.removed.append(f.name)
+    return res
+
+
+def check_index(root: Path) -> list[str]:
+    """Problems with the shards on disk (missing, stale or extra)."""
+    out_dir = root / INDEX_REL
+    try:
+        shards = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))["shards"]
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        return [f"{INDEX_REL}/{MANIFEST_NAME}: {e}"]
+    expected = build_index(root, shards=shards, dry_run=True)
+    problems = list(expected.problems)
+    for name, text in expected.files.items():
+        path = out_dir / name
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            problems.append(f"{INDEX_REL}/{name}: out of date (run scripts/build_word_context.py)")
+    for f in sorted(out_dir.glob("s*.json")):
+        if f.name not in expected.files:
+            problems.append(f"{INDEX_REL}/{f.name}: not part of the index")
+    return problems
+
+
+def lookup(root: Path, word: str) -> tuple[str, dict[str, Any] | None, list[str | None]]:
+    """Resolve one key the way the browser does: manifest, hash, one shard."""
+    out_dir = root / INDEX_REL
+    meta = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    key = normalize_key(word)
+    name = shard_name(shard_of(key, meta["shards"]))
+    entry = json.loads((out_dir / name).read_text(encoding="utf-8")).get(key)
+    return name, entry, meta["lessons"]
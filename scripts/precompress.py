@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Write precompressed .gz / .br siblings for every data artifact.
+
+Covers every .json / .tdic / .dawg file under assets/data (lexicon, indexes,
+dictionary shards, lessons, ...) so the host can serve precompressed bytes
+instead of compressing on each request. .br needs the optional `brotli`
+package; without it only .gz siblings are written.
+
+Usage:
+  python scripts/precompress.py
+  python scripts/precompress.py --jobs 4 --top 20
+  python scripts/precompress.py --clean          # also drop siblings of deleted files
+  python scripts/precompress.py assets/data/lexicon_updated.json
+
+Sources whose content hash matches .build/manifest.json (and whose siblings
+are still on disk) are skipped; use --no-cache to recompress everything.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from pipeline import ROOT, BuildManifest
+from pipeline.compress import CACHE_NS, MIN_SIZE, clean_orphans, data_artifacts, precompress, print_report
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="*", help="files to compress (default: every artifact under assets/data)")
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    ap.add_argument("--min-size", type=int, default=MIN_SIZE, help=f"skip files smaller than this (default: {MIN_SIZE})")
+    ap.add_argument("--clean", action="store_true", help="remove .gz/.br files whose source no longer exists")
+    ap.add_argument("--no-cache", action="store_true", help="recompress everything, ignoring .build/manifest.json")
+    ap.add_argument("--top", type=int, default=10, help="largest files to list in the report (default: 10)")
+    args = ap.parse_args()
+
+    if args.paths:
+        paths = [Path(p).resolve() for p in args.paths]
+        missing = [str(p) for p in paths if not p.is_file()]
+        if missing:
+            raise SystemExit("❌ Not found:\n" + "\n".join(missing))
+    else:
+        paths = data_artifacts(min_size=args.min_size)
+
+    manifest = BuildManifest() if args.no_cache else BuildManifest.load()
+    results = precompress(paths, manifest, jobs=args.jobs)
+    if not args.paths:
+        manifest.prune(CACHE_NS)
+    manifest.save()
+    if args.clean:
+        for p in clean_orphans():
+            print(f"🗑️  Removed {p.relative_to(ROOT)}")
+    print_report(results, top=args.top)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
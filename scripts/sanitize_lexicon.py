@@ -5,13 +5,25 @@ Sanitize assets/data/lexicon.json:
 - Remove placeholder labels: فعل/عمل, موضوع/مفهوم, شیء/وسیله
 - If nothing remains, keep fa as [] (UI shows "ترجمه موجود نیست")
 - Write a report assets/data/lexicon_missing_translations.json listing IDs with missing fa
+- Write assets/data/lexicon_lookup.json, a prebuilt normalized en -> entry map
+  (see scripts/pipeline/lexicon.py), or prefix shards of it with --shard-prefix
+
+Usage:
+  python scripts/sanitize_lexicon.py
+  python scripts/sanitize_lexicon.py --shard-prefix 1   # assets/data/lexicon_lookup/<prefix>.json
+  python scripts/sanitize_lexicon.py --profile=prod   # also write minified copies to dist/
 """
 from __future__ import annotations
 
+import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pipeline import write_text_if_changed
+from pipeline.dist import PROFILES, DistWriter, print_report
+from pipeline.lexicon import LOOKUP_REL, SHARDS_REL, render_lookup
+
 BLACK = {"فعل/عمل","موضوع/مفهوم","شیء/وسیله"}
 
 def clean_fa(fa):
@@ -20,6 +32,12 @@ def clean_fa(fa):
     return cleaned
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--profile", choices=PROFILES, default="dev", help="prod: also write minified copies to dist/")
+    ap.add_argument("--shard-prefix", type=int, default=0,
+                    help="split the lookup map by the first N characters of the key (default: 0 = one file)")
+    args = ap.parse_args()
+
     root = Path(__file__).resolve().parents[1]
     lex_path = root / "assets" / "data" / "lexicon.json"
     out_report = root / "assets" / "data" / "lexicon_missing_translations.json"
@@ -56,5 +74,21 @@ def main():
     print(f"Entries changed (placeholder removed): {changed}")
     print(f"Missing translations: {len(missing)} -> {out_report}")
 
+    lookup = render_lookup(entries, args.shard_prefix)
+    written = [rel for rel, text in lookup.items() if write_text_if_changed(root / rel, text)]
+    stale = [p for p in [root / LOOKUP_REL, *sorted((root / SHARDS_REL).glob("*.json"))]
+             if p.exists() and p.relative_to(root).as_posix() not in lookup]
+    for p in stale:
+        p.unlink()
+        print(f"🗑️  Removed {p.relative_to(root).as_posix()}")
+    print(f"✅ Lookup map: {len(lookup)} file(s), {len(written)} written"
+          + (f" ({SHARDS_REL}/, prefix {args.shard_prefix})" if args.shard_prefix > 0 else f" ({LOOKUP_REL})"))
+
+    if args.profile == "prod":
+        writer = DistWriter(root)
+        writer.emit_all([lex_path, out_report, *(root / rel for rel in lookup)])
+        writer.close()
+        print_report(writer.results, root=root)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Re-shard word_profiles and dict_letters by variable-length key prefix.
+
+First-letter shards are badly unbalanced (s.json ~1.4 MB, x.json ~17 KB).
+This splits each dataset by prefix until every shard is close to --target
+bytes and writes a small routing manifest; a client resolves a word to its
+shard by longest-prefix match and downloads only that shard. Sources are
+streamed twice (sizes, then entries) instead of being merged in memory.
+
+Output:
+  assets/data/shards/<dataset>/sNNNN.json
+  assets/data/shards/<dataset>/manifest.json
+
+Usage:
+  python scripts/shard_dictionary.py
+  python scripts/shard_dictionary.py --target 32768 --datasets word_profiles
+  python scripts/shard_dictionary.py --lookup serendipity
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from pipeline import write_text_if_changed
+from pipeline.jsonstream import iter_many
+from pipeline.shardplan import entry_size, plan_shards, route
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "assets/data"
+OUT_ROOT = DATA / "shards"
+
+# dataset -> (source dir, how keys are normalized before routing)
+DATASETS = {
+    "word_profiles": (DATA / "word_profiles", "lower"),
+    "dict_letters": (DATA / "dict_letters", "upper"),
+}
+
+
+def build(name: str, target: int) -> dict:
+    """Plan from streamed key sizes, then stream again and write each shard once complete."""
+    src, normalize = DATASETS[name]
+    sources = sorted(src.glob("*.json"))
+    shards, routes = plan_shards(((k, entry_size(k, v)) for k, v in iter_many(sources)), target)
+
+    out_dir = OUT_ROOT / name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    shard_of = {k: sh for sh in shards for k in sh.keys}
+    pending: dict[int, dict] = {}
+    done: dict[int, dict] = {}
+    written = 0
+    n_keys = 0
+    for k, v in iter_many(sources):
+        n_keys += 1
+        sh = shard_of[k]
+        buf = pending.setdefault(sh.index, {})
+        buf[k] = v
+        if len(buf) < len(sh.keys):
+            continue
+        del pending[sh.index]
+        text = json.dumps({key: buf[key] for key in sh.keys}, ensure_ascii=False, separators=(",", ":"))
+        written += write_text_if_changed(out_dir / f"{sh.name}.json", text)
+        done[sh.index] = {"file": f"{sh.name}.json", "bytes": len(text.encode("utf-8")), "keys": len(sh.keys)}
+    if pending:
+        raise SystemExit(f"❌ {name}: source changed while sharding ({len(pending)} shard(s) incomplete)")
+    meta = [done[sh.index] for sh in shards]
+    keep = {m["file"] for m in meta}
+    for stale in out_dir.glob("s*.json"):
+        if stale.name not in keep:
+            stale.unlink()
+
+    manifest = {
+        "version": 1,
+        "source": f"assets/data/{name}",
+        "normalize": normalize,
+        "target": target,
+        "maxPrefix": max((len(p) for p in routes), default=0),
+        "shards": meta,
+        "routes": routes,
+    }
+    write_text_if_changed(out_dir / "manifest.json",
+                          json.dumps(manifest, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    sizes = sorted(m["bytes"] for m in meta)
+    src_sizes = sorted(p.stat().st_size for p in src.glob("*.json"))
+    man_size = (out_dir / "manifest.json").stat().st_size
+    print(f"{name}: {n_keys:,} keys -> {len(meta)} shards ({written} changed)")
+    print(f"  shard bytes  min {sizes[0]:,}  median {sizes[len(sizes) // 2]:,}  max {sizes[-1]:,}")
+    print(f"  before       max {src_sizes[-1]:,} (first-letter shards)")
+    print(f"  manifest     {man_size:,} bytes, {len(routes)} routes, max prefix {manifest['maxPrefix']}")
+    oversize = [m["file"] for m in meta if m["bytes"] > target]
+    if oversize:
+        print(f"  ⚠️  {len(oversize)} shard(s) over target (single prefix that cannot be split): {', '.join(oversize[:5])}")
+    return manifest
+
+
+def lookup(word: str) -> int:
+    found = False
+    for name, (_, normalize) in DATASETS.items():
+        out_dir = OUT_ROOT / name
+        man_path = out_dir / "manifest.json"
+        if not man_path.exists():
+            print(f"{name}: not built")
+            continue
+        manifest = json.loads(man_path.read_text(encoding="utf-8"))
+        key = word.strip().lower() if normalize == "lower" else word.strip().upper()
+        idx = route(manifest["routes"], key, manifest["maxPrefix"])
+        if idx is None:
+            print(f"{name}: no route for {key!r}")
+            continue
+        shard = manifest["shards"][idx]
+        entry = json.loads((out_dir / shard["file"]).read_text(encoding="utf-8")).get(key)
+        found = found or entry is not None
+        print(f"{name}: {key!r} -> {shard['file']} ({shard['bytes']:,} bytes): "
+              f"{'found' if entry is not None else 'not found'}")
+    return 0 if found else 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--target", type=int, default=64 * 1024, help="target shard size in bytes (default: 65536)")
+    ap.add_argument("--datasets", default=",".join(DATASETS), help=f"comma-separated subset of: {','.join(DATASETS)}")
+    ap.add_argument("--lookup", default="", help="resolve one word through the built manifests and exit")
+    args = ap.parse_args()
+
+    if args.lookup:
+        return lookup(args.lookup)
+
+    names = [n.strip() for n in args.datasets.split(",") if n.strip()]
+    unknown = [n for n in names if n not in DATASETS]
+    if unknown:
+        raise SystemExit(f"❌ Unknown dataset(s): {', '.join(unknown)}")
+    for name in names:
+        build(name, args.target)
+    print("✅ Shards written to", OUT_ROOT.relative_to(ROOT))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -68,7 +68,7 @@ def main() -> None:
       page.goto(url, wait_until="networkidle", timeout=60000)
 
       # required sections (some are conditional by data, but in this project they should exist)
-      required_ids = ["sec-simple","sec-advanced","sec-practice","sec-vocab-bilingual"]
+      required_ids = ["sec-levels","sec-practice","sec-vocab"]
       for rid in required_ids:
         el = page.query_selector(f"#{rid}")
         if el is None:
@@ -6,10 +6,9 @@ JS="$ROOT/js/lesson.js"
 
 echo "Smoke test: checking required section IDs and TOEFL renderer..."
 
-grep -q "sec-simple" "$JS"
-grep -q "sec-advanced" "$JS"
+grep -q "sec-levels" "$JS"  # Simple/Intermediate/Advanced tabs
 grep -q "sec-practice" "$JS" || true  # practice may be conditionally rendered
 grep -q "renderToeflSection(article, tocSections, data.toefl)" "$JS"
-grep -q "sec-vocab-bilingual" "$JS"
+grep -q "sec-vocab" "$JS"
 
-echo "OK: lesson.js includes Simple/Advanced and TOEFL render hook."
+echo "OK: lesson.js includes the level tabs, vocabulary and TOEFL render hook."
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Split every registry lesson into a first-paint core file plus section files.
+
+Output:
+  assets/data/lessons_split/<id>/core.json
+  assets/data/lessons_split/<id>/{scene,vocab,descriptions,grammar,practice,toefl}.json
+  assets/data/lessons_split/manifest.json
+
+Usage:
+  python scripts/split_lessons.py
+  python scripts/split_lessons.py --check    # verify the split output matches lessons + registry
+
+Exit code 1 if a registry lesson cannot be split or --check finds stale output.
+"""
+from __future__ import annotations
+
+import argparse
+
+from pipeline import load_corpus
+from pipeline.split import SPLIT_REL, SplitResult, check_split, split_corpus
+
+
+def print_summary(res: SplitResult) -> None:
+    if res.lessons:
+        avg_src = res.source_bytes / res.lessons
+        avg_core = res.core_bytes / res.lessons
+        print(f"Lessons split: {res.lessons} ({res.written} file(s) changed)")
+        print(f"First paint: {avg_core / 1024:.1f} KB core vs {avg_src / 1024:.1f} KB full lesson "
+              f"(-{1 - avg_core / avg_src:.0%})")
+    for lid in res.removed:
+        print(f"🗑️  Removed {SPLIT_REL}/{lid}/ (not in registry)")
+    for p in res.problems:
+        print(f"❌ {p}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--check", action="store_true", help="only verify the existing split output")
+    args = ap.parse_args()
+
+    corpus = load_corpus()
+    if args.check:
+        problems = check_split(corpus)
+        for p in problems:
+            print(f"❌ {p}")
+        if not problems:
+            print(f"✅ {SPLIT_REL} is in sync with the lessons and registry")
+        return 1 if problems else 0
+
+    res = split_corpus(corpus)
+    print_summary(res)
+    return 1 if res.problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
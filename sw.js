@@ -2,92 +2,69 @@
    - Scope-aware paths so it works on subdirectory hosting (e.g. GitHub Pages)
 */
 
-const CACHE_VERSION = '6.27.7';
-const CACHE_NAME = `toefl-academic-${CACHE_VERSION}`;
-
 // Resolve base path (scope) for subdirectory hosting
 const SCOPE_URL = new URL(self.registration.scope);
 const BASE_PATH = SCOPE_URL.pathname.replace(/\/$/, ''); // e.g. "" or "/myapp"
 
 const withBase = (path) => `${BASE_PATH}/${path.replace(/^\//,'')}`;
 
-// Assets that are essential for the app shell. Cached during install.
-const CORE_ASSETS = [
-  withBase('index.html'),
-  withBase('dictionary.html'),
-  withBase('lesson.html'),
-  withBase('grammar.html'),
-  withBase('exercise.html'),
-  withBase('word.html'),
-  withBase('collocation.html'),
-  withBase('about.html'),
-  withBase('settings.html'),
-  withBase('offline.html'),
-  withBase('manifest.json'),
-  withBase('css/base.css'),
-  withBase('css/components.css'),
-  withBase('css/custom.css'),
-  withBase('css/theme-pro.css'),
-  withBase('css/luxe.css'),
-  withBase('css/theme-nebula.css'),
-  withBase('css/patch-v6.css'),
-  withBase('css/patch-v19.css'),
-  withBase('css/patch-v21.css'),
-  withBase('css/patch-v23.css'),
-  withBase('css/patch-v28.css'),
-  withBase('css/patch-v29.css'),
-  withBase('css/patch-v30.css'),
-  withBase('css/patch-v31.css'),
-  withBase('css/patch-v32.css'),
-  withBase('css/patch-v33.css'),
-  withBase('css/patch-v35.css'),
-  withBase('css/slider-pro.css'),
-  withBase('js/main.js'),
-  withBase('js/dictionary.js'),
-  withBase('js/offline.js'),
-  withBase('js/lesson.js'),
-  withBase('js/tts.js'),
-  withBase('js/grammar.js'),
-  withBase('js/exercise.js'),
-  withBase('js/speaking.js'),
-  withBase('js/theme.js'),
-  withBase('js/image-loader.js'),
-  withBase('js/bilingual.js'),
-  withBase('js/word.js'),
-  withBase('js/collocation.js'),
-  withBase('assets/data/registry.json'),
-  withBase('assets/data/lexicon.json'),
-  withBase('assets/data/lexicon_updated.json'),
-  withBase('assets/data/word_context_index.json'),
-  withBase('assets/data/dict_en_subset.json'),
-  withBase('assets/data/collocations_index.json'),
-  withBase('assets/images/placeholders.json'),
-  withBase('assets/icons/icon-192.png'),
-  withBase('assets/icons/icon-512.png'),
-];
+// App shell + core data with content revisions, generated by
+// scripts/gen_precache.py. A change there changes this worker's imported
+// bytes, so the browser installs the new worker, which re-fetches only the
+// entries whose revision changed.
+importScripts('precache-manifest.js');
+const PRECACHE = self.__PRECACHE || { version: 'none', entries: [] };
+
+const PRECACHE_NAME = 'toefl-academic-precache';
+const RUNTIME_NAME = 'toefl-academic-runtime';
+const REVISIONS_URL = withBase('__precache-revisions.json');
+const PRECACHED = new Set(PRECACHE.entries.map((e) => withBase(e.url)));
+
+async function readRevisions(cache) {
+  try {
+    const res = await cache.match(REVISIONS_URL);
+    return res ? await res.json() : {};
+  } catch {
+    return {};
+  }
+}
 
 self.addEventListener('install', (event) => {
-  event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => cache.addAll(CORE_ASSETS.map((u) => new Request(u, { cache: 'reload' }))))
-      .then(() => self.skipWaiting())
-  );
+  event.waitUntil((async () => {
+    const cache = await caches.open(PRECACHE_NAME);
+    const old = await readRevisions(cache);
+    const revisions = {};
+    const stale = [];
+    for (const e of PRECACHE.entries) {
+      const url = withBase(e.url);
+      revisions[url] = e.revision;
+      if (old[url] !== e.revision || !(await cache.match(url))) stale.push(url);
+    }
+    await cache.addAll(stale.map((u) => new Request(u, { cache: 'reload' })));
+    await cache.put(REVISIONS_URL, new Response(JSON.stringify(revisions), {
+      headers: { 'Content-Type': 'application/json' },
+    }));
+    await self.skipWaiting();
+  })());
 });
 
 self.addEventListener('activate', (event) => {
-  event.waitUntil(
-    caches.keys()
-      .then((keys) =>
-        Promise.all(
-          keys.map((key) => {
-            if (key.startsWith('toefl-academic-') && key !== CACHE_NAME) {
-              return caches.delete(key);
-            }
-          })
-        )
-      )
-      .then(() => self.clients.claim())
-  );
+  event.waitUntil((async () => {
+    // drop caches of older worker versions and entries no longer precached
+    const keys = await caches.keys();
+    await Promise.all(keys
+      .filter((key) => key.startsWith('toefl-academic-') && key !== PRECACHE_NAME && key !== RUNTIME_NAME)
+      .map((key) => caches.delete(key)));
+    const cache = await caches.open(PRECACHE_NAME);
+    const requests = await cache.keys();
+    await Promise.all(requests
+      .filter((req) => {
+        const path = new URL(req.url).pathname;
+        return path !== REVISIONS_URL && !PRECACHED.has(path);
+      })
+      .map((req) => cache.delete(req)));
+    await self.clients.claim();
+  })());
 });
 
 self.addEventListener('fetch', (event) => {
@@ -101,14 +78,25 @@ self.addEventListener('fetch', (event) => {
 
   const isUnder = (pfx) => path.startsWith(`${BASE_PATH}/${pfx.replace(/^\//,'')}`);
 
+  // Precached files: served from the precache, refreshed only by revision
+  if (PRECACHED.has(path) && req.mode !== 'navigate') {
+    event.respondWith((async () => {
+      const cache = await caches.open(PRECACHE_NAME);
+      const cached = await cache.match(path);
+      return cached || fetch(req);
+    })());
+    return;
+  }
+
   // Data files: stale-while-revalidate
   if (isUnder('assets/data/')) {
     event.respondWith((async () => {
-      const cache = await caches.open(CACHE_NAME);
+      const cache = await caches.open(RUNTIME_NAME);
       const cached = await cache.match(req);
       const fetchPromise = fetch(req)
         .then((res) => {
-          cache.put(req, res.clone());
+          // never cache a 404 (e.g. probing for an optional sharded layout)
+          if (res.ok) cache.put(req, res.clone());
           return res;
         })
         .catch(() => cached);
@@ -121,7 +109,7 @@ self.addEventListener('fetch', (event) => {
   // Images: cache-first
   if (isUnder('assets/images/') || isUnder('assets/icons/')) {
     event.respondWith((async () => {
-      const cache = await caches.open(CACHE_NAME);
+      const cache = await caches.open(RUNTIME_NAME);
       const cached = await cache.match(req);
       if (cached) return cached;
 
@@ -141,7 +129,7 @@ self.addEventListener('fetch', (event) => {
     event.respondWith((async () => {
       try {
         const res = await fetch(req);
-        const cache = await caches.open(CACHE_NAME);
+        const cache = await caches.open(RUNTIME_NAME);
         cache.put(req, res.clone());
         return res;
       } catch {